@@ -0,0 +1,319 @@
+"""
+This file benchmarks the documentation generator (docs.py) on the snapshots of the controllers as well as on
+synthetic controllers with thousands of methods, including pathological ones. The results are compared against a
+stored baseline so that regressions in the hot path of the generator show up before they show up as a slow publish.
+
+The snapshots are the controllers of FinanceToolkit 2.2.3. When they are replaced with --update-snapshots (at a
+pinned --ref), store a new baseline with --save-baseline as well.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docs  # noqa: E402
+
+SNAPSHOT_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "snapshots"
+)
+BASELINE_LOCATION = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+SYNTHETIC_DOCSTRING = '''
+        """
+        Calculate the synthetic metric {index}, a metric that does not exist and is only
+        used to measure the documentation generator. See https://www.jeroenbouma.com.
+
+        The formula is as follows:
+
+        - Synthetic Metric = Numerator — Denominator
+
+        Args:
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | str, optional): The lag to use for the growth calculation. Defaults to 1.
+
+        Returns:
+            pd.DataFrame: Synthetic metric values.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AAPL", "TSLA"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        toolkit.synthetic.get_synthetic_metric_{index}()
+        ```
+
+        Which returns:
+
+{table}
+        """'''
+
+
+def create_synthetic_controller(
+    methods: int,
+    with_docstrings: bool = True,
+    table_rows: int = 12,
+    table_columns: int = 3,
+) -> str:
+    """
+    Create the source of a controller with the given number of methods. Without docstrings the methods are all
+    skipped by the extractor, with many table rows and columns the example results become very long.
+    """
+    table = [
+        "        | Date | "
+        + " | ".join(f"T{column}" for column in range(table_columns))
+        + " |",
+        "        |:-----|" + "-----:|" * table_columns,
+    ]
+    table.extend(
+        f"        | {2000 + row} | "
+        + " | ".join(f"{row * column / 7:.4f}" for column in range(table_columns))
+        + " |"
+        for row in range(table_rows)
+    )
+
+    lines = ["class SyntheticController:"]
+
+    for index in range(methods):
+        lines.append(
+            f"    def get_synthetic_metric_{index}(self, rounding: int = 4, growth: bool = False):"
+        )
+
+        if with_docstrings:
+            lines.append(
+                SYNTHETIC_DOCSTRING.format(index=index, table="\n".join(table))
+            )
+
+        lines.append("        return rounding\n")
+
+    return "\n".join(lines)
+
+
+def load_corpora(sizes: list[int]) -> dict[str, str]:
+    corpora = {}
+
+    file_names = (
+        os.listdir(SNAPSHOT_DIRECTORY) if os.path.isdir(SNAPSHOT_DIRECTORY) else []
+    )
+
+    for file_name in sorted(file_names):
+        if not file_name.endswith(".py"):
+            continue
+
+        with open(
+            os.path.join(SNAPSHOT_DIRECTORY, file_name), encoding="utf-8"
+        ) as file:
+            corpora[f"snapshot/{file_name.removesuffix('.py')}"] = file.read()
+
+    for size in sizes:
+        corpora[f"synthetic/{size}"] = create_synthetic_controller(size)
+        corpora[f"synthetic/{size}/no-docstrings"] = create_synthetic_controller(
+            size, with_docstrings=False
+        )
+
+    # Every example result is a table of about 50 KB, so the size is kept fixed
+    corpora["synthetic/long-tables"] = create_synthetic_controller(
+        200, table_rows=500, table_columns=12
+    )
+
+    return corpora
+
+
+def best_of(repeat: int, function) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def measure(source: str, repeat: int = 3) -> dict:
+    """
+    Measure the extraction, parsing, rendering and writing stages separately (best of the repeats) together
+    with the peak memory of a complete run and the size of the output.
+    """
+    functions = list(docs.parse_functions(source))
+
+    with tempfile.TemporaryDirectory() as directory:
+        location = os.path.join(directory, "output.md")
+
+        extraction = best_of(repeat, lambda: list(docs.extract_docstrings(source)))
+        parsing = best_of(repeat, lambda: list(docs.parse_functions(source)))
+        rendering = best_of(
+            repeat, lambda: sum(map(len, docs.MarkdownRenderer("").render(functions)))
+        )
+        total = best_of(
+            repeat,
+            lambda: (
+                os.path.exists(location) and os.remove(location),
+                docs.create_markdown_file(source, "", location),
+            ),
+        )
+
+        os.remove(location)
+        tracemalloc.start()
+        docs.create_markdown_file(source, "", location)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        output_size = os.path.getsize(location)
+
+    return {
+        "functions": len(functions),
+        "input_size": len(source.encode("utf-8")),
+        "output_size": output_size,
+        "extraction": extraction,
+        "parsing": parsing,
+        "rendering": rendering,
+        "writing": max(total - parsing - rendering, 0),
+        "total": total,
+        "throughput": len(source.encode("utf-8")) / total if total else 0,
+        "peak_memory": peak_memory,
+    }
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerance: float,
+    minimum: float = 0.001,
+) -> list[str]:
+    """
+    Return a line for every stage that became slower (or used more memory) than the tolerance allows. A stage
+    also has to become slower by at least the minimum (in seconds) as the timings of the smallest corpora are
+    mostly noise.
+    """
+    regressions = []
+
+    for corpus, result in results.items():
+        if corpus not in baseline:
+            continue
+
+        for metric in ["extraction", "parsing", "rendering", "total", "peak_memory"]:
+            previous, current = baseline[corpus][metric], result[metric]
+
+            if metric != "peak_memory" and current - previous < minimum:
+                continue
+
+            if previous and current > previous * (1 + tolerance):
+                regressions.append(
+                    f"{corpus} {metric}: {current:.4g} compared to {previous:.4g} "
+                    f"(+{(current / previous - 1) * 100:.0f}%)"
+                )
+
+    return regressions
+
+
+def update_snapshots(source: docs.SourceBackend):
+    file_contents = source.read_files([page.path for page in docs.PAGES])
+    os.makedirs(SNAPSHOT_DIRECTORY, exist_ok=True)
+
+    for path, file_content in file_contents.items():
+        docs.write_file_if_changed(
+            os.path.join(SNAPSHOT_DIRECTORY, os.path.basename(path)), file_content
+        )
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the documentation generator."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[1000, 10000],
+        help="Comma separated number of methods of the synthetic controllers (e.g. 1000,10000,50000).",
+    )
+    parser.add_argument(
+        "--only", help="Only run the corpora whose name contains this text."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown before reporting.",
+    )
+    parser.add_argument(
+        "--minimum",
+        type=float,
+        default=0.001,
+        help="Allowed slowdown in seconds before reporting, regardless of the tolerance.",
+    )
+    parser.add_argument("--baseline", default=BASELINE_LOCATION)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline.",
+    )
+    parser.add_argument(
+        "--update-snapshots",
+        action="store_true",
+        help="Replace the snapshots with the controllers from the source (see docs.py for the options).",
+    )
+    parser.add_argument(
+        "--source", choices=["github", "archive", "local"], default="github"
+    )
+    parser.add_argument("--location")
+    parser.add_argument("--ref")
+    args = parser.parse_args(argv)
+
+    if args.update_snapshots:
+        update_snapshots(docs.create_source(args.source, args.location, args.ref))
+
+    corpora = load_corpora(args.sizes)
+    results = {}
+
+    print(
+        f"{'corpus':<40}{'functions':>10}{'input KB':>10}{'output KB':>10}{'parse s':>10}{'render s':>10}"
+        f"{'total s':>10}{'MB/s':>8}{'peak MB':>9}"
+    )
+
+    for corpus, source in corpora.items():
+        if args.only and args.only not in corpus:
+            continue
+
+        result = results[corpus] = measure(source, args.repeat)
+
+        print(
+            f"{corpus:<40}{result['functions']:>10}{result['input_size'] / 1024:>10.0f}"
+            f"{result['output_size'] / 1024:>10.0f}{result['parsing']:>10.4f}{result['rendering']:>10.4f}"
+            f"{result['total']:>10.4f}{result['throughput'] / 1024 / 1024:>8.1f}"
+            f"{result['peak_memory'] / 1024 / 1024:>9.1f}"
+        )
+
+    try:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    except (OSError, ValueError):
+        baseline = {}
+
+    regressions = compare(results, baseline, args.tolerance, args.minimum)
+
+    for regression in regressions:
+        print(f"Regression: {regression}")
+
+    if args.save_baseline:
+        docs.write_file_if_changed(
+            args.baseline,
+            json.dumps({**baseline, **results}, indent=4, sort_keys=True) + "\n",
+        )
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
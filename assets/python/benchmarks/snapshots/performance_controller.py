@@ -0,0 +1,4745 @@
+"""Performance Module"""
+
+__docformat__ = "google"
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from financetoolkit.helpers import handle_portfolio
+from financetoolkit.performance import performance_model
+from financetoolkit.performance.helpers import (
+    determine_within_dataset,
+    determine_within_historical_data,
+)
+from financetoolkit.risk.risk_model import (
+    get_kurtosis,
+    get_max_drawdown,
+    get_rolling_kurtosis,
+    get_rolling_skewness,
+    get_skewness,
+    get_ui,
+    get_volatility,
+)
+from financetoolkit.utilities.dataframe_model import filter_columns
+from financetoolkit.utilities.error_model import handle_errors
+from financetoolkit.utilities.logger_model import get_logger
+from financetoolkit.utilities.statistics_model import (
+    PERIOD_TRANSLATION,
+    PERIODS_PER_YEAR,
+    apply_rounding,
+    convert_annualized_rate_to_period,
+    finalize_dataset,
+    to_multi_index,
+)
+
+# Division by zero is normal in these calculations, not a bug.
+warnings.filterwarnings("ignore", category=RuntimeWarning)
+
+# pylint: disable=too-many-instance-attributes,too-few-public-methods,too-many-lines,too-many-locals
+# The examples' output tables are wider than the line length.
+# ruff: noqa: E501
+
+logger = get_logger()
+
+
+class Performance:
+    """
+    The Performance module is meant to calculate important performance metrics such
+    as Sharpe Ratio, Sortino Ratio, Treynor Ratio, Information Ratio, Jensen’s
+    Alpha, Beta, Capital Asset Pricing Model, R-Squared and more.
+    """
+
+    def __init__(
+        self,
+        tickers: str | list[str],
+        historical_data: dict[str, pd.DataFrame],
+        risk_free_rate_data: dict[str, pd.Series],
+        quarterly: bool | None = None,
+        rounding: int | None = 4,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        intraday_period: str | None = None,
+        progress_bar: bool = True,
+    ):
+        """
+        Initializes the Performance Controller Class.
+
+        Args:
+            tickers (str | list[str]): The tickers to use for the calculations.
+            historical_data (dict[str, pd.DataFrame]): The historical data to use for the calculations.
+            risk_free_rate_data (dict[str, pd.Series]): The annualized risk free rate per period frequency.
+            quarterly (bool | None, optional): Whether to use quarterly data. Defaults to None.
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+            start_date (str | None, optional): The start date to use for the calculations. Defaults to None.
+            end_date (str | None, optional): The end date to use for the calculations. Defaults to None.
+            intraday_period (str | None, optional): The intraday period used for within-period calculations.
+                Defaults to None.
+            progress_bar (bool, optional): Whether to show a progress bar. Defaults to True.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_capital_asset_pricing_model(period='quarterly')
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2021Q2 |  0.1157 |  0.1366 |
+        | 2021Q3 |  0.0064 |  0.0053 |
+        | 2021Q4 |  0.1214 |  0.1869 |
+        | 2022Q1 | -0.0577 | -0.1017 |
+        | 2022Q2 | -0.2135 | -0.3321 |
+        | 2022Q3 | -0.0597 | -0.0828 |
+        | 2022Q4 |  0.1059 |  0.0998 |
+        | 2023Q1 |  0.0831 |  0.152  |
+        | 2023Q2 |  0.1032 |  0.1756 |
+        | 2023Q3 | -0.0416 | -0.1029 |
+        | 2023Q4 |  0.102  |  0.2474 |
+        | 2024Q1 |  0.1038 |  0.1406 |
+        | 2024Q2 |  0.0525 |  0.0589 |
+        | 2024Q3 |  0.0571 |  0.1525 |
+        | 2024Q4 |  0.0217 |  0.0516 |
+        | 2025Q1 | -0.0386 | -0.1499 |
+        | 2025Q2 |  0.1473 |  0.2038 |
+        | 2025Q3 |  0.1031 |  0.1768 |
+        | 2025Q4 |  0.0236 |  0.0495 |
+        """
+        self._tickers = tickers
+        self._tickers_without_portfolio = [
+            ticker for ticker in tickers if ticker != "Portfolio"
+        ]
+        self._benchmark_name = "Benchmark"
+        self._quarterly: bool | None = quarterly
+        self._rounding: int | None = rounding
+        self._start_date: str | None = start_date
+        self._end_date: str | None = end_date
+        self._progress_bar: bool = progress_bar
+        self._portfolio_weights: dict | None = None
+
+        # Historical Data
+        self._historical_data = historical_data
+        # The risk free rate is quoted as an annualized yield, so it is converted to the matching frequency. Without this, a daily return would have a full year of risk free rate subtracted from it.  # noqa: E501
+        self._risk_free_rate_data: dict[str, pd.Series] = {}
+        for frequency, rate in risk_free_rate_data.items():
+            period_rate = convert_annualized_rate_to_period(rate, frequency)
+            # The conversion is also typed for scalars; a Series in gives a Series out.
+            if not isinstance(period_rate, pd.Series):
+                raise TypeError(f"Expected a risk free rate series for {frequency}.")
+            self._risk_free_rate_data[frequency] = period_rate
+
+        # Fama and French
+        self._fama_and_french_dataset: pd.DataFrame = pd.DataFrame()
+        self._fama_and_french_model: pd.DataFrame = pd.DataFrame()
+        self._fama_and_french_residuals: pd.DataFrame = pd.DataFrame()
+        self._carhart_four_factor_model: pd.DataFrame = pd.DataFrame()
+        self._factor_asset_correlations: pd.DataFrame = pd.DataFrame()
+        self._factor_correlations: pd.DataFrame = pd.DataFrame()
+
+        # Within Period Calculations
+        daily_historical_data = self._historical_data["daily"].copy()
+
+        excess_return = performance_model.get_excess_return(
+            daily_historical_data["Return"], self._risk_free_rate_data["daily"]
+        )
+        excess_return.columns = pd.MultiIndex.from_product(
+            [["Excess Return"], excess_return.columns]
+        )
+        daily_historical_data = pd.concat(
+            [daily_historical_data, excess_return], axis=1
+        )
+
+        intraday_historical_data = self._historical_data["intraday"].copy()
+
+        daily_historical_data.index = pd.DatetimeIndex(
+            daily_historical_data.to_timestamp().index
+        )
+
+        if not self._historical_data["intraday"].empty:
+            intraday_historical_data.index = pd.DatetimeIndex(
+                intraday_historical_data.to_timestamp().index
+            )
+
+        self._within_historical_data = determine_within_historical_data(
+            daily_historical_data=daily_historical_data,
+            intraday_historical_data=intraday_historical_data,
+            intraday_period=intraday_period,
+        )
+
+        # Memo for the column slices handed to the calculations, keyed by (period,
+        # column, within_period, benchmark): nearly every metric starts from the same
+        # few slices and the MCP server collects many metrics per session. Neither
+        # frame is mutated after this point and callers treat the slices as read-only.
+        self._data_cache: dict[
+            tuple[str, str, bool, bool], pd.DataFrame | pd.Series
+        ] = {}
+
+    def _get_within_historical_data(self, period: str) -> pd.DataFrame:
+        """
+        The within-period historical data for `period`, with the one impossible
+        combination turned into a clear error: a single day only nests observations
+        when intraday data was fetched, so without it the daily entry does not exist
+        and a plain lookup would surface as an unhelpful KeyError. Guarding at the
+        access point (rather than per method) keeps the rolling code paths, which
+        read the regular historical data, free to use period="daily".
+        """
+        if period == "daily" and self._historical_data["intraday"].empty:
+            raise ValueError(
+                "Intraday data is required for within-period daily calculations. "
+                "Initialise the Toolkit with an intraday_period to use period='daily' here."
+            )
+
+        return self._within_historical_data[period]
+
+    def _get_column(
+        self, period: str, column: str, within_period: bool, benchmark: bool = False
+    ) -> pd.DataFrame | pd.Series:
+        """
+        The `column` slice for the tickers (a DataFrame) or the benchmark (a Series),
+        memoized per (period, column, within_period, benchmark) pair -- see
+        `_data_cache` in `__init__`. Within-period lookups go through
+        `_get_within_historical_data` so the daily-without-intraday error still
+        surfaces from the call site that asked for it.
+        """
+        key = (period, column, within_period, benchmark)
+
+        if key not in self._data_cache:
+            frame = (
+                self._get_within_historical_data(period)
+                if within_period
+                else self._historical_data[period]
+            )
+            self._data_cache[key] = frame.loc[:, column][
+                self._benchmark_name if benchmark else self._tickers_without_portfolio
+            ]
+
+        return self._data_cache[key]
+
+    @handle_errors
+    def collect_all_metrics(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculates and collects all performance metrics.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the
+                Toolkit is initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Performance metrics calculated based on the specified parameters, with a
+            Multi Index of (metric, ticker) as the columns. For a single-ticker Toolkit the ticker
+            level is dropped. `Returns` and `Excess Return` are only included when `period` is not
+            "daily".
+
+        Notes:
+        - The method calculates various performance metrics for each asset in the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values
+          using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.collect_all_metrics().xs("AAPL", level=1, axis=1)
+        ```
+
+        Which returns:
+
+        |      |   Win Rate |   Upside Capture Ratio |   Downside Capture Ratio |   M2 Ratio |   Tracking Error |
+        |:-----|-----------:|-----------------------:|-------------------------:|-----------:|-----------------:|
+        | 2022 |     0.4781 |                 1.3094 |                   1.3191 |    -0.1669 |           0.0115 |
+        | 2023 |     0.58   |                 1.1825 |                   0.9646 |     0.3292 |           0.009  |
+        | 2024 |     0.5    |                 1.1178 |                   1.0487 |     0.1906 |           0.0121 |
+        | 2025 |     0.472  |                 1.0324 |                   1.0986 |     0.0709 |           0.0139 |
+        | 2021 |     0.4921 |                 1.3819 |                   1.422  |   nan      |           0.0118 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        rounding = rounding if rounding is not None else self._rounding
+
+        performance_metrics = {
+            "Alpha": self.get_alpha(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Beta": self.get_beta(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "CAPM": self.get_capital_asset_pricing_model(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Jensen's Alpha": self.get_jensens_alpha(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Treynor Ratio": self.get_treynor_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Sharpe Ratio": self.get_sharpe_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Sortino Ratio": self.get_sortino_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Ulcer Performance Index": self.get_ulcer_performance_index(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Calmar Ratio": self.get_calmar_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Sterling Ratio": self.get_sterling_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Burke Ratio": self.get_burke_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Omega Ratio": self.get_omega_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Kappa Ratio": self.get_kappa_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Gain to Pain Ratio": self.get_gain_to_pain_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Win Rate": self.get_win_rate(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Upside Capture Ratio": self.get_upside_capture_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Downside Capture Ratio": self.get_downside_capture_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "M2 Ratio": self.get_m2_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Tracking Error": self.get_tracking_error(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Information Ratio": self.get_information_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Appraisal Ratio": self.get_appraisal_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "STARR Ratio": self.get_starr_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+            "Rachev Ratio": self.get_rachev_ratio(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            ),
+        }
+
+        if period != "daily":
+            performance_metrics["Returns"] = self.get_returns(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            )
+            performance_metrics["Excess Return"] = self.get_excess_return(
+                period=period,
+                rounding=rounding,
+                growth=growth,
+                lag=lag,
+                standardize=standardize,
+            )
+
+        performance_metrics = pd.concat(performance_metrics, axis=1)
+
+        if len(self._tickers) == 1:
+            performance_metrics = performance_metrics.xs(
+                self._tickers[0], level=1, axis=1
+            )
+
+        return performance_metrics
+
+    @handle_portfolio
+    @handle_errors
+    def get_beta(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Beta, a measurement that assess the systematic risk of a stock or investment.
+
+        Beta is a financial metric used to assess the systematic risk of a stock or investment in
+        relation to the overall market. It provides valuable insights into how a particular asset's
+        returns tend to move in response to fluctuations in the broader market. A stock's Beta is
+        calculated by analyzing its historical price movements and their correlation with the
+        movements of a market index, typically the benchmark index like the S&P 500.
+
+        The formula is as follows:
+
+            - Beta = Covariance of Asset Returns and Benchmark Returns / Variance of Benchmark Returns
+
+        For a given period, for example monthly, this translates into the following:
+
+            - Beta = Monthly Covariance of Asset Returns and Benchmark Returns
+            / Monthly Variance of Benchmark Returns
+
+        See definition: https://en.wikipedia.org/wiki/Beta_(finance)
+
+        Also known as: market sensitivity, systematic risk.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling period to use for the calculation. If you select
+            period = 'monthly' and set rolling to 12 you obtain the rolling 12-month Sharpe Ratio.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Beta values.
+
+        Notes:
+        - Daily Beta is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the Beta for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "AMZN"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_beta()
+        ```
+
+        Which returns:
+
+        | Date   |   AAPL |   AMZN |
+        |:-------|-------:|-------:|
+        | 2021   | 1.3203 | 1.0432 |
+        | 2022   | 1.3026 | 1.6343 |
+        | 2023   | 1.1148 | 1.5303 |
+        | 2024   | 0.9688 | 1.5491 |
+        | 2025   | 1.2546 | 1.3254 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=not rolling)
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=not rolling, benchmark=True
+        )
+
+        if rolling:
+            beta = performance_model.get_rolling_beta(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            beta = performance_model.get_beta(returns, benchmark_returns)
+
+        return finalize_dataset(
+            dataset=beta,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_capital_asset_pricing_model(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        CAPM, or the Capital Asset Pricing Model, is a financial model used to estimate the expected return
+        on an investment, such as a stock or portfolio of stocks. It provides a framework for evaluating the
+        risk and return trade-off of an asset or portfolio in relation to the overall market. CAPM is based
+        on the following key components:
+
+            - Risk-Free Rate (Rf): This is the theoretical return an investor could earn from an investment
+            with no risk of financial loss. It is typically based on the yield of a government bond.
+            - Market Risk Premium (Rm - Rf): This represents the additional return that investors expect
+            to earn for taking on the risk of investing in the overall market as opposed to a risk-free asset.
+            It is calculated as the difference between the expected return of the market (Rm) and the risk-free
+            rate (Rf).
+            - Beta (β): Beta is a measure of an asset's or portfolio's sensitivity to market movements. It
+            quantifies how much an asset's returns are expected to move in relation to changes in the
+            overall market. A beta of 1 indicates that the asset moves in line with the market, while a
+            beta greater than 1 suggests higher volatility, and a beta less than 1 indicates lower volatility.
+
+        The Capital Asset Pricing Model (CAPM) is a widely used financial model that helps in
+        determining the expected return of an asset or portfolio based on its systematic risk and
+        the prevailing risk-free rate in the market. CAPM provides insights into how an asset or
+        investment should be priced in order to offer an appropriate rate of return, given its
+        level of risk compared to the overall market.
+
+        The formula is as follows:
+
+        - Capital Asset Pricing Model = Risk Free Rate + Beta * (Benchmark Returns — Risk Free Rate)
+
+        See definition: https://en.wikipedia.org/wiki/Capital_asset_pricing_model
+
+        Also known as: CAPM, expected return model.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the Beta component of the
+            calculation. If set, Beta is estimated over a rolling window of this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: CAPM values.
+
+        Notes:
+        - Daily CAPM is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the CAPM for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_capital_asset_pricing_model()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.2485 | -0.345  |
+        | 2023   |  0.2874 |  0.5403 |
+        | 2024   |  0.2425 |  0.5291 |
+        | 2025   |  0.2117 |  0.3446 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            beta = performance_model.get_rolling_beta(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            beta = performance_model.get_beta(returns, benchmark_returns)
+
+        risk_free_rate = self._risk_free_rate_data[period]
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=False, benchmark=True
+        )
+
+        capm = performance_model.get_capital_asset_pricing_model(
+            risk_free_rate, beta, benchmark_returns
+        )
+
+        return finalize_dataset(
+            dataset=capm,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_errors
+    def get_factor_asset_correlations(
+        self,
+        period: str | None = None,
+        factors_to_calculate: list[str] | None = None,
+        rounding: int | None = None,
+        show_columns: list[str] | None = None,
+    ):
+        """
+        Calculates factor exposures for each asset.
+
+        The major difference between the Fama and French Model here is that the correlation
+        is taken as opposed to a Linear Regression in which the R-squared or Slope can be used to
+        understand the exposure to each factor.
+
+        For assessing the exposure or influence of a stock to external factors, it's often preferable
+        to use R-squared (R²) or Beta because it explicitly measures how well the factors explain the stock's
+        returns. A higher R² indicates that the stock's returns are more closely related to the factors,
+        and thus, the factors have a greater influence on the stock's performance.
+
+        However, since the results are closely related and tend to point into the same direction it could
+        be fine to use correlations as well depending on the level of accuracy required.
+
+        Also known as: factor exposure, asset correlations.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            factors_to_calculate (list of str, optional): List of factors to calculate scores and residuals for.
+                Defaults to ["Mkt-RF", "SMB", "HML", "RMW", "CMA"].
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            show_columns (list of str, optional): Restrict the result to these top level columns.
+                Defaults to None, which returns every column.
+
+        Returns:
+            pd.DataFrame: Factor Asset Correlations, with a Multi Index of (ticker, factor)
+            as the columns and one row per period.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_factor_asset_correlations()["AAPL"]
+        ```
+
+        Which returns:
+
+        |      |   Mkt-RF |     SMB |     HML |     RMW |     CMA |
+        |:-----|---------:|--------:|--------:|--------:|--------:|
+        | 2021 |   0.6661 | -0.0576 | -0.436  | -0.1188 | -0.0529 |
+        | 2022 |   0.8797 |  0.0565 | -0.5481 | -0.2579 | -0.4763 |
+        | 2023 |   0.6987 | -0.0083 | -0.2832 | -0.1014 | -0.4615 |
+        | 2024 |   0.5185 |  0.0353 | -0.3175 | -0.056  | -0.0849 |
+        | 2025 |   0.7407 |  0.0654 | -0.2097 | -0.1083 |  0.0753 |
+        """
+
+        factors_to_calculate = (
+            factors_to_calculate
+            if factors_to_calculate
+            else ["Mkt-RF", "SMB", "HML", "RMW", "CMA"]
+        )
+
+        for factor in factors_to_calculate:
+            if factor not in ["Mkt-RF", "SMB", "HML", "RMW", "CMA"]:
+                raise ValueError(
+                    f"Factor {factor} is not a valid factor. Please select from: Mkt-RF, SMB, HML, RMW, CMA."
+                )
+
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+
+        if self._fama_and_french_dataset.empty:
+            self._fama_and_french_dataset = (
+                performance_model.obtain_fama_and_french_dataset()
+            )
+
+        fama_and_french_period = determine_within_dataset(
+            dataset=self._fama_and_french_dataset, period=period, correlation=False
+        )
+
+        merged_df = fama_and_french_period.merge(
+            returns, left_index=True, right_index=True
+        )
+
+        factor_correlations: dict = {}
+
+        # The first index level repeats once per row, so it has to be de-duplicated before iterating or every period is recomputed once per day it contains.  # noqa: E501
+        dataset_periods = merged_df.index.get_level_values(0).unique()
+
+        logger.info("Calculating Factor Asset Correlations")
+        for ticker in self._tickers_without_portfolio:
+            factor_correlations[ticker] = {}
+            for dataset_period in dataset_periods:
+                factor_data = merged_df.loc[dataset_period][factors_to_calculate]
+                excess_returns = (
+                    merged_df.loc[dataset_period][ticker]
+                    - merged_df.loc[dataset_period]["RF"]
+                )
+
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    factor_correlations[ticker][dataset_period] = (
+                        performance_model.get_factor_asset_correlations(
+                            factors=factor_data, excess_return=excess_returns
+                        )
+                    )
+        factor_asset_correlations = pd.DataFrame.from_dict(
+            {
+                (ticker, dataset_period): value
+                for ticker, factor_scores_ticker in factor_correlations.items()
+                for dataset_period, value in factor_scores_ticker.items()
+            },
+        )
+
+        factor_order = factor_asset_correlations.index
+
+        factor_asset_correlations = (
+            factor_asset_correlations.stack(level=1, future_stack=True)
+            .unstack(level=0)
+            .reindex(factor_order, level=1, axis=1)
+            .reindex(self._tickers_without_portfolio, level=0, axis=1)
+        )
+
+        self._factor_asset_correlations = apply_rounding(
+            factor_asset_correlations,
+            rounding if rounding is not None else self._rounding,
+        ).loc[self._start_date : self._end_date]
+
+        return filter_columns(self._factor_asset_correlations, show_columns)
+
+    @handle_errors
+    def get_factor_correlations(
+        self,
+        period: str | None = None,
+        factors_to_calculate: list[str] | None = None,
+        exclude_risk_free: bool = True,
+        rounding: int | None = None,
+    ):
+        """
+        Calculates factor correlations between each factor. This is useful to understand how correlated
+        each factor is to each other. This is based off the Fama and French 5 Factor model which includes:
+
+            - Market Risk Premium (Mkt-RF): Represents the additional return that investors expect to earn for taking
+            on the risk of investing in the overall market as opposed to a risk-free asset.
+            - Size Premium (SMB): Reflects the historical excess return of small-cap stocks over large-cap stocks.
+            - Value Premium (HML): Captures the historical excess return of value stocks over growth stocks.
+            - Profitability (RMW): Measures the historical excess return of high profitability stocks over
+            low profitability stocks.
+            - Investment (CMA): Quantifies the historical excess return of low investment stocks over
+            high investment stocks.
+
+        Optionally, it is also possible to see the correlation between the risk-free rate and each factor.
+
+        Also known as: factor model correlations.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            factors_to_calculate (list of str, optional): List of factors to calculate scores and residuals for.
+                Defaults to ["Mkt-RF", "SMB", "HML", "RMW", "CMA"].
+            exclude_risk_free (bool, optional): Whether to exclude the risk-free rate from the results. Defaults to True.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+
+        Returns:
+            pd.DataFrame: Factor Correlations. One correlation matrix per period, stacked
+            into a Multi Index of (period, factor) rows with the factors as the columns and
+            restricted to the Toolkit's date range.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2023-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_factor_correlations()
+        ```
+
+        Which returns:
+
+        |                                     |   Mkt-RF |     SMB |     HML |     RMW |     CMA |
+        |:------------------------------------|---------:|--------:|--------:|--------:|--------:|
+        | (Period('2023', 'Y-DEC'), 'Mkt-RF') |   1      |  0.297  | -0.0436 | -0.327  | -0.4582 |
+        | (Period('2023', 'Y-DEC'), 'SMB')    |   0.297  |  1      |  0.4115 | -0.3984 |  0.0737 |
+        | (Period('2023', 'Y-DEC'), 'HML')    |  -0.0436 |  0.4115 |  1      |  0.2133 |  0.6075 |
+        | (Period('2023', 'Y-DEC'), 'RMW')    |  -0.327  | -0.3984 |  0.2133 |  1      |  0.3029 |
+        | (Period('2023', 'Y-DEC'), 'CMA')    |  -0.4582 |  0.0737 |  0.6075 |  0.3029 |  1      |
+        | (Period('2024', 'Y-DEC'), 'Mkt-RF') |   1      |  0.2546 | -0.2273 | -0.3827 | -0.1223 |
+        | (Period('2024', 'Y-DEC'), 'SMB')    |   0.2546 |  1      |  0.418  | -0.4877 |  0.0798 |
+        | (Period('2024', 'Y-DEC'), 'HML')    |  -0.2273 |  0.418  |  1      |  0.1307 |  0.0939 |
+        | (Period('2024', 'Y-DEC'), 'RMW')    |  -0.3827 | -0.4877 |  0.1307 |  1      | -0.1003 |
+        | (Period('2024', 'Y-DEC'), 'CMA')    |  -0.1223 |  0.0798 |  0.0939 | -0.1003 |  1      |
+        | (Period('2025', 'Y-DEC'), 'Mkt-RF') |   1      |  0.1744 | -0.3814 | -0.4273 |  0.0586 |
+        | (Period('2025', 'Y-DEC'), 'SMB')    |   0.1744 |  1      |  0.2143 | -0.2924 |  0.2143 |
+        | (Period('2025', 'Y-DEC'), 'HML')    |  -0.3814 |  0.2143 |  1      |  0.3573 |  0.2218 |
+        | (Period('2025', 'Y-DEC'), 'RMW')    |  -0.4273 | -0.2924 |  0.3573 |  1      |  0.0657 |
+        | (Period('2025', 'Y-DEC'), 'CMA')    |   0.0586 |  0.2143 |  0.2218 |  0.0657 |  1      |
+        """
+        factors_to_calculate = (
+            factors_to_calculate
+            if factors_to_calculate
+            else ["Mkt-RF", "SMB", "HML", "RMW", "CMA"]
+        )
+
+        for factor in factors_to_calculate:
+            if factor not in ["Mkt-RF", "SMB", "HML", "RMW", "CMA"]:
+                raise ValueError(
+                    f"Factor {factor} is not a valid factor. Please select from: Mkt-RF, SMB, HML, RMW, CMA."
+                )
+
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        factors_to_calculate = (
+            factors_to_calculate + ["RF"]
+            if not exclude_risk_free
+            else factors_to_calculate
+        )
+
+        if self._fama_and_french_dataset.empty:
+            self._fama_and_french_dataset = (
+                performance_model.obtain_fama_and_french_dataset()
+            )
+
+        # The correlations are calculated for the whole periods within the date range
+        # only, rather than for every period since 1963 and then sliced.
+        period_symbol = PERIOD_TRANSLATION[period]
+        first_period_start = (
+            pd.Period(self._start_date, freq=period_symbol).start_time
+            if self._start_date
+            else None
+        )
+        last_period_end = (
+            pd.Period(self._end_date, freq=period_symbol).end_time
+            if self._end_date
+            else None
+        )
+        factor_dataset = self._fama_and_french_dataset[factors_to_calculate]
+        factor_dates = factor_dataset.index.to_timestamp()
+        within_range = np.ones(len(factor_dataset), dtype=bool)
+
+        if first_period_start is not None:
+            within_range &= factor_dates >= first_period_start
+        if last_period_end is not None:
+            within_range &= factor_dates <= last_period_end
+
+        fama_and_french_period = determine_within_dataset(
+            factor_dataset.loc[within_range],
+            period,
+            correlation=True,
+        )
+
+        # The Ken French dataset starts in 1963, so without this slice the result covers six decades regardless of the date range the Toolkit was initialised with.  # noqa: E501
+        self._factor_correlations = apply_rounding(
+            fama_and_french_period, rounding if rounding is not None else self._rounding
+        ).loc[self._start_date : self._end_date]
+
+        return self._factor_correlations
+
+    @handle_errors
+    def get_fama_and_french_model(
+        self,
+        period: str | None = None,
+        method: str = "multi",
+        factors_to_calculate: list[str] | None = None,
+        include_daily_residuals: bool = False,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+        show_columns: list[str] | None = None,
+    ):
+        """
+        Calculate Fama and French 5 Factor model scores and residuals for a set of financial assets.
+
+        The Fama and French 5 Factor model is a widely used financial model that helps estimate the expected return
+        of financial assets, such as stocks or portfolios, based on five key factors:
+
+            - Market Risk Premium (Mkt-RF): Represents the additional return that investors expect to earn for taking
+            on the risk of investing in the overall market as opposed to a risk-free asset.
+            - Size Premium (SMB): Reflects the historical excess return of small-cap stocks over large-cap stocks.
+            - Value Premium (HML): Captures the historical excess return of value stocks over growth stocks.
+            - Profitability (RMW): Measures the historical excess return of high profitability stocks over
+            low profitability stocks.
+            - Investment (CMA): Quantifies the historical excess return of low investment stocks over
+            high investment stocks.
+
+        The model can perform both a Simple Linear Regression on each factor as well as a Multi Linear Regression
+        which includes all factors. Generally, a multi linear regression is applied but if you wish to see individual
+        R-squared values for each factor you can select the simple linear regression method.
+
+        The model performs a Linear Regression on each factor and defines the regression parameters and residuals
+        for each asset over time based on its exposure to these factors.
+
+        The regression formula is as follows for the Multi Linear Regression:
+
+            - Excess Return = Intercept + Beta1 * Mkt-RF + Beta2 * SMB + Beta3 * HML + Beta4 * RMW
+                + Beta5 * CMA + Residuals
+
+        And the following for the Simple Linear Regression:
+
+            - Excess Return = Intercept + Slope * Factor Value + Residuals
+
+        So for a given factor, it should hold that the Excess Return equals the entire regression. Note that in this
+        calculation the Excess Return refers to the Asset Return minus the Risk Free Rate as reported in the Fama and
+        French dataset and will not be the same as the defined Excess Return in the historical data given that this is
+        based on the Risk Free Rate defined in the initialization.
+
+        The regression is estimated on the daily observations falling inside each period, so its Intercept, Slope and
+        Residuals are all on a daily scale. The `Factor Value` and `Residuals` columns reported by the Simple Linear
+        Regression therefore describe the **last daily observation** within the period, which is the only reading for
+        which the identity above holds — they are not period-aggregated quantities.
+
+        What is relevant to look at is the influence these factors have on each stock and how much each factor explains
+        the stock return. E.g. you will generally see a pretty high influence (Beta or Slope) for the Market Risk Premium
+        (Mkt-RF) factor as this is the main factor that explains the stock return (as also prevalent in the CAPM).
+        The other factors can fluctuate greatly between stocks depending on which stocks you look at.
+
+        Also known as: Fama-French model, three-factor model, five-factor model, FF3, FF5.
+
+        Args:
+            period (str, optional): The period for the calculation (e.g., "weekly", "monthly", "quarterly", "yearly").
+                Defaults to "quarterly" if the Toolkit is initialised with quarterly=True, otherwise "yearly".
+            method (str, optional): The regression method to use for the calculation. Defaults to 'multi'.
+            factors_to_calculate (list of str, optional): List of factors to calculate scores and residuals for.
+                Defaults to ["Mkt-RF", "SMB", "HML", "RMW", "CMA"].
+            include_daily_residuals (bool, optional): Whether to also return the pointwise (daily)
+                regression residuals as a second DataFrame. Defaults to False.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratio values. Defaults to False.
+            lag (int or list of int, optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+            show_columns (list of str, optional): Restrict the result to these top level columns.
+                Defaults to None, which returns every column.
+
+        Returns:
+            pd.DataFrame: Fama and French 5 Factor model scores for the specified assets, with a
+            Multi Index of (ticker, parameter) as the columns and one row per period. When
+            `include_daily_residuals` is True a tuple of (scores, residuals) is returned instead.
+
+        Notes:
+        - The dataset from Fama and French is not always fully up to date. Therefore, some periods could be excluded.
+        - Daily Fama and French results is not an option as it would attempt to do a linear regression on a
+        single data point which will not give any meaningful results.
+        - The method retrieves historical data and calculates regression parameters and residuals for each asset.
+        - The risk-free rate is typically represented by the return of a risk-free investment, such as a Treasury bond.
+        In this case, the Risk Free Rate from the Fama and French dataset is used.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        # Calculate Fama and French 5 Factor model scores
+        toolkit.performance.get_fama_and_french_model()["AAPL"]
+        ```
+
+        Which returns (the MSE column is omitted here for brevity):
+
+        |      |   Intercept |   Mkt-RF Slope |   SMB Slope |   HML Slope |   RMW Slope |   CMA Slope |   Mean Squared Error (MSE) |   R Squared |
+        |:-----|------------:|---------------:|------------:|------------:|------------:|------------:|---------------------------:|------------:|
+        | 2021 |      0      |         1.3145 |     -0.2741 |     -0.9797 |      0.3115 |      1.6357 |                     0.0001 |      0.7587 |
+        | 2022 |     -0.0001 |         1.2569 |     -0.2955 |     -0.6166 |      0.2339 |      0.683  |                     0.0001 |      0.818  |
+        | 2023 |      0.0003 |         1.1311 |     -0.0898 |     -0.445  |      0.4512 |     -0.0069 |                     0.0001 |      0.5905 |
+        | 2024 |      0.0002 |         0.8772 |      0.2648 |     -0.5829 |      0.7336 |      0.0606 |                     0.0001 |      0.3501 |
+        | 2025 |     -0.0001 |         1.4474 |     -0.0767 |      0.107  |      0.8063 |      0.0257 |                     0.0002 |      0.6027 |
+        """
+        if method not in ["simple", "multi"]:
+            raise ValueError(
+                f"Method {method} is not a valid method. Please select from: simple or multi (default). "
+                "This refers to a simple linear regression (regression of each factor on each asset return series) "
+                "or a multi linear regression (regression of all factors on each asset return series) respectively"
+            )
+
+        factors_to_calculate = (
+            factors_to_calculate
+            if factors_to_calculate
+            else ["Mkt-RF", "SMB", "HML", "RMW", "CMA"]
+        )
+
+        for factor in factors_to_calculate:
+            if factor not in ["Mkt-RF", "SMB", "HML", "RMW", "CMA"]:
+                raise ValueError(
+                    f"Factor {factor} is not a valid factor. Please select from: Mkt-RF, SMB, HML, RMW, CMA."
+                )
+
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+
+        if self._fama_and_french_dataset.empty:
+            self._fama_and_french_dataset = (
+                performance_model.obtain_fama_and_french_dataset()
+            )
+
+        fama_and_french_period = determine_within_dataset(
+            self._fama_and_french_dataset, period, correlation=False
+        )
+
+        merged_df = fama_and_french_period.merge(
+            returns, left_index=True, right_index=True
+        )
+        factor_scores: dict = {}
+        daily_residuals: dict = {}
+
+        # The first index level repeats once per row, so it has to be de-duplicated before iterating or every period is regressed once per day it contains.  # noqa: E501
+        dataset_periods = merged_df.index.get_level_values(0).unique()
+
+        logger.info(
+            "Calculating %s Factor Exposures",
+            "Multi" if method == "multi" else "Individual",
+        )
+        for ticker in self._tickers_without_portfolio:
+            factor_scores[ticker] = {}
+            daily_residuals[ticker] = {}
+
+            if method == "multi":
+                for dataset_period in dataset_periods:
+                    factor_data = merged_df.loc[dataset_period][factors_to_calculate]
+                    excess_returns = (
+                        merged_df.loc[dataset_period][ticker]
+                        - merged_df.loc[dataset_period]["RF"]
+                    )
+
+                    (
+                        factor_scores[ticker][dataset_period],
+                        daily_residuals[ticker][dataset_period],
+                        error_message,
+                    ) = performance_model.get_fama_and_french_model_multi(
+                        excess_returns=excess_returns, factor_dataset=factor_data
+                    )
+
+                    if error_message:
+                        logger.warning(
+                            "%s for %s in %s.", error_message, ticker, dataset_period
+                        )
+
+            elif method == "simple":
+                for factor in factors_to_calculate:
+                    factor_scores[ticker][factor] = {}
+                    daily_residuals[ticker][factor] = {}
+                    for dataset_period in dataset_periods:
+                        factor_data = merged_df.loc[dataset_period][factor]
+                        excess_returns = (
+                            merged_df.loc[dataset_period][ticker]
+                            - merged_df.loc[dataset_period]["RF"]
+                        )
+
+                        (
+                            factor_scores[ticker][factor][dataset_period],
+                            daily_residuals[ticker][factor][dataset_period],
+                        ) = performance_model.get_fama_and_french_model_single(
+                            excess_returns=excess_returns, factor=factor_data
+                        )
+
+                        # The regression is fitted on the observations within the period, so the reported Factor Value and Residual describe the last observation of that period, on the same scale.  # noqa: E501
+                        factor_scores[ticker][factor][dataset_period][
+                            "Factor Value"
+                        ] = factor_data.iloc[-1]
+
+                        factor_scores[ticker][factor][dataset_period][
+                            "Residuals"
+                        ] = excess_returns.iloc[-1] - (
+                            factor_scores[ticker][factor][dataset_period]["Slope"]
+                            * factor_data.iloc[-1]
+                            + factor_scores[ticker][factor][dataset_period]["Intercept"]
+                        )
+
+        if method == "multi":
+            fama_and_french_model = pd.DataFrame.from_dict(
+                {
+                    (ticker_name, dataset_period): value
+                    for ticker_name, factor_scores_ticker in factor_scores.items()
+                    for dataset_period, value in factor_scores_ticker.items()
+                },
+                orient="index",
+            )
+
+            fama_and_french_model = fama_and_french_model.unstack(level=0, sort=False)
+            fama_and_french_model.columns = to_multi_index(
+                fama_and_french_model.columns
+            ).swaplevel(0, 1)
+
+            # Sort the DataFrame with respect to the original column order
+            tickers_column_order = fama_and_french_model.columns.get_level_values(
+                0
+            ).unique()
+            parameters_column_order = fama_and_french_model.columns.get_level_values(
+                1
+            ).unique()
+
+            fama_and_french_model = (
+                fama_and_french_model.sort_index(axis=1)
+                .reindex(tickers_column_order, level=0, axis=1)
+                .reindex(parameters_column_order, level=1, axis=1)
+            )
+        else:
+            fama_and_french_model = pd.DataFrame.from_dict(
+                {
+                    (dataset_period, factor, ticker_name): value
+                    for ticker_name, factor_scores_ticker in factor_scores.items()
+                    for factor, factor_scores_factor in factor_scores_ticker.items()
+                    for dataset_period, value in factor_scores_factor.items()
+                },
+                orient="index",
+            )
+
+            # Sort the DataFrame with respect to the original column order
+            parameters_column_order = fama_and_french_model.columns.unique()
+            factor_column_order = fama_and_french_model.index.get_level_values(
+                1
+            ).unique()
+            ticker_column_order = fama_and_french_model.index.get_level_values(
+                2
+            ).unique()
+
+            fama_and_french_model = fama_and_french_model.stack().unstack(
+                level=[2, 1, 3]
+            )
+
+            fama_and_french_model = (
+                fama_and_french_model.sort_index(axis=1)
+                .reindex(parameters_column_order, level=2, axis=1)
+                .reindex(factor_column_order, level=1, axis=1)
+                .reindex(ticker_column_order, level=0, axis=1)
+            )
+
+        self._fama_and_french_model = apply_rounding(
+            fama_and_french_model, rounding if rounding is not None else self._rounding
+        ).loc[self._start_date : self._end_date]
+
+        if include_daily_residuals:
+            if method == "multi":
+                daily_residuals_df = pd.DataFrame.from_dict(
+                    {
+                        (ticker_name, dataset_period): value
+                        for ticker_name, residuals_ticker in daily_residuals.items()
+                        for dataset_period, value in residuals_ticker.items()
+                    },
+                    orient="index",
+                )
+
+                daily_residuals_df = (
+                    daily_residuals_df.stack()
+                    .unstack(level=0)
+                    .sort_index(axis=1, sort_remaining=False)
+                )
+            else:
+                daily_residuals_df = pd.DataFrame.from_dict(
+                    {
+                        (dataset_period, factor, ticker_name): value
+                        for ticker_name, residuals_ticker in daily_residuals.items()
+                        for factor, residuals_factor in residuals_ticker.items()
+                        for dataset_period, value in residuals_factor.items()
+                    },
+                    orient="index",
+                )
+
+                daily_residuals_df = (
+                    daily_residuals_df.unstack(level=[1, 2])
+                    .stack(level=0)
+                    .sort_index(axis=1, sort_remaining=False)
+                )
+
+            # Reshaping pairs every period with every date in the whole sample, so all but the dates actually inside a period come back as fully empty rows. Dropping them (and sorting what is left) is what makes the date slice below possible at all: it otherwise raises on the non-monotonic index of repeated dates.  # noqa: E501
+            daily_residuals_df = (
+                daily_residuals_df.dropna(how="all")
+                .sort_index()
+                .reset_index(level=0, drop=True)
+            )
+
+            self._fama_and_french_residuals = apply_rounding(
+                daily_residuals_df, rounding if rounding is not None else self._rounding
+            ).loc[self._start_date : self._end_date]
+
+            return (
+                filter_columns(self._fama_and_french_model, show_columns),
+                self._fama_and_french_residuals,
+            )
+
+        return filter_columns(
+            finalize_dataset(
+                dataset=self._fama_and_french_model,
+                start_date=self._start_date,
+                end_date=self._end_date,
+                default_rounding=self._rounding,
+                growth=growth,
+                lag=lag,
+                rounding=rounding,
+                standardize=standardize,
+                axis="rows",
+                row_slice=True,
+            ),
+            show_columns,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_carhart_four_factor_model(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+        show_columns: list[str] | None = None,
+    ):
+        """
+        Calculate Carhart Four Factor model scores for a set of financial assets.
+
+        The Carhart Four Factor model extends the Fama and French Three Factor model with a
+        momentum factor, based on the observation that stocks with high prior returns (winners)
+        tend to keep outperforming stocks with low prior returns (losers) over the medium term:
+
+            - Market Risk Premium (Mkt-RF): The excess return of the market over the risk-free rate.
+            - Size Premium (SMB): The historical excess return of small-cap stocks over large-cap stocks.
+            - Value Premium (HML): The historical excess return of value stocks over growth stocks.
+            - Momentum (MOM): The historical excess return of prior winner stocks over prior loser stocks.
+
+        The model performs a Multi Linear Regression on all four factors and defines the regression
+        parameters for each asset over time based on its exposure to these factors:
+
+            - Excess Return = Intercept + Beta1 * Mkt-RF + Beta2 * SMB + Beta3 * HML + Beta4 * MOM + Residuals
+
+        For more information about the method, see the following paper:
+
+        - Carhart, M.M. (1997). "On Persistence in Mutual Fund Performance." The Journal of
+        Finance, 52(1), 57-82.
+
+        Also known as: Carhart model, four-factor model, momentum-augmented Fama-French model.
+
+        Args:
+            period (str, optional): The period for the calculation (e.g., "weekly", "monthly", "quarterly", "yearly").
+                Defaults to "quarterly" if the Toolkit is initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratio values. Defaults to False.
+            lag (int or list of int, optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+            show_columns (list of str, optional): Restrict the result to these top level columns.
+                Defaults to None, which returns every column.
+
+        Returns:
+            pd.DataFrame: Carhart Four Factor model scores for the specified assets, with a Multi
+            Index of (ticker, parameter) as the columns and one row per period.
+
+        Notes:
+        - The dataset from Ken French is not always fully up to date. Therefore, some periods could be excluded.
+        - Daily Carhart results is not an option as it would attempt to do a linear regression on a single data
+        point which will not give any meaningful results.
+        - The factors come from the Fama and French **three** factor file rather than the five factor file
+        used by `get_fama_and_french_model`. The two files agree on Mkt-RF, HML and RF but not on SMB: the
+        five factor SMB averages three separate size legs, while Carhart (1997) extends the three factor
+        model and therefore requires the three factor SMB.
+        - The risk-free rate is the Risk Free Rate reported in the Fama and French dataset (used here, rather
+        than the Toolkit's own risk-free rate, to stay consistent with the momentum factor's construction).
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AMZN", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_carhart_four_factor_model(period="quarterly")["AMZN"]
+        ```
+
+        Which returns (columns are Intercept, Mkt-RF/SMB/HML/MOM Slope, MSE and R Squared, per ticker):
+
+        |        |   Intercept |   Mkt-RF Slope |   SMB Slope |   HML Slope |   MOM Slope |   Mean Squared Error (MSE) |   R Squared |
+        |:-------|------------:|---------------:|------------:|------------:|------------:|---------------------------:|------------:|
+        | 2021Q1 |      0.0007 |         0.693  |     -0.3265 |     -0.4391 |      0.1835 |                     0.0001 |      0.6836 |
+        | 2021Q2 |      0.0005 |         0.8978 |     -0.0839 |     -0.5207 |     -0.0226 |                     0.0001 |      0.4758 |
+        | 2021Q3 |     -0.0004 |         1.3049 |     -0.1957 |     -0.5054 |     -0.1656 |                     0.0001 |      0.363  |
+        | 2021Q4 |     -0.001  |         1.1025 |     -0.3979 |     -0.4752 |     -0.2752 |                     0.0001 |      0.4805 |
+        | 2022Q1 |      0.0011 |         1.3057 |     -0.6168 |      0.0545 |     -0.9572 |                     0.0004 |      0.5827 |
+        | 2022Q2 |     -0.0011 |         1.4273 |     -0.6967 |     -0.3486 |     -0.4826 |                     0.0003 |      0.7936 |
+        | 2022Q3 |      0.0027 |         1.34   |     -1.311  |      0.0417 |     -0.9466 |                     0.0001 |      0.8026 |
+        | 2022Q4 |     -0.0042 |         0.9708 |     -0.8204 |     -0.6269 |     -0.633  |                     0.0003 |      0.7038 |
+        | 2023Q1 |     -0.0004 |         1.0735 |     -0.1457 |     -0.4162 |     -0.7099 |                     0.0002 |      0.6934 |
+        | 2023Q2 |      0.001  |         0.9296 |     -0.321  |     -1.2957 |     -0.7959 |                     0.0002 |      0.4925 |
+        | 2023Q3 |      0.0006 |         1.7583 |     -0.6457 |     -0.1542 |     -0.3941 |                     0.0002 |      0.3885 |
+        | 2023Q4 |      0.0007 |         1.3123 |      0.5404 |     -0.0812 |      1.3102 |                     0.0001 |      0.5996 |
+        | 2024Q1 |     -0.0006 |         1.6036 |     -0.2896 |     -0.2613 |      0.407  |                     0.0001 |      0.6386 |
+        | 2024Q2 |      0.0002 |         1.0116 |      0.3988 |     -0.9563 |     -0.0864 |                     0.0001 |      0.4468 |
+        | 2024Q3 |     -0.0016 |         1.4312 |     -0.1908 |     -0.0594 |      0.2389 |                     0.0002 |      0.5795 |
+        | 2024Q4 |      0.0019 |         1.6443 |     -0.2264 |     -0.506  |     -0.1046 |                     0.0002 |      0.5502 |
+        | 2025Q1 |     -0.0006 |         1.1099 |      0.2159 |     -0.2128 |      0.1184 |                     0.0001 |      0.647  |
+        | 2025Q2 |     -0      |         1.0987 |      0.4679 |     -0.6058 |     -0.2748 |                     0.0002 |      0.8102 |
+        | 2025Q3 |     -0.002  |         1.9426 |     -0.6088 |      0.1629 |      0.0168 |                     0.0002 |      0.288  |
+        | 2025Q4 |      0.0004 |         1.8577 |     -0.6249 |     -0.6308 |     -0.574  |                     0.0002 |      0.4685 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+
+        # Carhart (1997) extends the *three* factor model. The three and five factor files share Mkt-RF, HML and RF but their SMB series differ, so the three factor file is the correct source here.  # noqa: E501
+        three_factor_dataset = (
+            performance_model.obtain_fama_and_french_three_factor_dataset()
+        )
+        momentum_dataset = performance_model.obtain_carhart_momentum_dataset()
+
+        carhart_dataset = three_factor_dataset[["Mkt-RF", "SMB", "HML", "RF"]].merge(
+            momentum_dataset, left_index=True, right_index=True
+        )
+        carhart_dataset = carhart_dataset.rename(columns={"Mom": "MOM"})
+
+        carhart_period = determine_within_dataset(
+            carhart_dataset, period, correlation=False
+        )
+
+        merged_df = carhart_period.merge(returns, left_index=True, right_index=True)
+
+        factors_to_calculate = ["Mkt-RF", "SMB", "HML", "MOM"]
+        factor_scores: dict = {}
+
+        # The first index level repeats once per row, so it has to be de-duplicated before iterating or every period is regressed once per day it contains.  # noqa: E501
+        dataset_periods = merged_df.index.get_level_values(0).unique()
+
+        logger.info("Calculating Carhart Four Factor Exposures")
+        for ticker in self._tickers_without_portfolio:
+            factor_scores[ticker] = {}
+
+            for dataset_period in dataset_periods:
+                factor_data = merged_df.loc[dataset_period][factors_to_calculate]
+                excess_returns = (
+                    merged_df.loc[dataset_period][ticker]
+                    - merged_df.loc[dataset_period]["RF"]
+                )
+
+                (
+                    factor_scores[ticker][dataset_period],
+                    _,
+                    error_message,
+                ) = performance_model.get_fama_and_french_model_multi(
+                    excess_returns=excess_returns, factor_dataset=factor_data
+                )
+
+                if error_message:
+                    logger.warning(
+                        "%s for %s in %s.", error_message, ticker, dataset_period
+                    )
+
+        carhart_model = pd.DataFrame.from_dict(
+            {
+                (ticker_name, dataset_period): value
+                for ticker_name, factor_scores_ticker in factor_scores.items()
+                for dataset_period, value in factor_scores_ticker.items()
+            },
+            orient="index",
+        )
+
+        carhart_model = carhart_model.unstack(level=0, sort=False)
+        carhart_model.columns = to_multi_index(carhart_model.columns).swaplevel(0, 1)
+
+        tickers_column_order = carhart_model.columns.get_level_values(0).unique()
+        parameters_column_order = carhart_model.columns.get_level_values(1).unique()
+
+        carhart_model = (
+            carhart_model.sort_index(axis=1)
+            .reindex(tickers_column_order, level=0, axis=1)
+            .reindex(parameters_column_order, level=1, axis=1)
+        )
+
+        self._carhart_four_factor_model = apply_rounding(
+            carhart_model, rounding if rounding is not None else self._rounding
+        ).loc[self._start_date : self._end_date]
+
+        return filter_columns(
+            finalize_dataset(
+                dataset=self._carhart_four_factor_model,
+                start_date=self._start_date,
+                end_date=self._end_date,
+                default_rounding=self._rounding,
+                growth=growth,
+                lag=lag,
+                rounding=rounding,
+                standardize=standardize,
+                axis="rows",
+                row_slice=True,
+            ),
+            show_columns,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_alpha(
+        self,
+        period: str | None = None,
+        show_full_results: bool = False,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Alpha, in a general sense, represents the excess return an investment generates relative to
+        a benchmark or a risk-adjusted return. It can be positive (indicating the investment
+        outperformed the benchmark) or negative (indicating underperformance).
+
+        The formula is as follows:
+
+            - Alpha = Asset's Actual Return — Benchmark's Actual Return
+
+        See definition: https://en.wikipedia.org/wiki/Alpha_(finance)
+
+        Also known as: excess return, outperformance, active return.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            show_full_results (bool, optional): Whether to show the actual and benchmark returns next to the
+                Alpha. Defaults to False.
+            rolling (int, optional): The rolling window size to use for the calculation. If set,
+            Alpha is calculated as the rolling mean excess return over this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Alpha values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Alpha for each asset in the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_alpha()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.0823 | -0.4685 |
+        | 2023   |  0.2283 |  0.7554 |
+        | 2024   |  0.0583 |  0.3764 |
+        | 2025   | -0.0867 | -0.0636 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=False)
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=False, benchmark=True
+        )
+
+        if rolling:
+            alpha = performance_model.get_rolling_alpha(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            alpha = performance_model.get_alpha(returns, benchmark_returns)
+
+        alpha = apply_rounding(
+            alpha, rounding if rounding is not None else self._rounding
+        ).loc[self._start_date : self._end_date]
+
+        alpha = alpha.dropna(how="all", axis=0)
+
+        if show_full_results:
+            full_results = pd.concat([returns, benchmark_returns, alpha], axis=1).loc[
+                self._start_date : self._end_date
+            ]
+            full_results.columns = (
+                [
+                    f"Actual Return {ticker}"
+                    for ticker in self._tickers_without_portfolio
+                ]
+                + ["Benchmark Returns"]
+                + [f"Alpha {ticker}" for ticker in self._tickers_without_portfolio]
+            )
+
+            return full_results
+
+        return finalize_dataset(
+            dataset=alpha,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_jensens_alpha(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate Jensen's Alpha, a measure of an asset's performance relative to its expected return
+        based on the Capital Asset Pricing Model (CAPM).
+
+        Jensen's Alpha is used to assess whether an investment has outperformed or underperformed
+        its expected return given its systematic risk, as represented by the asset's Beta.
+
+        The formula is as follows:
+
+            - Jensen's Alpha = Asset's Actual Return — [Risk-Free Rate + Beta * (Benchmark Return — Risk-Free Rate)]
+
+        See definition: https://en.wikipedia.org/wiki/Jensen%27s_alpha
+
+        Also known as: Jensen alpha, risk-adjusted excess return.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the Beta component of the
+            calculation. If set, Beta is estimated over a rolling window of this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Jensen's Alpha values.
+
+        Notes:
+        - Daily Jensen's Alpha is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the CAPM for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_jensens_alpha()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.0156 | -0.3053 |
+        | 2023   |  0.2027 |  0.4769 |
+        | 2024   |  0.0646 |  0.0961 |
+        | 2025   | -0.1212 | -0.231  |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            beta = performance_model.get_rolling_beta(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            beta = performance_model.get_beta(returns, benchmark_returns)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+
+        risk_free_rate = self._risk_free_rate_data[period]
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=False, benchmark=True
+        )
+
+        jensens_alpha = performance_model.get_jensens_alpha(
+            period_returns, risk_free_rate, beta, benchmark_returns
+        )
+
+        return finalize_dataset(
+            dataset=jensens_alpha,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_treynor_ratio(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        The Treynor Ratio, also known as Treynor's Measure or the Reward-to-Variability Ratio, is a
+        financial metric used to assess the risk-adjusted performance of an investment portfolio or
+        asset. It measures the excess return generated by the portfolio per unit of systematic or market
+        risk, often represented by Beta. The Treynor Ratio is a valuable tool for evaluating the
+        performance of investments in relation to their market risk exposure.
+
+        The formula is as follows:
+
+        - Treynor Ratio = (Portfolio's Return — Risk-Free Rate) / Portfolio Beta
+
+        See definition: https://en.wikipedia.org/wiki/Treynor_ratio
+
+        Also known as: reward-to-volatility ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the Beta component of the
+            calculation. If set, Beta is estimated over a rolling window of this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Treynor Ratio values.
+
+        Notes:
+        - Daily Treynor Ratio is not an option as the standard deviation for 1 day is close to zero. Therefore,
+        it does not give any useful insights.
+        - The method retrieves historical data and calculates the TR for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_treynor_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.2325 | -0.3961 |
+        | 2023   |  0.4049 |  0.4352 |
+        | 2024   |  0.2698 |  0.2435 |
+        | 2025   |  0.039  |  0.0322 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            beta = performance_model.get_rolling_beta(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            beta = performance_model.get_beta(returns, benchmark_returns)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+        risk_free_rate = self._risk_free_rate_data[period]
+
+        treynor_ratio = performance_model.get_treynor_ratio(
+            period_returns, risk_free_rate, beta
+        )
+
+        return finalize_dataset(
+            dataset=treynor_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_sharpe_ratio(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        method: str = "standard",
+        benchmark_sharpe_ratio: float = 0.0,
+        trials_window: int | None = None,
+        n_trials: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+        annualize: bool = False,
+    ):
+        """
+        Calculate the Sharpe ratio, a measure of risk-adjusted return that evaluates the excess return
+        of an investment portfolio or asset per unit of risk taken.
+
+        The Sharpe ratio is calculated as the difference between the expected return of the asset or portfolio
+        and the risk-free rate of return, divided by the standard deviation of the asset or portfolio's excess return.
+        It quantifies the amount of return generated for each unit of risk assumed, providing insights into the
+        investment's performance relative to the risk taken.
+
+        The formula is as follows:
+
+            - Sharpe Ratio = Excess Return / Excess Standard Deviation
+
+        By default one Sharpe ratio is reported per `period`, computed from the **daily**
+        excess returns falling inside that period. For a given period, for example monthly,
+        this translates into the following:
+
+            - Sharpe Ratio = Average Daily Excess Return within the Month
+              / Standard Deviation of the Daily Excess Returns within the Month
+
+        For a rolling period, `period` instead sets the frequency of the returns themselves
+        and the ratio is computed over a rolling window of `rolling` such returns:
+
+            - Sharpe Ratio = Average Rolling Excess Return / Standard Deviation of Rolling Excess Returns
+
+        Note that this is explicitly already subtracts the Risk Free Rate.
+
+        By default the result is **not annualized**: it is a per-observation Sharpe ratio, so a
+        value computed from daily returns is roughly SQRT(252) smaller than the annualized figure
+        usually quoted in the literature (SQRT(52), SQRT(12) and SQRT(4) for weekly, monthly
+        and quarterly returns respectively). Set annualize=True to multiply by that factor, to
+        compare against published annualized Sharpe ratios.
+
+        The plain Sharpe ratio only looks at the mean and standard deviation of returns, implicitly
+        assuming Gaussian, i.i.d. returns and ignoring how much uncertainty surrounds the estimate
+        itself. The `method` parameter selects one of three corrections for that, each keeping the
+        same excess returns and therefore the same underlying Sharpe ratio as its starting point:
+
+        - `"adjusted"` — the Adjusted Sharpe Ratio (ASR, Pezier & White, 2006) penalizes (or
+        rewards) the Sharpe ratio for negative skewness and excess kurtosis using a
+        Cornish-Fisher-style expansion, so that two strategies with the same Sharpe ratio but
+        different tail shapes are no longer scored identically:
+
+            - ASR = SR * [1 + (S / 6) * SR − ((K − 3) / 24) * SR^2]
+
+        - `"probabilistic"` — the Probabilistic Sharpe Ratio (PSR) is the probability that the true
+        (population) Sharpe ratio exceeds `benchmark_sharpe_ratio`, folding the skewness and
+        (non-excess) kurtosis of the underlying returns into the standard error of the Sharpe ratio
+        so that a short, lumpy sample no longer looks more convincing than it is:
+
+            - PSR(SR*) = Φ( (SR̂ − SR*) · sqrt(n − 1) / sqrt(1 − γ₃·SR̂ + ((γ₄ − 1) / 4)·SR̂²) )
+
+        - `"deflated"` — the Deflated Sharpe Ratio (DSR) is the Probabilistic Sharpe Ratio corrected
+        for the fact that a reported Sharpe ratio is often the best of many strategy variations,
+        parameter combinations, or lookback windows tried during a backtest (multiple testing /
+        selection bias / "backtest overfitting"). It estimates the Sharpe ratio one would expect to
+        observe purely by chance as the maximum of `n_trials` independent trials under the null
+        hypothesis of no skill, and uses that expected maximum as the benchmark SR* in the
+        Probabilistic Sharpe Ratio formula instead of a naive benchmark such as 0:
+
+            - SR* = sqrt(Var[SR_trials]) · [ (1 − γ)·Φ⁻¹(1 − 1/N) + γ·Φ⁻¹(1 − 1/(N·e)) ]
+
+        Where SR̂ is the observed Sharpe ratio, S (γ₃) is the skewness and K (γ₄) the non-excess
+        (raw) kurtosis of the same returns, n is the number of return observations, N is `n_trials`,
+        Var[SR_trials] is the variance of the Sharpe ratios observed across those N trials,
+        γ ≈ 0.5772 is the Euler-Mascheroni constant and Φ is the standard normal CDF. Since
+        DSR = PSR(SR*), it is always less than or equal to the Probabilistic Sharpe Ratio computed
+        against a benchmark of 0.
+
+        This codebase does not track "N literal strategy trials" — there is no record of how many
+        parameter combinations were tried before arriving at the current Toolkit configuration. As a
+        documented approximation, `Var[SR_trials]` is estimated from the variance of an auxiliary
+        *rolling* Sharpe ratio series (see `get_rolling_sharpe_ratio`) computed over a
+        `trials_window`-sized window across the full return history, and `n_trials` defaults to the
+        number of valid (non-NaN) values in that same rolling series. This treats each rolling
+        window as if it were one "trial" — a reasonable proxy for how dispersed the Sharpe ratio
+        could plausibly have been under different choices, but not a substitute for passing the
+        actual number of variations tried (via `n_trials`) when that is known, since the quality of
+        the correction depends directly on it.
+
+        See definition: https://en.wikipedia.org/wiki/Sharpe_ratio
+
+        Also known as: risk-adjusted return, reward-to-variability ratio. The variants are also
+        known as the Pezier and White Adjusted Sharpe Ratio (ASR), the Sharpe ratio significance
+        probability (PSR) and the backtest overfitting or selection-bias-adjusted Sharpe ratio (DSR).
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling period to use for the calculation. If you select
+            period = 'monthly' and set rolling to 12 you obtain the rolling 12-month Sharpe Ratio.
+            method (str, optional): Which Sharpe ratio to calculate, one of "standard", "adjusted",
+            "probabilistic" or "deflated", as described above. Defaults to "standard".
+            benchmark_sharpe_ratio (float, optional): The hypothesized or benchmark Sharpe ratio
+            (SR*) to test the observed Sharpe ratio against. Only used when method="probabilistic".
+            Defaults to 0.0, i.e. testing whether the strategy has any skill at all above doing nothing.
+            trials_window (int, optional): The window size (in units of `period`) used for the
+            auxiliary rolling Sharpe ratio series that approximates `Var[SR_trials]` and the
+            default `n_trials`, see above. Only used when method="deflated". Defaults to None, which
+            uses half of the available return history so that enough overlapping windows exist
+            regardless of `period` or date range.
+            n_trials (int, optional): The number of independent (or effectively independent)
+            strategy variations, parameter combinations, or lookback windows tried before
+            arriving at the reported Sharpe ratio. Only used when method="deflated". Defaults to
+            None, which falls back to the number of valid values in the auxiliary rolling Sharpe
+            ratio series described above. Pass this explicitly whenever the actual number of trials
+            is known.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+            annualize (bool, optional): Whether to annualize the Sharpe ratio, multiplying it by
+                the square root of the number of observations in a year: 252 for the daily
+                returns within each period, or the periods in a year for a rolling Sharpe ratio
+                (e.g. 12 for monthly). Only for method="standard" and "adjusted", since the other
+                methods return probabilities. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Sharpe ratio values. For method="probabilistic" and method="deflated"
+            these are probabilities between 0 and 1 rather than ratios.
+
+        Notes:
+        - Daily Sharpe Ratio is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the Sharpe ratio for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - The "adjusted", "probabilistic" and "deflated" variants use the **non-excess (raw)** kurtosis
+        convention, i.e. a Normal distribution has a kurtosis of 3, not 0. Internally this calls
+        `risk_model.get_kurtosis(..., fisher=False)`.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_sharpe_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2021   |  0.0859 |  0.0581 |
+        | 2022   | -0.0484 | -0.0812 |
+        | 2023   |  0.1193 |  0.095  |
+        | 2024   |  0.0702 |  0.0637 |
+        | 2025   |  0.0188 |  0.0263 |
+
+        And, asking for the probability that these Sharpe ratios are genuine instead:
+
+        ```python
+        toolkit.performance.get_sharpe_ratio(method="probabilistic")
+        ```
+
+        Which returns:
+
+        | Date   |   AAPL |   TSLA |
+        |:-------|-------:|-------:|
+        | 2021   | 0.9117 | 0.8251 |
+        | 2022   | 0.2241 | 0.0999 |
+        | 2023   | 0.9688 | 0.9323 |
+        | 2024   | 0.8698 | 0.8496 |
+        | 2025   | 0.6177 | 0.6618 |
+        """
+        if method not in ("standard", "adjusted", "probabilistic", "deflated"):
+            raise ValueError(
+                "Method must be standard, adjusted, probabilistic, or deflated."
+            )
+
+        if annualize and method not in ("standard", "adjusted"):
+            raise ValueError(
+                "Only a standard or adjusted Sharpe ratio can be annualized, since the "
+                "probabilistic and deflated ones are probabilities."
+            )
+
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        # The deflated variant needs the full (non within period) return history to approximate how dispersed the Sharpe ratio is across trials, regardless of whether the ratio being tested is itself a rolling one.  # noqa: E501
+        if rolling or method == "deflated":
+            period_returns = self._get_column(period, "Return", within_period=False)
+            full_excess_return = performance_model.get_excess_return(
+                period_returns, self._risk_free_rate_data[period]
+            )
+
+        if rolling:
+            excess_return = full_excess_return
+            sharpe_ratio = performance_model.get_rolling_sharpe_ratio(
+                excess_return, rolling
+            )
+        else:
+            excess_return = self._get_column(
+                period, "Excess Return", within_period=True
+            )
+            sharpe_ratio = performance_model.get_sharpe_ratio(excess_return)
+
+        if method == "standard":
+            result = sharpe_ratio
+        else:
+            if rolling:
+                skewness = get_rolling_skewness(excess_return, rolling)
+                kurtosis = get_rolling_kurtosis(excess_return, rolling, fisher=False)
+                n_observations = rolling
+            else:
+                skewness = get_skewness(excess_return)
+                kurtosis = get_kurtosis(excess_return, fisher=False)
+                n_observations = excess_return.groupby(level=0).count()
+
+            if method == "adjusted":
+                result = performance_model.get_adjusted_sharpe_ratio(
+                    sharpe_ratio=sharpe_ratio,
+                    skewness=skewness,
+                    kurtosis=kurtosis,
+                )
+            elif method == "probabilistic":
+                result = performance_model.get_probabilistic_sharpe_ratio(
+                    sharpe_ratio=sharpe_ratio,
+                    benchmark_sharpe_ratio=benchmark_sharpe_ratio,
+                    skewness=skewness,
+                    kurtosis=kurtosis,
+                    n_observations=n_observations,
+                )
+            else:
+                trials_window = (
+                    trials_window
+                    if trials_window is not None
+                    else max(2, len(full_excess_return) // 2)
+                )
+                trials_sharpe_ratio = performance_model.get_rolling_sharpe_ratio(
+                    full_excess_return, trials_window
+                )
+                trials = (
+                    n_trials if n_trials is not None else trials_sharpe_ratio.count()
+                )
+
+                result = performance_model.get_deflated_sharpe_ratio(
+                    sharpe_ratio=sharpe_ratio,
+                    sharpe_ratio_variance=trials_sharpe_ratio.var(),
+                    n_trials=trials,
+                    n_observations=n_observations,
+                    skewness=skewness,
+                    kurtosis=kurtosis,
+                )
+
+        if annualize:
+            # The rolling ratio uses the returns of each period, the one per period the
+            # daily returns within it.
+            result = result * np.sqrt(
+                PERIODS_PER_YEAR[period] if rolling else PERIODS_PER_YEAR["daily"]
+            )
+
+        return finalize_dataset(
+            dataset=result,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_sortino_ratio(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+
+        The Sortino Ratio is a financial metric used to assess the risk-adjusted performance of an
+        investment portfolio or asset by considering only the downside risk. It measures the excess
+        return generated by the portfolio per unit of downside risk, specifically, the standard
+        deviation of negative returns. The Sortino Ratio is particularly useful for investors who
+        are primarily concerned with minimizing the downside risk of their investments.
+
+        The formula is as follows:
+
+            - Sortino Ratio = Excess Return / Downside Deviation
+            - Downside Deviation = SQRT( (1 / N) * SUM( MIN(Excess Return, 0)^2 ) )
+
+        Where N is the *total* number of observations, not just the negative ones, following
+        Sortino & Price (1994). By default one Sortino ratio is reported per `period`,
+        computed from the **daily** excess returns falling inside that period. For a given
+        period, for example monthly, this translates into the following:
+
+            - Sortino Ratio = Average Daily Excess Return within the Month
+              / Downside Deviation of the Daily Excess Returns within the Month
+
+        For a rolling period, `period` instead sets the frequency of the returns themselves
+        and the ratio is computed over a rolling window of `rolling` such returns:
+
+            - Sortino Ratio = Average Rolling Excess Return / Rolling Downside Deviation
+
+        Note that this is explicitly already subtracts the Risk Free Rate.
+
+        As with the Sharpe Ratio, the result is **not annualized**: it is a per-observation
+        ratio, so multiply by SQRT(252), SQRT(52), SQRT(12) or SQRT(4) for daily, weekly,
+        monthly or quarterly returns respectively before comparing against published
+        annualized figures.
+
+        See definition: https://en.wikipedia.org/wiki/Sortino_ratio
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the calculation. If set,
+            the Sortino ratio is calculated over a rolling window of this many periods across the
+            full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Sortino ratio values.
+
+        Notes:
+        - Daily Sortino Ratio is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the Sortino ratio for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_sortino_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2021   |  0.129  |  0.0906 |
+        | 2022   | -0.0678 | -0.1069 |
+        | 2023   |  0.1846 |  0.1462 |
+        | 2024   |  0.1073 |  0.1044 |
+        | 2025   |  0.0282 |  0.0391 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            period_returns = self._get_column(period, "Return", within_period=False)
+            excess_return = performance_model.get_excess_return(
+                period_returns, self._risk_free_rate_data[period]
+            )
+            sortino_ratio = performance_model.get_rolling_sortino_ratio(
+                excess_return, rolling
+            )
+        else:
+            excess_return = self._get_column(
+                period, "Excess Return", within_period=True
+            )
+
+            sortino_ratio = performance_model.get_sortino_ratio(excess_return)
+
+        return finalize_dataset(
+            dataset=sortino_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_ulcer_performance_index(
+        self,
+        period: str | None = None,
+        rolling: int = 14,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Ulcer Performance Index (UPI), alternatively called Martin ratio, a measure of risk-adjusted
+        return that evaluates the excess return of an investment portfolio or asset per unit of risk taken.
+
+        It can be used to compare volatilities in different stocks or show stocks go into Ulcer territory.
+        Similar to the Sharpe Ratio, a higher UPI is better than a lower one (since investors prefer more return
+        for less risk).
+
+        Also known as: UPI, Martin ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int): The rolling period to use to calculate the Ulcer Index. Defaults to 14.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Ulcer Performance Index values.
+
+        Notes:
+        - The method retrieves historical data and calculates the UPI for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_ulcer_performance_index()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -4.5178 | -5.0182 |
+        | 2023   | 13.666  | 11.6618 |
+        | 2024   |  7.6992 |  6.3795 |
+        | 2025   |  0.9945 |  0.7159 |
+        """
+
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+        excess_return = (
+            period_returns
+            if period == "intraday"
+            else performance_model.get_excess_return(
+                period_returns, self._risk_free_rate_data[period]
+            )
+        )
+
+        ulcer_index = get_ui(returns, rolling)
+
+        ulcer_performance_index = performance_model.get_ulcer_performance_index(
+            excess_return, ulcer_index
+        )
+
+        return finalize_dataset(
+            dataset=ulcer_performance_index,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_calmar_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Calmar Ratio of an investment portfolio or asset's returns.
+
+        The Calmar Ratio is a risk-adjusted return metric that divides the (annualized) return
+        of an investment portfolio or asset by its Maximum Drawdown, providing insight into the
+        return achieved per unit of the worst historical loss of value.
+
+        The formula is as follows:
+
+        - Calmar Ratio = Return / |Maximum Drawdown|
+
+        See definition: https://en.wikipedia.org/wiki/Calmar_ratio
+
+        Also known as: Drawdown ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the Maximum Drawdown within the
+            specified period or for the entire period. Thus whether to look at the Maximum Drawdown
+            within a specific year (if period = 'yearly') or look at the entirety of all years.
+            Defaults to True.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Calmar Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Calmar Ratio for each asset in
+        the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_calmar_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.8691 | -0.8942 |
+        | 2023   |  3.2887 |  3.1074 |
+        | 2024   |  2.0024 |  1.461  |
+        | 2025   |  0.2995 |  0.2356 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=within_period)
+
+        maximum_drawdown = get_max_drawdown(returns)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+
+        calmar_ratio = performance_model.get_calmar_ratio(
+            period_returns, maximum_drawdown
+        )
+
+        return finalize_dataset(
+            dataset=calmar_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_sterling_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        adjustment: float = 0.1,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Sterling Ratio of an investment portfolio or asset's returns.
+
+        The Sterling Ratio is a risk-adjusted return metric that divides the (annualized) return
+        of an investment portfolio or asset by its Average Drawdown plus a fixed adjustment
+        (conventionally 10%), providing insight into the return achieved relative to the typical
+        depth of its drawdowns rather than only the single worst one (as with the Calmar Ratio).
+
+        The formula is as follows:
+
+        - Sterling Ratio = Return / (|Average Drawdown| + Adjustment)
+
+        Also known as: Sterling-Calmar ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the Average Drawdown within the
+            specified period or for the entire period. Thus whether to look at the Average Drawdown
+            within a specific year (if period = 'yearly') or look at the entirety of all years.
+            Defaults to True.
+            adjustment (float, optional): The fixed adjustment added to the Average Drawdown,
+            conventionally 0.1 (10%). Defaults to 0.1.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Sterling Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Sterling Ratio for each asset in
+        the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_sterling_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -1.0657 | -1.4667 |
+        | 2023   |  3.3684 |  4.193  |
+        | 2024   |  1.9821 |  2.1544 |
+        | 2025   |  0.4622 |  0.3785 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=within_period)
+
+        average_drawdown = performance_model.get_average_drawdown(returns)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+
+        sterling_ratio = performance_model.get_sterling_ratio(
+            period_returns, average_drawdown, adjustment
+        )
+
+        return finalize_dataset(
+            dataset=sterling_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_burke_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Burke Ratio of an investment portfolio or asset's returns.
+
+        The Burke Ratio is a risk-adjusted return metric that divides the excess return (return
+        minus the risk-free rate) of an investment portfolio or asset by the square root of the
+        sum of its squared drawdowns, penalizing both the frequency and depth of drawdowns more
+        heavily than the Calmar or Sterling Ratios.
+
+        The formula is as follows:
+
+        - Burke Ratio = (Return — Risk-Free Rate) / SQRT(SUM(Drawdowns^2))
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the drawdowns within the specified
+            period or for the entire period. Thus whether to look at the drawdowns within a specific
+            year (if period = 'yearly') or look at the entirety of all years. Defaults to True.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Burke Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Burke Ratio for each asset in
+        the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as
+        a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_burke_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.117  | -0.1172 |
+        | 2023   |  0.5201 |  0.4155 |
+        | 2024   |  0.2617 |  0.1765 |
+        | 2025   |  0.0275 |  0.0195 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=within_period)
+
+        burke_drawdown_measure = performance_model.get_burke_drawdown_measure(returns)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+        excess_return = performance_model.get_excess_return(
+            period_returns, self._risk_free_rate_data[period]
+        )
+
+        burke_ratio = performance_model.get_burke_ratio(
+            excess_return, burke_drawdown_measure
+        )
+
+        return finalize_dataset(
+            dataset=burke_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_m2_ratio(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        The M2 Ratio, also known as the Modigliani-Modigliani Measure, is a financial
+        metric used to evaluate the risk-adjusted performance of an investment portfolio
+        or strategy. It assesses the excess return generated by the portfolio relative
+        to a risk-free investment, taking into account the portfolio's volatility or risk.
+        The M2 Ratio helps investors and portfolio managers determine whether the portfolio
+        is delivering returns that justify its level of risk.
+
+        The formula is as follows:
+
+            - M2 Ratio = Risk-Free Rate + [(Portfolio's Return — Risk-Free Rate) /
+              Portfolio Standard Deviation] × Benchmark Standard Deviation
+
+        This rescales the (dimensionless) Sharpe ratio back into return-space by asking
+        what return the portfolio would have earned had it been leveraged or
+        de-leveraged, via risk-free borrowing or lending, to match the benchmark's
+        volatility exactly -- producing a number directly comparable to the benchmark's
+        actual return. Requires a `benchmark_ticker` to be set on the Toolkit instance,
+        since the benchmark's standard deviation is part of the formula.
+
+        See definition: https://en.wikipedia.org/wiki/Modigliani_risk-adjusted_performance
+
+        Also known as: Modigliani-Modigliani measure, M2, risk-adjusted performance.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the calculation. If set,
+            the M2 ratio is calculated over a rolling window of this many periods across the full
+            return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: M2 ratio values.
+
+        Notes:
+        - Daily M2 is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the M2 for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_m2_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.1669 | -0.2118 |
+        | 2023   |  0.3292 |  0.2753 |
+        | 2024   |  0.1906 |  0.1604 |
+        | 2025   |  0.0709 |  0.0637 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        period_returns = self._get_column(period, "Return", within_period=False)
+        benchmark_period_returns = self._get_column(
+            period, "Return", within_period=False, benchmark=True
+        )
+        risk_free_rate = self._risk_free_rate_data[period]
+
+        if rolling:
+            m2_ratio = performance_model.get_rolling_m2_ratio(
+                period_returns, risk_free_rate, benchmark_period_returns, rolling
+            )
+        else:
+            daily_returns = self._get_column("daily", "Return", within_period=False)
+            benchmark_daily_returns = self._get_column(
+                "daily", "Return", within_period=False, benchmark=True
+            )
+            period_standard_deviation = get_volatility(daily_returns, period)
+            benchmark_standard_deviation = get_volatility(
+                benchmark_daily_returns, period
+            )
+
+            m2_ratio = performance_model.get_m2_ratio(
+                period_returns,
+                risk_free_rate,
+                period_standard_deviation,
+                benchmark_standard_deviation,
+            )
+
+        return finalize_dataset(
+            dataset=m2_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_tracking_error(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Tracking Error is a financial metric that quantifies the volatility or dispersion of the
+        difference between the returns of an investment portfolio or asset and the returns of a
+        benchmark index. It measures how closely the portfolio tracks its benchmark and provides
+        insights into the consistency of the portfolio's performance relative to the benchmark.
+        A higher Tracking Error indicates greater divergence from the benchmark, while a lower
+        Tracking Error suggests that the portfolio closely follows the benchmark.
+
+        The formula is as follows:
+
+            - Tracking Error (TE) = Standard Deviation of (Portfolio Returns — Benchmark Returns)
+
+        See definition: https://en.wikipedia.org/wiki/Tracking_error
+
+        Also known as: active risk, benchmark deviation.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the calculation. If set,
+            Tracking Error is calculated over a rolling window of this many periods across the
+            full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Tracking error values.
+
+        Notes:
+        - Daily Tracking Error is not an option as the standard deviation for 1 day is close to zero. Therefore, it does
+        not give any useful insights.
+        - The method retrieves historical data and calculates the TE for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_tracking_error()
+        ```
+
+        Which returns:
+
+        | Date   |   AAPL |   TSLA |
+        |:-------|-------:|-------:|
+        | 2021   | 0.0118 | 0.0316 |
+        | 2022   | 0.0115 | 0.0344 |
+        | 2023   | 0.009  | 0.0304 |
+        | 2024   | 0.0121 | 0.0369 |
+        | 2025   | 0.0139 | 0.0328 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            tracking_error = performance_model.get_rolling_tracking_error(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            tracking_error = performance_model.get_tracking_error(
+                returns, benchmark_returns
+            )
+
+        return finalize_dataset(
+            dataset=tracking_error,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_information_ratio(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        The Information Ratio (IR), also known as the Information Coefficient, is a financial
+        metric that assesses the risk-adjusted performance of a portfolio or investment
+        strategy relative to a benchmark index. It quantifies how much excess return the
+        portfolio generates for each unit of tracking error (volatility of tracking error).
+        The Information Ratio is commonly used by portfolio managers, financial analysts, and
+        investors to evaluate the skill of a portfolio manager in generating returns beyond
+        what would be expected based on the risk taken.
+
+        - IR > 0: A positive Information Ratio indicates that the portfolio has generated
+        excess returns compared to the benchmark, suggesting that the portfolio manager has added value.
+        - IR = 0: An Information Ratio of zero implies that the portfolio's excess return
+        is in line with the benchmark, meaning the portfolio manager has not added or lost value relative
+        to the benchmark.
+        - IR < 0: A negative Information Ratio suggests that the portfolio has underperformed
+        the benchmark, potentially indicating that the portfolio manager has detracted value.
+
+        The formula is as follows:
+
+            - Information Ratio (IR) = (Portfolio's Excess Return — Benchmark's Excess Return) / Tracking Error
+
+        See definition: https://en.wikipedia.org/wiki/Information_ratio
+
+        Also known as: active return per risk.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the calculation. If set,
+            the Information Ratio is calculated over a rolling window of this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Information ratio values.
+
+        Notes:
+        - Daily Information Ratio is not an option as the standard deviation for 1 day is close to zero.
+        Therefore, it does not give any useful insights.
+        - The method retrieves historical data and calculates the IR for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_information_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2021   |  0.0267 |  0.0306 |
+        | 2022   | -0.0253 | -0.0758 |
+        | 2023   |  0.08   |  0.0798 |
+        | 2024   |  0.0208 |  0.0486 |
+        | 2025   | -0.0128 |  0.015  |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            information_ratio = performance_model.get_rolling_information_ratio(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            information_ratio = performance_model.get_information_ratio(
+                returns, benchmark_returns
+            )
+
+        return finalize_dataset(
+            dataset=information_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_upside_capture_ratio(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Upside Capture Ratio of an investment portfolio or asset's returns.
+
+        The Upside Capture Ratio measures how well an investment portfolio or asset performs
+        relative to a benchmark during periods in which the benchmark's return is positive. A
+        ratio above 1 (or 100%) indicates the asset captured more of the benchmark's gains than
+        the benchmark itself.
+
+        The formula is as follows:
+
+        - Upside Capture Ratio = Average Return in Up Periods / Average Benchmark Return in Up Periods
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Upside Capture Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Upside Capture Ratio for each
+        asset in the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_upside_capture_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |   AAPL |   TSLA |
+        |:-------|-------:|-------:|
+        | 2021   | 1.3819 | 2.1068 |
+        | 2022   | 1.3094 | 1.7316 |
+        | 2023   | 1.1825 | 2.3099 |
+        | 2024   | 1.1178 | 2.5882 |
+        | 2025   | 1.0324 | 2.2452 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=True, benchmark=True
+        )
+
+        upside_capture_ratio = performance_model.get_upside_capture_ratio(
+            returns, benchmark_returns
+        )
+
+        return finalize_dataset(
+            dataset=upside_capture_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_downside_capture_ratio(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Downside Capture Ratio of an investment portfolio or asset's returns.
+
+        The Downside Capture Ratio measures how well an investment portfolio or asset performs
+        relative to a benchmark during periods in which the benchmark's return is negative. A
+        ratio below 1 (or 100%) indicates the asset lost less than the benchmark during those
+        periods.
+
+        The formula is as follows:
+
+        - Downside Capture Ratio = Average Return in Down Periods / Average Benchmark Return in Down Periods
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Downside Capture Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Downside Capture Ratio for each
+        asset in the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_downside_capture_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |   AAPL |   TSLA |
+        |:-------|-------:|-------:|
+        | 2021   | 1.422  | 2.2024 |
+        | 2022   | 1.3191 | 2.0483 |
+        | 2023   | 0.9646 | 1.8781 |
+        | 2024   | 1.0487 | 2.4773 |
+        | 2025   | 1.0986 | 2.3391 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=True, benchmark=True
+        )
+
+        downside_capture_ratio = performance_model.get_downside_capture_ratio(
+            returns, benchmark_returns
+        )
+
+        return finalize_dataset(
+            dataset=downside_capture_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_win_rate(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Win Rate of an investment portfolio or asset's returns.
+
+        The Win Rate is the percentage of periods in which the asset's return exceeds the
+        benchmark's return.
+
+        Also known as: batting average.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Win Rate values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Win Rate for each asset in the
+        Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_win_rate()
+        ```
+
+        Which returns:
+
+        | Date   |   AAPL |   TSLA |
+        |:-------|-------:|-------:|
+        | 2021   | 0.4921 | 0.496  |
+        | 2022   | 0.4781 | 0.498  |
+        | 2023   | 0.58   | 0.532  |
+        | 2024   | 0.5    | 0.4683 |
+        | 2025   | 0.472  | 0.468  |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        returns = self._get_column(period, "Return", within_period=True)
+        benchmark_returns = self._get_column(
+            period, "Return", within_period=True, benchmark=True
+        )
+
+        win_rate = performance_model.get_win_rate(returns, benchmark_returns)
+
+        return finalize_dataset(
+            dataset=win_rate,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_kappa_ratio(
+        self,
+        period: str | None = None,
+        order: int = 3,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Kappa Ratio of an investment portfolio or asset's returns.
+
+        The Kappa Ratio is a generalization of the Sortino Ratio that penalizes downside risk
+        using a higher-order lower partial moment. The Sortino Ratio is the special case of the
+        Kappa Ratio with order=2.
+
+        Note that this already subtracts the Risk Free Rate.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            order (int, optional): The order of the lower partial moment used in the denominator.
+            Defaults to 3.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Kappa Ratio values.
+
+        Notes:
+        - Daily Kappa Ratio is not an option as the standard deviation for 1 day is close to zero.
+        Therefore, it does not give any useful insights.
+        - The method retrieves historical data and calculates the Kappa Ratio for each asset in
+        the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as
+        a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_kappa_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2021   |  0.0943 |  0.0653 |
+        | 2022   | -0.0522 | -0.0815 |
+        | 2023   |  0.1288 |  0.1026 |
+        | 2024   |  0.0768 |  0.0749 |
+        | 2025   |  0.0186 |  0.0275 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        excess_return = self._get_column(period, "Excess Return", within_period=True)
+
+        kappa_ratio = performance_model.get_kappa_ratio(excess_return, order)
+
+        return finalize_dataset(
+            dataset=kappa_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_omega_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        rolling: int | None = None,
+        minimum_acceptable_return: float = 0.0,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Omega Ratio of an investment portfolio or asset's returns.
+
+        The Omega Ratio is a risk-return measure that divides the sum of gains above a minimum
+        acceptable return (MAR) by the sum of losses below it, capturing the full shape of the
+        return distribution rather than only its first two moments (unlike the Sharpe Ratio).
+
+        The formula is as follows:
+
+        - Omega Ratio = SUM(Gains above MAR) / SUM(Losses below MAR)
+
+        See definition: https://en.wikipedia.org/wiki/Omega_ratio
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the Omega Ratio within the specified
+            period or for the entire period. Thus whether to look at the Omega Ratio within a specific
+            year (if period = 'yearly') or look at the entirety of all years. Defaults to True.
+            rolling (int, optional): The rolling window size to use for the calculation. If set, the
+            Omega Ratio is calculated over a rolling window of this many periods across the full
+            return history instead of per `period`. Defaults to None.
+            minimum_acceptable_return (float, optional): The minimum acceptable return (MAR) used as
+            the threshold between gains and losses. Defaults to 0.0.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Omega Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Omega Ratio for each asset in
+        the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_omega_ratio()
+        ```
+
+        Which returns:
+
+        |      |   AAPL |   TSLA |
+        |:-----|-------:|-------:|
+        | 2021 | 1.2633 | 1.1824 |
+        | 2022 | 0.8939 | 0.8129 |
+        | 2023 | 1.4113 | 1.3043 |
+        | 2024 | 1.2514 | 1.2098 |
+        | 2025 | 1.0901 | 1.0871 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            omega_ratio = performance_model.get_rolling_omega_ratio(
+                returns, rolling, minimum_acceptable_return
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=within_period)
+
+            omega_ratio = performance_model.get_omega_ratio(
+                returns, minimum_acceptable_return
+            )
+
+        return finalize_dataset(
+            dataset=omega_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_gain_to_pain_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Gain-to-Pain Ratio of an investment portfolio or asset's returns.
+
+        The Gain-to-Pain Ratio, popularized by Jack Schwager, divides the sum of all returns by
+        the sum of the absolute value of all losses, summarizing the entire return history into
+        a single measure of return earned per unit of pain endured.
+
+        The formula is as follows:
+
+        - Gain-to-Pain Ratio = SUM(Returns) / SUM(|Losses|)
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the Gain-to-Pain Ratio within the
+            specified period or for the entire period. Thus whether to look at the Gain-to-Pain Ratio
+            within a specific year (if period = 'yearly') or look at the entirety of all years.
+            Defaults to True.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Gain-to-Pain Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Gain-to-Pain Ratio for each asset
+        in the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_gain_to_pain_ratio()
+        ```
+
+        Which returns:
+
+        |      |    AAPL |    TSLA |
+        |:-----|--------:|--------:|
+        | 2021 |  0.2633 |  0.1824 |
+        | 2022 | -0.1061 | -0.1871 |
+        | 2023 |  0.4113 |  0.3043 |
+        | 2024 |  0.2514 |  0.2098 |
+        | 2025 |  0.0901 |  0.0871 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=within_period)
+
+        gain_to_pain_ratio = performance_model.get_gain_to_pain_ratio(returns)
+
+        return finalize_dataset(
+            dataset=gain_to_pain_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_compound_growth_rate(
+        self,
+        rounding: int | None = None,
+    ):
+        """
+        This function calculates the Compound Growth Rate (CGR) for different periods: yearly, quarterly, monthly,
+        weekly, and daily.
+
+        The CGR is a measure that provides the mean growth rate of an investment over a specified period of time.
+        It is a useful measure for comparing the performance of investments over different time periods or across
+        different asset classes. The CGR is calculated by taking the ratio of the final value to the initial value,
+        raising it to the inverse of the number of periods, and then subtracting one.
+
+        The formula is as follows:
+
+            - CGR = (Final Value / Initial Value) ^ (1 / Number of Periods) — 1
+
+        Also known as: CAGR, compound annual growth rate, annualized return.
+
+        Args:
+            rounding (int, optional): The number of decimals to round the results to. If not provided,
+            the function will use the default rounding value set in the class instance.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the CGR for each period. The DataFrame has the periods
+            as the index and the CGR values as the column.
+
+        Notes:
+        - When verifying the calculation, note that rounding applies and it could be slightly off because of that
+        This is mostly noticeable when looking at the Compound Daily Growth Rate. Adjust the rounding with the
+        rounding parameter accordingly to get a more precise figure.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_compound_growth_rate()
+        ```
+
+        Which returns:
+
+        |                                       |   AAPL |   TSLA |   Benchmark |
+        |:--------------------------------------|-------:|-------:|------------:|
+        | Compound Annual Growth Rate (CAGR)    | 0.1181 | 0.063  |      0.1099 |
+        | Compound Quarterly Growth Rate (CQGR) | 0.0444 | 0.0377 |      0.0325 |
+        | Compound Monthly Growth Rate (CMGR)   | 0.0128 | 0.009  |      0.0116 |
+        | Compound Weekly Growth Rate (CWGR)    | 0.0029 | 0.0016 |      0.0025 |
+        | Compound Daily Growth Rate (CDGR)     | 0.0006 | 0.0005 |      0.0005 |
+        """
+        compound_growth_rates = {}
+
+        for period, label in [
+            ("yearly", "Compound Annual Growth Rate (CAGR)"),
+            ("quarterly", "Compound Quarterly Growth Rate (CQGR)"),
+            ("monthly", "Compound Monthly Growth Rate (CMGR)"),
+            ("weekly", "Compound Weekly Growth Rate (CWGR)"),
+            ("daily", "Compound Daily Growth Rate (CDGR)"),
+        ]:
+            prices = (
+                self._historical_data[period]
+                .loc[:, "Adj Close"]
+                .loc[self._start_date : self._end_date]
+            )
+
+            # N observations span N - 1 compounding intervals, not N.
+            compound_growth_rates[label] = (
+                performance_model.get_compound_growth_rate(prices, len(prices) - 1)
+                if len(prices) > 1
+                else pd.Series(float("nan"), index=prices.columns)
+            )
+
+        compound_growth_rate = pd.DataFrame(compound_growth_rates).T
+
+        compound_growth_rate = apply_rounding(
+            compound_growth_rate, rounding if rounding is not None else self._rounding
+        )
+
+        return compound_growth_rate
+
+    @handle_portfolio
+    @handle_errors
+    def get_returns(
+        self,
+        period: str | None = None,
+        cumulative: bool = False,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Return of an investment portfolio or asset for a given period
+        based on the daily historical returns.
+
+        The period Return is obtained by compounding the daily returns within each
+        period, following the formula:
+
+            - Period Return = ((1 + Return 1) * (1 + Return 2) * ... * (1 + Return N)) - 1
+
+        If cumulative is set to True, the period returns are compounded further into
+        a cumulative return over time instead. The cumulative return is always rebased
+        to start at 1 at the beginning of the selected date range.
+
+        Also known as: periodic return.
+
+        Args:
+            period (str, optional): The data frequency for returns (weekly, monthly, quarterly, or yearly). Defaults
+                to "quarterly" if the Toolkit is initialised with quarterly=True, otherwise "yearly".
+            cumulative (bool, optional): Whether to return the cumulative return over time
+            instead of the discrete return per period. Defaults to False.
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the Return values over time. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.Series: Return values with time as the index.
+
+        Notes:
+        - The method retrieves the daily historical return data and calculates the Return for
+        the specified `period` for each asset in the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of Return values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AMZN", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_returns(period="yearly")
+        ```
+
+        Which returns:
+
+        | Date   |    AMZN |    TSLA |   Benchmark |
+        |:-------|--------:|--------:|------------:|
+        | 2021   |  0.0462 |  0.4488 |      0.3056 |
+        | 2022   | -0.496  | -0.6503 |     -0.1816 |
+        | 2023   |  0.8089 |  1.0174 |      0.2616 |
+        | 2024   |  0.4449 |  0.6255 |      0.2492 |
+        | 2025   |  0.0516 |  0.1129 |      0.1776 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if period not in ["weekly", "monthly", "quarterly", "yearly"]:
+            raise ValueError("Period must be weekly, monthly, quarterly, or yearly.")
+
+        returns = self._historical_data["daily"]["Return"]
+
+        period_returns = performance_model.get_returns(
+            returns, period, cumulative=cumulative
+        ).loc[self._start_date : self._end_date]
+
+        if cumulative:
+            period_returns = period_returns / period_returns.iloc[0]
+
+        return finalize_dataset(
+            dataset=period_returns,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_excess_return(
+        self,
+        period: str | None = None,
+        cumulative: bool = False,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Excess Return of an investment portfolio or asset for a given period
+        based on the daily historical returns.
+
+        The Excess Return is defined as the period Return minus the risk free rate.
+
+        If cumulative is set to True, the excess returns are compounded further into
+        a cumulative excess return over time instead. The cumulative excess return is
+        always rebased to start at 1 at the beginning of the selected date range.
+
+        Also known as: return minus the risk-free rate.
+
+        Args:
+            period (str, optional): The data frequency for returns (weekly, monthly, quarterly, or yearly). Defaults
+                to "quarterly" if the Toolkit is initialised with quarterly=True, otherwise "yearly".
+            cumulative (bool, optional): Whether to return the cumulative excess return over time
+            instead of the discrete excess return per period. Defaults to False.
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the Excess Return values over time.
+            Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.Series: Excess Return values with time as the index.
+
+        Notes:
+        - The method retrieves the daily historical return data and calculates the Excess Return for
+        the specified `period` for each asset in the Toolkit instance.
+        - The risk-free rate is often represented by the return of a risk-free investment, such as a Treasury bond.
+        - If `growth` is set to True, the method calculates the growth of Excess Return values using the
+        specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AMZN", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_excess_return(period="yearly")
+        ```
+
+        Which returns:
+
+        | Date   |    AMZN |    TSLA |   Benchmark |
+        |:-------|--------:|--------:|------------:|
+        | 2021   |  0.0311 |  0.4337 |      0.2905 |
+        | 2022   | -0.5348 | -0.6891 |     -0.2204 |
+        | 2023   |  0.7702 |  0.9787 |      0.2229 |
+        | 2024   |  0.3992 |  0.5798 |      0.2035 |
+        | 2025   |  0.01   |  0.0713 |      0.136  |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if period not in ["weekly", "monthly", "quarterly", "yearly"]:
+            raise ValueError("Period must be weekly, monthly, quarterly, or yearly.")
+
+        returns = self._historical_data["daily"]["Return"]
+        period_returns = performance_model.get_returns(returns, period)
+        risk_free_rate = self._risk_free_rate_data[period]
+
+        excess_return = performance_model.get_excess_return(
+            period_returns, risk_free_rate, cumulative=cumulative
+        ).loc[self._start_date : self._end_date]
+
+        if cumulative:
+            excess_return = excess_return / excess_return.iloc[0]
+
+        return finalize_dataset(
+            dataset=excess_return,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_errors
+    def get_correlation_matrix(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+    ):
+        """
+        Calculate the full pairwise Correlation Matrix across all assets (and the
+        benchmark) in the Toolkit instance, based on the returns at the frequency given
+        by `period`.
+
+        Unlike `get_beta`, which relates a single asset to the benchmark, this computes
+        the correlation between every pair of assets at once. This is a prerequisite for
+        portfolio variance calculations and any mean-variance optimization work.
+
+        Args:
+            period (str, optional): The data frequency for returns (weekly, monthly, quarterly, or yearly). Defaults
+                to "quarterly" if the Toolkit is initialised with quarterly=True, otherwise "yearly".
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+
+        Returns:
+            pd.DataFrame: The N x N Correlation Matrix, with assets as both the index and
+            the columns.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AMZN", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_correlation_matrix()
+        ```
+
+        Which returns:
+
+        |           |   AMZN |   TSLA |   Benchmark |
+        |:----------|-------:|-------:|------------:|
+        | AMZN      | 1      | 0.9985 |      0.912  |
+        | TSLA      | 0.9985 | 1      |      0.9315 |
+        | Benchmark | 0.912  | 0.9315 |      1      |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._historical_data[period]["Return"].loc[
+            self._start_date : self._end_date
+        ]
+
+        correlation_matrix = performance_model.get_correlation_matrix(returns)
+
+        return apply_rounding(
+            correlation_matrix, rounding if rounding is not None else self._rounding
+        )
+
+    @handle_errors
+    def get_covariance_matrix(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+    ):
+        """
+        Calculate the full pairwise Covariance Matrix across all assets (and the
+        benchmark) in the Toolkit instance, based on the returns at the frequency given
+        by `period`.
+
+        Unlike `get_covariance`, which relates a single asset to the benchmark, this
+        computes the covariance between every pair of assets at once. This is a
+        prerequisite for portfolio variance calculations and any mean-variance
+        optimization work.
+
+        Args:
+            period (str, optional): The data frequency for returns (weekly, monthly, quarterly, or yearly). Defaults
+                to "quarterly" if the Toolkit is initialised with quarterly=True, otherwise "yearly".
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+
+        Returns:
+            pd.DataFrame: The N x N Covariance Matrix, with assets as both the index and
+            the columns.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AMZN", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_covariance_matrix()
+        ```
+
+        Which returns:
+
+        |           |   AMZN |   TSLA |   Benchmark |
+        |:----------|-------:|-------:|------------:|
+        | AMZN      | 0.3122 | 0.4018 |      0.1064 |
+        | TSLA      | 0.4018 | 0.5186 |      0.1401 |
+        | Benchmark | 0.1064 | 0.1401 |      0.0436 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._historical_data[period]["Return"].loc[
+            self._start_date : self._end_date
+        ]
+
+        covariance_matrix = performance_model.get_covariance_matrix(returns)
+
+        return apply_rounding(
+            covariance_matrix, rounding if rounding is not None else self._rounding
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_appraisal_ratio(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Appraisal Ratio, i.e. Jensen's Alpha divided by the idiosyncratic
+        (residual, unsystematic) standard deviation left over from the CAPM regression
+        that produced that Alpha.
+
+        Jensen's Alpha (see `get_jensens_alpha`) measures how much return a manager
+        generated above what CAPM would predict given the asset's Beta. However, a large
+        Alpha achieved with wildly noisy, unpredictable residual returns is far less
+        attractive than the same Alpha achieved consistently. The Appraisal Ratio
+        normalizes Alpha by that noise (the "specific risk" not explained by market
+        exposure), giving a Sharpe-ratio-like measure of stock-picking or timing skill per
+        unit of idiosyncratic risk taken.
+
+        The formula is as follows:
+
+        - Appraisal Ratio = Jensen's Alpha / Residual Standard Deviation
+
+        Where the residual standard deviation is the standard deviation of the pointwise
+        CAPM regression residuals (Asset Excess Return − Beta * Benchmark Excess Return),
+        reusing the exact same CAPM regression formula as `get_jensens_alpha`.
+
+        See definition: https://en.wikipedia.org/wiki/Information_ratio
+
+        Also known as: Treynor-Black Appraisal Ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the Beta component of the
+            calculation. If set, Beta is estimated over a rolling window of this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Appraisal Ratio values.
+
+        Notes:
+        - Daily Appraisal Ratio is not an option as the standard deviation for 1 day is close to
+        zero. Therefore, it does not give any useful insights.
+        - The method retrieves historical data and calculates Jensen's Alpha and the CAPM
+        regression residuals for each asset in the Toolkit instance, reusing the same Beta and
+        CAPM formula as `get_jensens_alpha`.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_appraisal_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.0937 | -0.5925 |
+        | 2023   |  1.4388 |  1.0553 |
+        | 2024   |  0.3379 |  0.1715 |
+        | 2025   | -0.5682 | -0.5018 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            beta = performance_model.get_rolling_beta(
+                returns, benchmark_returns, rolling
+            )
+
+            risk_free_rate = self._risk_free_rate_data[period]
+            within_excess_return = performance_model.get_excess_return(
+                returns, risk_free_rate
+            )
+            within_benchmark_excess_return = performance_model.get_excess_return(
+                benchmark_returns, risk_free_rate
+            )
+
+            capm_residuals = performance_model.get_jensens_alpha(
+                within_excess_return, 0.0, beta, within_benchmark_excess_return
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            beta = performance_model.get_beta(returns, benchmark_returns)
+
+            within_excess_return = self._get_column(
+                period, "Excess Return", within_period=True
+            )
+            within_benchmark_excess_return = self._get_column(
+                period, "Excess Return", within_period=True, benchmark=True
+            )
+
+            capm_residuals = performance_model.get_capm_residuals(
+                within_excess_return, beta, within_benchmark_excess_return
+            )
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+
+        risk_free_rate = self._risk_free_rate_data[period]
+        benchmark_period_returns = self._get_column(
+            period, "Return", within_period=False, benchmark=True
+        )
+
+        jensens_alpha = performance_model.get_jensens_alpha(
+            period_returns, risk_free_rate, beta, benchmark_period_returns
+        )
+
+        appraisal_ratio = performance_model.get_appraisal_ratio(
+            jensens_alpha, capm_residuals
+        )
+
+        return finalize_dataset(
+            dataset=appraisal_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_fama_decomposition(
+        self,
+        period: str | None = None,
+        rolling: int | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Fama (1972) decomposition of total excess return into Selectivity
+        and Diversification.
+
+        Jensen's Alpha alone conflates two very different sources of excess return:
+        genuine stock/timing selection skill, and simply carrying more total risk than the
+        market by holding an under-diversified portfolio (which, in a CAPM world, should
+        be compensated with extra return even absent any skill). Fama's decomposition
+        separates the two by comparing the portfolio's actual return against two different
+        CAPM-implied return benchmarks: one using the portfolio's actual Beta (systematic
+        risk only), and one using the portfolio's actual *total* risk ratio
+        (Sigma_Portfolio / Sigma_Market) in place of Beta.
+
+        The formulas are as follows:
+
+        - Selectivity = (Asset Return − Risk-Free Rate) − (Sigma_Portfolio / Sigma_Market)
+            * (Benchmark Return − Risk-Free Rate)
+        - Diversification = [Risk-Free Rate + (Sigma_Portfolio / Sigma_Market)
+            * (Benchmark Return − Risk-Free Rate)] − [Risk-Free Rate + Beta * (Benchmark Return − Risk-Free Rate)]
+
+        Selectivity is the return earned above what would be required for a fully
+        diversified portfolio carrying the same total risk, i.e. genuine security
+        selection or timing skill. Diversification is the extra return the manager left on
+        the table (if positive, it is a cost) by taking on unsystematic risk that a fully
+        diversified portfolio of the same total risk would not have. Selectivity plus
+        Diversification equals Jensen's Alpha (see `get_jensens_alpha`).
+
+        Also known as: Fama's Net Selectivity, Fama performance decomposition.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rolling (int, optional): The rolling window size to use for the Beta component of the
+            calculation. If set, Beta is estimated over a rolling window of this many periods across
+            the full return history instead of per `period`. Defaults to None.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Selectivity and Diversification values, with a Multi Index of
+            (ticker, component) as the columns.
+
+        Notes:
+        - Daily Fama Decomposition is not an option as the standard deviation for 1 day is close
+        to zero. Therefore, it does not give any useful insights.
+        - The method retrieves historical data and calculates Beta, the asset's and benchmark's
+        standard deviation, and the Selectivity and Diversification components for each asset in
+        the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_fama_decomposition().xs("AAPL", level=0, axis=1)
+        ```
+
+        Which returns:
+
+        | Date   |   Selectivity |   Diversification |
+        |:-------|--------------:|------------------:|
+        | 2022   |        0.0219 |           -0.0374 |
+        | 2023   |        0.1048 |            0.0979 |
+        | 2024   |       -0.1051 |            0.1697 |
+        | 2025   |       -0.1773 |            0.0561 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        if rolling:
+            returns = self._get_column(period, "Return", within_period=False)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=False, benchmark=True
+            )
+
+            beta = performance_model.get_rolling_beta(
+                returns, benchmark_returns, rolling
+            )
+        else:
+            returns = self._get_column(period, "Return", within_period=True)
+            benchmark_returns = self._get_column(
+                period, "Return", within_period=True, benchmark=True
+            )
+
+            beta = performance_model.get_beta(returns, benchmark_returns)
+
+        period_returns = self._get_column(period, "Return", within_period=False)
+        risk_free_rate = self._risk_free_rate_data[period]
+        benchmark_period_returns = self._get_column(
+            period, "Return", within_period=False, benchmark=True
+        )
+
+        daily_returns = self._get_column("daily", "Return", within_period=False)
+        daily_benchmark_returns = self._get_column(
+            "daily", "Return", within_period=False, benchmark=True
+        )
+
+        asset_standard_deviation = get_volatility(daily_returns, period)
+        benchmark_standard_deviation = get_volatility(daily_benchmark_returns, period)
+
+        selectivity, diversification = performance_model.get_fama_decomposition(
+            period_returns,
+            risk_free_rate,
+            beta,
+            benchmark_period_returns,
+            asset_standard_deviation,
+            benchmark_standard_deviation,
+        )
+
+        fama_decomposition = pd.concat(
+            {"Selectivity": selectivity, "Diversification": diversification}, axis=1
+        ).swaplevel(0, 1, axis=1)
+
+        fama_decomposition = fama_decomposition.reindex(
+            self._tickers_without_portfolio, level=0, axis=1
+        )
+
+        return finalize_dataset(
+            dataset=fama_decomposition,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_starr_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        alpha: float = 0.05,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the STARR (Stable Tail Adjusted Return Ratio) of an investment
+        portfolio or asset's returns.
+
+        The Sharpe ratio penalizes upside and downside volatility equally via the
+        standard deviation. The STARR ratio instead scales the mean excess return by the
+        Conditional Value at Risk (CVaR / Expected Shortfall), a coherent tail-risk
+        measure that only looks at the average magnitude of losses beyond the `alpha`
+        quantile. This makes STARR more appropriate than the Sharpe ratio for return
+        distributions with fat left tails.
+
+        The formula is as follows:
+
+        - STARR Ratio = Excess Return / |CVaR(alpha)|
+
+        See definition: https://en.wikipedia.org/wiki/Expected_shortfall
+
+        Also known as: Stable Tail Adjusted Return Ratio, Conditional Sharpe Ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the CVaR within the specified
+            period or for the entire period. Thus whether to look at the CVaR within a specific
+            year (if period = 'yearly') or look at the entirety of all years. Defaults to True.
+            alpha (float, optional): The confidence level used for the CVaR calculation (e.g. 0.05
+            for the worst 5% of outcomes). Defaults to 0.05.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: STARR Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the STARR Ratio for each asset in
+        the Toolkit instance.
+        - Periods with very few return observations (e.g. a partial period at the very start of
+        the selected date range) can produce a degenerate (e.g. zero or ±infinite) CVaR, since
+        CVaR is not a meaningful statistic with only one or two data points. This mirrors the
+        analogous caveat for the Sharpe Ratio needing enough observations for its standard
+        deviation to be meaningful.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_starr_ratio()
+        ```
+
+        Which returns:
+
+        | Date   |    AAPL |    TSLA |
+        |:-------|--------:|--------:|
+        | 2022   | -0.4259 | -0.4759 |
+        | 2023   |  1.0764 |  0.8716 |
+        | 2024   |  0.5567 |  0.4707 |
+        | 2025   |  0.0677 |  0.0554 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=within_period)
+        period_returns = self._get_column(period, "Return", within_period=False)
+        risk_free_rate = self._risk_free_rate_data[period]
+
+        excess_return = performance_model.get_excess_return(
+            period_returns, risk_free_rate
+        )
+
+        starr_ratio = performance_model.get_starr_ratio(excess_return, returns, alpha)
+
+        return finalize_dataset(
+            dataset=starr_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_rachev_ratio(
+        self,
+        period: str | None = None,
+        within_period: bool = True,
+        alpha: float = 0.05,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Rachev Ratio (R-Ratio) of an investment portfolio or asset's
+        returns.
+
+        The Rachev ratio compares the "quality" of the best outcomes to the "quality" of
+        the worst outcomes by taking the ratio of the right-tail Expected Shortfall (the
+        average of the best `alpha` fraction of returns) to the left-tail Expected
+        Shortfall (the average magnitude of the worst `alpha` fraction of returns). A
+        ratio above 1 indicates that the average size of extreme gains outweighs the
+        average size of extreme losses.
+
+        The formula is as follows:
+
+        - Rachev Ratio = ES_right(alpha) / ES_left(alpha)
+
+        Also known as: R-Ratio.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            within_period (bool, optional): Whether to calculate the Rachev Ratio within the
+            specified period or for the entire period. Thus whether to look at the return
+            distribution within a specific year (if period = 'yearly') or look at the entirety of
+            all years. Defaults to True.
+            alpha (float, optional): The confidence level used for both tails (e.g. 0.05 for the
+            best/worst 5% of outcomes). Defaults to 0.05.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Rachev Ratio values.
+
+        Notes:
+        - The method retrieves historical data and calculates the Rachev Ratio for each asset in
+        the Toolkit instance.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using
+        the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_rachev_ratio()
+        ```
+
+        Which returns:
+
+        |      |   AAPL |   TSLA |
+        |:-----|-------:|-------:|
+        | 2022 | 1.0786 | 0.9469 |
+        | 2023 | 1.0743 | 1.1169 |
+        | 2024 | 1.1441 | 1.3081 |
+        | 2025 | 1.0735 | 1.0925 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+
+        returns = self._get_column(period, "Return", within_period=within_period)
+
+        rachev_ratio = performance_model.get_rachev_ratio(returns, alpha)
+
+        return finalize_dataset(
+            dataset=rachev_ratio,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_treynor_mazuy_model(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Treynor-Mazuy market timing model for each asset in the Toolkit
+        instance.
+
+        Jensen's Alpha and Beta from a plain CAPM regression cannot distinguish
+        stock-picking skill (selectivity) from market-timing skill (shifting exposure
+        ahead of market moves). The Treynor-Mazuy model adds a quadratic term in the
+        benchmark excess return to the regression: a manager who successfully increases
+        (decreases) market exposure ahead of up (down) markets will show a return profile
+        that curves upward as a function of the benchmark return, captured by a positive
+        quadratic coefficient (Gamma).
+
+        The formula is as follows:
+
+        - Excess Return = Alpha + Beta * Benchmark Excess Return + Gamma * Benchmark Excess Return^2 + Residuals
+
+        Gamma > 0 indicates positive market-timing ability; Gamma <= 0 indicates no
+        timing ability.
+
+        Also known as: Treynor-Mazuy quadratic timing model, TM model.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Alpha, Beta, Gamma and R Squared values, with a Multi Index of
+            (ticker, parameter) as the columns.
+
+        Notes:
+        - Daily and weekly Treynor-Mazuy results are not an option as there would be too few
+        observations within each period to run a meaningful regression.
+        - The method retrieves historical data and performs a quadratic regression for each asset
+        in the Toolkit instance, within each period.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_treynor_mazuy_model().xs("AAPL", level=0, axis=1)
+        ```
+
+        Which returns:
+
+        |      |   Alpha |   Beta |   Gamma |   R Squared |
+        |:-----|--------:|-------:|--------:|------------:|
+        | 2021 | -0.0007 | 1.3263 |  9.8102 |      0.4698 |
+        | 2022 | -0.0007 | 1.3052 |  2.7524 |      0.7847 |
+        | 2023 | -0.0003 | 1.0941 | 14.403  |      0.5256 |
+        | 2024 |  0.0009 | 0.9439 | -9.4418 |      0.2941 |
+        | 2025 | -0.0005 | 1.2229 |  1.6316 |      0.5689 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        excess_return = self._get_column(period, "Excess Return", within_period=True)
+        benchmark_excess_return = self._get_column(
+            period, "Excess Return", within_period=True, benchmark=True
+        )
+
+        logger.info("Calculating Treynor-Mazuy Market Timing Model")
+
+        regression_results: dict[str, pd.DataFrame] = {}
+
+        for ticker in self._tickers_without_portfolio:
+            ticker_results: dict = {}
+
+            for sub_period in excess_return.index.get_level_values(0).unique():
+                asset_excess = excess_return.loc[sub_period, ticker]
+                benchmark_excess = benchmark_excess_return.loc[sub_period]
+
+                result, _ = performance_model.get_treynor_mazuy_model(
+                    asset_excess, benchmark_excess
+                )
+                ticker_results[sub_period] = result
+
+            regression_results[ticker] = pd.DataFrame.from_dict(
+                ticker_results, orient="index"
+            )
+
+        treynor_mazuy_model = pd.concat(regression_results, axis=1)
+
+        return finalize_dataset(
+            dataset=treynor_mazuy_model,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
+
+    @handle_portfolio
+    @handle_errors
+    def get_henriksson_merton_model(
+        self,
+        period: str | None = None,
+        rounding: int | None = None,
+        growth: bool = False,
+        lag: int | list[int] = 1,
+        standardize: bool = False,
+    ):
+        """
+        Calculate the Henriksson-Merton market timing model for each asset in the
+        Toolkit instance.
+
+        Like the Treynor-Mazuy model (see `get_treynor_mazuy_model`), this separates
+        market-timing skill from selectivity, but models timing as a piecewise (rather
+        than quadratic) change in Beta: a "down-market" Beta and an "up-market" Beta.
+
+        The formula is as follows:
+
+        - Excess Return = Alpha + Beta * Benchmark Excess Return
+            + Up Market Beta * max(Benchmark Excess Return, 0) + Residuals
+
+        Beta is the "down-market" Beta (the portfolio's market exposure when the
+        benchmark excess return is negative), and Beta + Up Market Beta is the
+        "up-market" Beta. Up Market Beta > 0 indicates positive market-timing ability;
+        Up Market Beta <= 0 indicates no timing ability.
+
+        Also known as: Henriksson-Merton piecewise timing model, HM model.
+
+        Args:
+            period (str, optional): The period to use for the calculation. Defaults to "quarterly" if the Toolkit is
+                initialised with quarterly=True, otherwise "yearly".
+            rounding (int, optional): The number of decimals to round the results to. Defaults to 4.
+            growth (bool, optional): Whether to calculate the growth of the ratios. Defaults to False.
+            lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            standardize (bool, optional): Whether to standardize (Z-Score) the result. When
+                combined with growth=True, standardizes the growth values instead of the raw
+                values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Alpha, Beta, Up Market Beta and R Squared values, with a Multi Index of
+            (ticker, parameter) as the columns.
+
+        Notes:
+        - Daily and weekly Henriksson-Merton results are not an option as there would be too few
+        observations within each period to run a meaningful regression.
+        - The method retrieves historical data and performs a piecewise regression for each asset
+        in the Toolkit instance, within each period.
+        - If `growth` is set to True, the method calculates the growth of the ratio values using the specified `lag`.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(
+            ["AAPL", "TSLA"],
+            api_key="FINANCIAL_MODELING_PREP_KEY",
+            start_date="2021-01-01",
+            end_date="2025-12-31",
+        )
+
+        toolkit.performance.get_henriksson_merton_model().xs("AAPL", level=0, axis=1)
+        ```
+
+        Which returns:
+
+        |      |   Alpha |   Beta |   Up Market Beta |   R Squared |
+        |:-----|--------:|-------:|-----------------:|------------:|
+        | 2021 | -0.0005 | 1.2449 |           0.1476 |      0.4661 |
+        | 2022 | -0.0011 | 1.22   |           0.1684 |      0.784  |
+        | 2023 | -0.0006 | 0.9024 |           0.3969 |      0.5214 |
+        | 2024 |  0.0013 | 1.1395 |          -0.3574 |      0.2927 |
+        | 2025 | -0.0009 | 1.1728 |           0.1513 |      0.5669 |
+        """
+        period = period if period else "quarterly" if self._quarterly else "yearly"
+        excess_return = self._get_column(period, "Excess Return", within_period=True)
+        benchmark_excess_return = self._get_column(
+            period, "Excess Return", within_period=True, benchmark=True
+        )
+
+        logger.info("Calculating Henriksson-Merton Market Timing Model")
+
+        regression_results: dict[str, pd.DataFrame] = {}
+
+        for ticker in self._tickers_without_portfolio:
+            ticker_results: dict = {}
+
+            for sub_period in excess_return.index.get_level_values(0).unique():
+                asset_excess = excess_return.loc[sub_period, ticker]
+                benchmark_excess = benchmark_excess_return.loc[sub_period]
+
+                result, _ = performance_model.get_henriksson_merton_model(
+                    asset_excess, benchmark_excess
+                )
+                ticker_results[sub_period] = result
+
+            regression_results[ticker] = pd.DataFrame.from_dict(
+                ticker_results, orient="index"
+            )
+
+        henriksson_merton_model = pd.concat(regression_results, axis=1)
+
+        return finalize_dataset(
+            dataset=henriksson_merton_model,
+            start_date=self._start_date,
+            end_date=self._end_date,
+            default_rounding=self._rounding,
+            growth=growth,
+            lag=lag,
+            rounding=rounding,
+            standardize=standardize,
+            axis="rows",
+            row_slice=True,
+            dropna=True,
+        )
@@ -4,605 +4,3888 @@ template for other projects as it is directly related to the project structure a
 generated.
 """
 
+import argparse
+import ast
 import base64
+import cProfile
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import pstats
+import random
 import re
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import tokenize
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from string import Template
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import pygments
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import PythonLexer
+except ImportError:
+    pygments = None
+
+# The source of a controller, as bytes (usually memory-mapped) when it is streamed
+SourceContent = str | bytes | mmap.mmap
+
+
+class DiskCache:
+    """
+    Directory of JSON entries keyed by a string, capped in size by evicting the least
+    recently used entries first.
+    """
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+        )
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+
+        try:
+            with open(path, encoding="utf-8") as file:
+                entry = json.load(file)
+
+            # Mark the entry as recently used for the eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            # Also when the entry is evicted in between, by another thread or process
+            return None
+
+        return entry
+
+    def put(self, key: str, entry: dict, evict: bool = True):
+        with self._lock:
+            # Atomically, as the build processes share the cache
+            write_file_if_changed(
+                self._path(key), json.dumps(entry, ensure_ascii=False)
+            )
 
+            if evict:
+                self.evict()
 
-def create_markdown_file(file_url: str, header: str, location: str):
-    response = requests.get(file_url)
-    data = response.json()
+    def evict(self):
+        entries = [entry for entry in os.scandir(self.directory) if entry.is_file()]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        total_size = sum(entry.stat().st_size for entry in entries)
 
-    file_content = base64.b64decode(data["content"]).decode("utf-8")
+        for entry in entries:
+            if total_size <= self.max_size:
+                break
 
-    functions_with_docstrings = []
-    function_matches = re.findall(
-        r"def\s+(\w+)\([\s\S]*?\"\"\"([\s\S]*?)\"\"\"", file_content
-    )
+            total_size -= entry.stat().st_size
 
-    if function_matches:
-        for match in function_matches:
-            function_name, docstring = match
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
 
-            # Description
-            description_match = re.match(
-                r"([\s\S]*?)(?:Args:|As an example:|$)", docstring, re.DOTALL
-            )
-            description = description_match.group(1) if description_match else ""
-            description = re.sub(
-                r"(https?://\S+)", r'[\1](\1){:target="_blank"}', description
-            )
 
-            # Arguments
-            arguments_match = re.search(
-                r"(Args:[\s\S]*?)(```python|$)", docstring, re.DOTALL
-            )
-            arguments = arguments_match.group(1) if arguments_match else ""
-            arguments = re.sub(
-                r"(https?://\S+)", r'[\1](\1){:target="_blank"}', arguments
-            )
+class ResponseCache(DiskCache):
+    """
+    On-disk cache of the GitHub contents API responses keyed by URL. Next to the decoded
+    source it stores the ETag and blob sha so unchanged files can be revalidated with a
+    conditional request (a 304 costs neither bandwidth nor rate limit). The cache is
+    capped in size, evicting the least recently used entries first, and can be used in
+    an offline "cache-only" mode in which no requests are made at all.
+    """
 
-            # Define the regular expression pattern
-            pattern = re.compile(r"\w+ \([^)]+\):")
+    def __init__(
+        self,
+        directory: str = ".docs-cache",
+        max_size: int = 50 * 1024 * 1024,
+        cache_only: bool = False,
+    ):
+        super().__init__(directory, max_size)
+        self.cache_only = cache_only
 
-            # Function to replace matches with <u>...</u>
-            def replace_match(match):
-                return f"- <u>{match.group(0)}</u>"
+    def set(self, url: str, etag: str | None, sha: str | None, content: str):
+        self.put(url, {"url": url, "etag": etag, "sha": sha, "content": content})
 
-            # Use the pattern with re.sub to replace matches
-            arguments = pattern.sub(replace_match, arguments)
 
-            # Extract example code block
-            example_code_match = re.search(
-                r"```python([\s\S]*?)```", docstring, re.DOTALL
-            )
-            example_code = example_code_match.group(1) if example_code_match else ""
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_file(location: str) -> str | None:
+    try:
+        with open(location, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def git_blob_sha(text: SourceContent) -> str:
+    """Compute the sha GitHub reports for a file with this content."""
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    sha = hashlib.sha1(b"blob %d\0" % len(data))
+    sha.update(data)
+
+    return sha.hexdigest()
+
 
-            # Extract example result
-            example_result_match = re.search(
-                r"Which returns:[\s\S]*$", docstring, re.DOTALL
+class AtomicWriter:
+    """
+    Streams chunks to a temporary file that, on commit, is moved into place (atomically)
+    only when its content differs from what is already on disk, so that Jekyll's
+    watcher does not pick up files that did not actually change. In a dry run nothing
+    is written and only the hash of the content is compared.
+    """
+
+    def __init__(self, location: str, dry_run: bool = False):
+        self.location = location
+        self.content_hash = hashlib.sha256()
+        self.file = None
+
+        if not dry_run:
+            directory = os.path.dirname(location) or "."
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, self.temporary_location = tempfile.mkstemp(
+                dir=directory, suffix=".tmp"
+            )
+            self.file = os.fdopen(file_descriptor, "wb")
+
+    def __enter__(self) -> "AtomicWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.file:
+            self.file.close()
+            os.remove(self.temporary_location)
+
+    def write(self, chunks: Iterable[str]):
+        for chunk in chunks:
+            self.write_bytes(chunk.encode("utf-8"))
+
+    def write_bytes(self, data: bytes):
+        self.content_hash.update(data)
+
+        if self.file:
+            self.file.write(data)
+
+    def commit(self) -> bool:
+        """Returns whether the file was (or, in a dry run, would be) written."""
+        changed = self.content_hash.hexdigest() != hash_file(self.location)
+
+        if self.file:
+            self.file.close()
+            self.file = None
+
+            if changed:
+                os.chmod(self.temporary_location, 0o644)
+                os.replace(self.temporary_location, self.location)
+            else:
+                os.remove(self.temporary_location)
+
+        return changed
+
+
+def write_stream_if_changed(
+    location: str, chunks: Iterable[str], dry_run: bool = False
+) -> bool:
+    with AtomicWriter(location, dry_run) as writer:
+        writer.write(chunks)
+
+        return writer.commit()
+
+
+def write_file_if_changed(location: str, content: str) -> bool:
+    return write_stream_if_changed(location, [content])
+
+
+class BuildManifest:
+    """
+    Records for each generated page the blob sha of its source, a hash of its header
+    and of the generator itself and a hash of each of its outputs. When none of these
+    changed (and the outputs on disk are still what was generated) the page can be
+    skipped.
+    """
+
+    generator_hash = hash_file(__file__)
+
+    def __init__(
+        self, location: str = ".docs-manifest.json", pages: dict | None = None
+    ):
+        self.location = location
+
+        if pages is not None:
+            self.pages = pages
+            return
+
+        try:
+            with open(location, encoding="utf-8") as file:
+                self.pages = json.load(file)
+        except (OSError, ValueError):
+            self.pages = {}
+
+    def is_up_to_date(
+        self,
+        key: str,
+        source_sha: str,
+        header_hash: str,
+        locations: list[str] | None = None,
+    ) -> bool:
+        """
+        The locations can be left out for outputs of which the number of files depends
+        on the source, these are then determined by the previous build.
+        """
+        entry = self.pages.get(key)
+
+        return (
+            entry is not None
+            and entry["source_sha"] == source_sha
+            and entry["header_hash"] == header_hash
+            and entry["generator_hash"] == self.generator_hash
+            and (
+                locations is None or sorted(entry["output_hashes"]) == sorted(locations)
             )
-            example_result = (
-                example_result_match.group(0) if example_result_match else ""
+            and all(
+                output_hash == hash_file(location)
+                for location, output_hash in entry["output_hashes"].items()
             )
+        )
+
+    def locations(self, key: str) -> list[str]:
+        return list(self.pages.get(key, {}).get("output_hashes", {}))
+
+    def update(self, key: str, source_sha: str, header_hash: str, locations: list[str]):
+        self.pages[key] = {
+            "source_sha": source_sha,
+            "header_hash": header_hash,
+            "generator_hash": self.generator_hash,
+            "output_hashes": {location: hash_file(location) for location in locations},
+        }
+
+    def save(self):
+        write_file_if_changed(
+            self.location, json.dumps(self.pages, indent=4, sort_keys=True) + "\n"
+        )
+
+
+class BuildProfile:
+    """
+    Collects the wall time of each stage of the build (fetch, decode, parse, render
+    and write) together with counters such as the bytes in and out, the number of
+    functions parsed and the cache hits. Metrics are kept per key, which is the path
+    of the controller of a page, or an empty key for work that is shared by all pages.
+    The stages of pages that are built at the same time overlap, so their totals are
+    summed across the workers and can exceed the wall time of the build ("build").
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, metric: str, value: float = 1):
+        with self._lock:
+            metrics = self.metrics.setdefault(key, {})
+            metrics[metric] = metrics.get(metric, 0) + value
+
+    @contextmanager
+    def measure(self, key: str, stage: str):
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(key, f"{stage}_time", time.perf_counter() - start)
+
+    def merge(self, metrics: dict[str, dict[str, float]]):
+        """Add the metrics of a build that ran elsewhere, e.g. in another process."""
+        for key, values in metrics.items():
+            for metric, value in values.items():
+                self.add(key, metric, value)
+
+    def rename(self, key: str, new_key: str):
+        with self._lock:
+            if key in self.metrics:
+                self.metrics[new_key] = self.metrics.pop(key)
+
+    def report(self) -> dict[str, dict[str, float]]:
+        total: dict[str, float] = {}
+
+        for metrics in self.metrics.values():
+            for metric, value in metrics.items():
+                total[metric] = total.get(metric, 0) + value
+
+        return {**self.metrics, "total": total}
+
+
+class RequestScheduler:
+    """
+    Paces the requests to the GitHub API with a token bucket and waits for the rate
+    limit to reset instead of failing the build. The X-RateLimit headers of every
+    response tell how many requests remain and when the limit resets, a Retry-After
+    header (secondary rate limits) takes precedence. Server errors and dropped
+    connections are retried with an exponential backoff with full jitter.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_wait: float = 3600.0,
+        token: str | None = None,
+        timeout: float = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self.token = token
+        self.timeout = timeout
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be made."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                wait = self.paused_until - now
+
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+
+                    return
+
+                if wait <= 0:
+                    wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+    def retry_time(self, response: requests.Response, attempt: int = 0) -> float:
+        """
+        Return how long to wait before the next request according to the rate limit
+        headers of the response, or zero when the limit has not been reached. A
+        Retry-After header that is neither seconds nor a date falls back to the backoff.
+        """
+        retry_after = response.headers.get("Retry-After")
+
+        if retry_after:
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                pass
+
+            try:
+                return max(
+                    parsedate_to_datetime(retry_after).timestamp() - time.time(), 0
+                )
+            except (TypeError, ValueError):
+                return self.backoff_time(attempt)
+
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+
+        if remaining == "0" and reset:
+            return max(float(reset) - time.time(), 0) + 1
+
+        return 0
+
+    def backoff_time(self, attempt: int) -> float:
+        return random.uniform(0, self.backoff * 2**attempt)
+
+    def get(
+        self,
+        session: requests.Session,
+        url: str,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Make a GET request once the scheduler allows it, retrying when throttled or
+        when the server fails. The last response is returned when it keeps failing.
+        """
+        headers = dict(headers or {})
+
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            last_attempt = attempt == self.max_retries
+
+            try:
+                response = session.get(
+                    url, headers=headers, timeout=self.timeout, stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+
+                time.sleep(self.backoff_time(attempt))
+                continue
+
+            wait = self.retry_time(response, attempt)
+
+            if wait:
+                # Hold back all other requests as well until the limit resets
+                with self._lock:
+                    self.paused_until = max(
+                        self.paused_until, time.monotonic() + min(wait, self.max_wait)
+                    )
+
+            if response.status_code in (403, 429) and (
+                wait or response.status_code == 429
+            ):
+                if last_attempt or wait > self.max_wait:
+                    return response
+
+                if not wait:
+                    time.sleep(self.backoff_time(attempt))
+
+                continue
+
+            if response.status_code >= 500 and not last_attempt:
+                time.sleep(self.backoff_time(attempt))
+                continue
+
+            return response
+
+        return response
+
 
-            functions_with_docstrings.append(
-                {
-                    "function_name": function_name,
-                    "description": re.sub(" +", " ", description.strip())
-                    .replace("\n ", " ")  # Deal with new lines due to PEP line length
-                    .replace("\n ", "\n\n")  # Allow for proper spacing
-                    .replace("-", "\n-")  # Create lists based on the dashes
-                    .replace("—", "-"),  # Replace the em dash that was used in formulas
-                    "arguments": re.sub(" +", " ", arguments.strip()),
-                    "example_code": re.sub(" +", " ", example_code.strip()).replace(
-                        "\n ", "\n"
-                    ),
-                    "example_result": re.sub(" +", " ", example_result.strip()),
-                }
+def create_session(max_connections: int = 8) -> requests.Session:
+    """
+    Create a keep-alive session whose connection pool is large enough to serve all
+    concurrent fetches without opening (and TLS handshaking) a new connection per file.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def fetch_file_content(
+    file_url: str,
+    session: requests.Session | None = None,
+    cache: ResponseCache | None = None,
+    profile: BuildProfile | None = None,
+    scheduler: RequestScheduler | None = None,
+) -> str:
+    profile = profile or BuildProfile()
+    session = session or requests.Session()
+    cached = cache.get(file_url) if cache else None
+
+    if cache and cache.cache_only:
+        if cached is None:
+            raise FileNotFoundError(f"{file_url} is not available in the cache.")
+
+        profile.add(file_url, "cache_hits")
+
+        return cached["content"]
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached["etag"] else {}
+
+    with profile.measure(file_url, "fetch"):
+        if scheduler:
+            response = scheduler.get(session, file_url, headers)
+        else:
+            response = session.get(file_url, headers=headers)
+
+    profile.add(file_url, "requests")
+    profile.add(file_url, "bytes_in", len(response.content))
+
+    if cached and response.status_code == 304:
+        profile.add(file_url, "cache_hits")
+
+        return cached["content"]
+
+    # Fail before any page is written instead of on a missing "content" key
+    response.raise_for_status()
+
+    with profile.measure(file_url, "decode"):
+        data = response.json()
+        file_content = base64.b64decode(data["content"]).decode("utf-8")
+
+    if cache:
+        cache.set(file_url, response.headers.get("ETag"), data.get("sha"), file_content)
+
+    return file_content
+
+
+def fetch_file_stream(
+    file_url: str,
+    session: requests.Session | None = None,
+    profile: BuildProfile | None = None,
+    scheduler: RequestScheduler | None = None,
+) -> bytes | mmap.mmap:
+    """
+    Download the raw file in chunks to a temporary file and return it memory-mapped,
+    so that the content is never held in memory as a whole (nor as base64 or JSON).
+    """
+    profile = profile or BuildProfile()
+    session = session or requests.Session()
+    headers = {"Accept": "application/vnd.github.raw"}
+
+    with profile.measure(file_url, "fetch"):
+        if scheduler:
+            response = scheduler.get(session, file_url, headers, stream=True)
+        else:
+            response = session.get(file_url, headers=headers, stream=True)
+
+        with response, tempfile.TemporaryFile() as file:
+            response.raise_for_status()
+
+            # Servers that do not support the raw media type answer with the JSON
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                file.write(base64.b64decode(response.json()["content"]))
+            else:
+                for chunk in response.iter_content(64 * 1024):
+                    file.write(chunk)
+
+            file.flush()
+            size = file.tell()
+
+            profile.add(file_url, "requests")
+            profile.add(file_url, "bytes_in", size)
+
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+
+def fetch_file_contents(
+    file_urls: list[str],
+    max_workers: int = 8,
+    cache: ResponseCache | None = None,
+    profile: BuildProfile | None = None,
+    scheduler: RequestScheduler | None = None,
+    stream: bool = False,
+) -> dict[str, SourceContent]:
+    """
+    Fetch all files at the same time over a single pooled session. The total time is
+    therefore bound by the slowest request instead of the sum of all requests. When
+    streaming, the files are memory-mapped and the response cache is not used.
+    """
+    max_workers = max(1, min(max_workers, len(file_urls)))
+
+    with create_session(max_workers) as session, ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor:
+        file_contents = executor.map(
+            lambda file_url: (
+                fetch_file_stream(file_url, session, profile, scheduler)
+                if stream
+                else fetch_file_content(file_url, session, cache, profile, scheduler)
+            ),
+            file_urls,
+        )
+
+        return dict(zip(file_urls, file_contents))
+
+
+class SourceBackend:
+    """
+    Provides the source of the controllers by their path relative to the root of the
+    FinanceToolkit repository.
+    """
+
+    def read_files(
+        self, paths: list[str], profile: BuildProfile | None = None
+    ) -> dict[str, SourceContent]:
+        raise NotImplementedError
+
+    def read_versions(
+        self,
+        paths: list[str],
+        refs: list[str],
+        profile: BuildProfile | None = None,
+    ) -> dict[str, dict[str, SourceContent]]:
+        """
+        Provide the files at each of the refs. Files that are the same blob at several
+        refs are only read once.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} can not read multiple versions at once."
+        )
+
+
+class MemorySource(SourceBackend):
+    """Provides files that were already read, e.g. one version of read_versions."""
+
+    def __init__(self, file_contents: dict[str, SourceContent]):
+        self.file_contents = file_contents
+
+    def read_files(
+        self, paths: list[str], profile: BuildProfile | None = None
+    ) -> dict[str, SourceContent]:
+        return {path: self.file_contents[path] for path in paths}
+
+
+class GitHubContentsSource(SourceBackend):
+    """Fetches each file separately (and concurrently) through the contents API."""
+
+    def __init__(
+        self,
+        repository: str = "JerBouma/FinanceToolkit",
+        ref: str | None = None,
+        base_url: str = "https://api.github.com",
+        max_workers: int = 8,
+        cache: ResponseCache | None = None,
+        scheduler: RequestScheduler | None = None,
+        stream: bool = False,
+    ):
+        self.repository = repository
+        self.ref = ref
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.cache = cache
+        self.scheduler = scheduler or RequestScheduler()
+        self.stream = stream
+
+    def file_url(self, path: str) -> str:
+        file_url = f"{self.base_url}/repos/{self.repository}/contents/{path}"
+
+        return f"{file_url}?ref={self.ref}" if self.ref else file_url
+
+    def read_files(
+        self, paths: list[str], profile: BuildProfile | None = None
+    ) -> dict[str, SourceContent]:
+        profile = profile or BuildProfile()
+        file_urls = [self.file_url(path) for path in paths]
+        file_contents = fetch_file_contents(
+            file_urls,
+            self.max_workers,
+            self.cache,
+            profile,
+            self.scheduler,
+            self.stream,
+        )
+
+        for path in paths:
+            profile.rename(self.file_url(path), path)
+
+        return {path: file_contents[self.file_url(path)] for path in paths}
+
+    def read_versions(
+        self,
+        paths: list[str],
+        refs: list[str],
+        profile: BuildProfile | None = None,
+    ) -> dict[str, dict[str, SourceContent]]:
+        """
+        Look up the blob of every path at every ref through the trees API and fetch
+        each distinct blob once. Blobs never change, so cached blobs are not requested
+        again at all.
+        """
+        profile = profile or BuildProfile()
+        repository_url = f"{self.base_url}/repos/{self.repository}"
+        shas: dict[str, dict[str, str]] = {}
+
+        with create_session(1) as session:
+            for ref in refs:
+                with profile.measure("", "fetch"):
+                    response = self.scheduler.get(
+                        session, f"{repository_url}/git/trees/{ref}?recursive=1"
+                    )
+                    response.raise_for_status()
+
+                profile.add("", "requests")
+                tree = {item["path"]: item["sha"] for item in response.json()["tree"]}
+                missing = set(paths).difference(tree)
+
+                if missing:
+                    raise FileNotFoundError(
+                        f"{', '.join(sorted(missing))} not found at {ref}."
+                    )
+
+                shas[ref] = {path: tree[path] for path in paths}
+
+        blob_urls = {
+            sha: f"{repository_url}/git/blobs/{sha}"
+            for file_shas in shas.values()
+            for sha in file_shas.values()
+        }
+        cached = {}
+
+        if self.cache and not self.stream:
+            for sha, blob_url in blob_urls.items():
+                entry = self.cache.get(blob_url)
+
+                if entry is not None:
+                    cached[blob_url] = entry["content"]
+                    profile.add("", "cache_hits")
+
+        blobs = {
+            **cached,
+            **fetch_file_contents(
+                [url for url in blob_urls.values() if url not in cached],
+                self.max_workers,
+                self.cache,
+                profile,
+                self.scheduler,
+                self.stream,
+            ),
+        }
+
+        return {
+            ref: {path: blobs[blob_urls[sha]] for path, sha in file_shas.items()}
+            for ref, file_shas in shas.items()
+        }
+
+
+class ArchiveSource(SourceBackend):
+    """
+    Reads all files from a single tarball or zipball of the repository, either
+    downloaded from GitHub at a pinned ref or taken from a local archive file. The
+    archive is read in memory and never extracted to disk.
+    """
+
+    def __init__(
+        self,
+        location: str | None = None,
+        repository: str = "JerBouma/FinanceToolkit",
+        ref: str = "main",
+        base_url: str = "https://api.github.com",
+        scheduler: RequestScheduler | None = None,
+    ):
+        self.location = (
+            location or f"{base_url.rstrip('/')}/repos/{repository}/tarball/{ref}"
+        )
+        self.scheduler = scheduler or RequestScheduler()
+
+    def read_archive(self) -> bytes:
+        if os.path.isfile(self.location):
+            with open(self.location, "rb") as file:
+                return file.read()
+
+        with create_session(1) as session:
+            response = self.scheduler.get(session, self.location)
+            response.raise_for_status()
+
+            return response.content
+
+    def read_files(
+        self, paths: list[str], profile: BuildProfile | None = None
+    ) -> dict[str, SourceContent]:
+        profile = profile or BuildProfile()
+
+        # The archive is shared by all pages and is therefore recorded under the build
+        with profile.measure("", "fetch"):
+            archive = io.BytesIO(self.read_archive())
+
+        profile.add("", "bytes_in", len(archive.getbuffer()))
+        wanted = set(paths)
+        file_contents = {}
+
+        # GitHub archives wrap the repository in a single "<owner>-<repo>-<sha>" folder
+        if zipfile.is_zipfile(archive):
+            with zipfile.ZipFile(archive) as zip_file:
+                for name in zip_file.namelist():
+                    path = name.split("/", 1)[-1]
+
+                    if path in wanted:
+                        with profile.measure(path, "decode"):
+                            file_contents[path] = zip_file.read(name).decode("utf-8")
+        else:
+            archive.seek(0)
+
+            with tarfile.open(fileobj=archive, mode="r:*") as tar_file:
+                for member in tar_file:
+                    path = member.name.split("/", 1)[-1]
+
+                    if member.isfile() and path in wanted:
+                        with profile.measure(path, "decode"):
+                            file_contents[path] = (
+                                tar_file.extractfile(member).read().decode("utf-8")
+                            )
+
+        missing = wanted.difference(file_contents)
+
+        if missing:
+            raise FileNotFoundError(
+                f"{', '.join(sorted(missing))} not found in {self.location}."
             )
 
-    markdown_content = header
+        return file_contents
+
+
+class LocalSource(SourceBackend):
+    """
+    Reads the files directly from a local checkout of the repository, or memory-maps
+    them so that they are streamed from disk while the docstrings are extracted.
+    """
+
+    def __init__(self, directory: str, memory_map: bool = False):
+        self.directory = directory
+        self.memory_map = memory_map
+
+    def read_files(
+        self, paths: list[str], profile: BuildProfile | None = None
+    ) -> dict[str, SourceContent]:
+        profile = profile or BuildProfile()
+        file_contents = {}
+
+        for path in paths:
+            location = os.path.join(self.directory, path)
+
+            with profile.measure(path, "fetch"):
+                if self.memory_map:
+                    with open(location, "rb") as file:
+                        file_contents[path] = (
+                            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                            if os.fstat(file.fileno()).st_size
+                            else b""
+                        )
+                else:
+                    with open(location, encoding="utf-8") as file:
+                        file_contents[path] = file.read()
+
+            profile.add(
+                path,
+                "bytes_in",
+                len(
+                    file_contents[path].encode("utf-8")
+                    if isinstance(file_contents[path], str)
+                    else file_contents[path]
+                ),
+            )
 
-    for function_info in functions_with_docstrings:
-        markdown_content += f'## {function_info["function_name"]}\n'
-        markdown_content += f'{function_info["description"]}\n\n'
+        return file_contents
+
+    def read_versions(
+        self,
+        paths: list[str],
+        refs: list[str],
+        profile: BuildProfile | None = None,
+    ) -> dict[str, dict[str, SourceContent]]:
+        """
+        Read the files at each of the refs from the git history of the checkout. Every
+        distinct blob is only read once.
+        """
+        profile = profile or BuildProfile()
+        shas: dict[str, dict[str, str]] = {}
+
+        for ref in refs:
+            tree = {}
+
+            for line in self.git("ls-tree", "-r", ref, "--", *paths).splitlines():
+                info, path = line.split("\t", 1)
+                tree[path] = info.split()[2]
+
+            missing = set(paths).difference(tree)
+
+            if missing:
+                raise FileNotFoundError(
+                    f"{', '.join(sorted(missing))} not found at {ref}."
+                )
+
+            shas[ref] = {path: tree[path] for path in paths}
+
+        blobs = {}
+
+        for file_shas in shas.values():
+            for path, sha in file_shas.items():
+                if sha not in blobs:
+                    with profile.measure(path, "fetch"):
+                        blobs[sha] = self.git("cat-file", "blob", sha)
+
+                    profile.add(path, "bytes_in", len(blobs[sha].encode("utf-8")))
+
+        return {
+            ref: {path: blobs[sha] for path, sha in file_shas.items()}
+            for ref, file_shas in shas.items()
+        }
+
+    def git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", self.directory, *args],
+            check=True,
+            capture_output=True,
+            encoding="utf-8",
+        ).stdout
+
+
+def create_source(
+    source: str = "github",
+    location: str | None = None,
+    ref: str | None = None,
+    max_workers: int = 8,
+    cache: ResponseCache | None = None,
+    scheduler: RequestScheduler | None = None,
+    stream: bool = False,
+) -> SourceBackend:
+    if source == "github":
+        return GitHubContentsSource(
+            ref=ref,
+            base_url=location or "https://api.github.com",
+            max_workers=max_workers,
+            cache=cache,
+            scheduler=scheduler,
+            stream=stream,
+        )
+    if source == "archive":
+        if stream:
+            raise ValueError("Archives are read in memory and can not be streamed.")
+
+        return ArchiveSource(location, ref=ref or "main", scheduler=scheduler)
+    if source == "local":
+        return LocalSource(location or "../FinanceToolkit", memory_map=stream)
+
+    raise ValueError(f"Unknown source {source}, choose github, archive or local.")
+
+
+DESCRIPTION_PATTERN = re.compile(r"([\s\S]*?)(?:Args:|As an example:|$)")
+ARGUMENTS_PATTERN = re.compile(r"(Args:[\s\S]*?)(```python|$)")
+ARGUMENT_NAME_PATTERN = re.compile(r"\w+ \([^)]+\):")
+EXAMPLE_CODE_PATTERN = re.compile(r"```python([\s\S]*?)```")
+EXAMPLE_RESULT_PATTERN = re.compile(r"Which returns:[\s\S]*$")
+URL_PATTERN = re.compile(r"(https?://\S+)")
+SPACES_PATTERN = re.compile(" +")
+TABLE_ALIGNMENT_PATTERN = re.compile(r":?-+:?")
+
+# Code, existing links and URLs are matched as a whole so that names inside them are
+# skipped, a name that is the only content of a code span is linked including the span
+SYMBOL_PATTERN = re.compile(
+    r"```[\s\S]*?```|\[[^\]]*\]\([^)]*\)(?:\{:[^}]*\})?|https?://\S+"
+    r"|(`?)\b([a-z]\w*_\w+)\b\1|`[^`\n]*`"
+)
+SYMBOL_NAME_PATTERN = re.compile(r"\b[a-z]\w*_\w+\b")
+
+CATEGORY_PATTERN = re.compile(r"collect_(?!all_)(\w+)_[a-z]+$")
+SEARCH_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SEARCH_MARKUP_PATTERN = re.compile(r"https?://[^\s\])]+|\{:[^}]*\}|<[^>]+>")
+# Like Kramdown, a fence is only opened when it is followed by at most one word
+FENCE_PATTERN = re.compile(r" {0,3}(`{3,}|~{3,})[ \t]*[^\s`]*[ \t]*$")
+HEADING_PATTERN = re.compile(r" {0,3}#{1,6}[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+HEADING_ID_PATTERN = re.compile(r"\s*\{:?\s*#([\w-]+)[^}]*\}$")
+ID_PATTERN = re.compile(r"""\b(?:id|name)=["']([^"'{}]+)["']""")
+LINK_PATTERN = re.compile(r"""\]\(\s*<?([^)\s>]+)|\bhref=["']([^"']+)["']""")
+# Jekyll drops these characters from the names of data files
+DATA_NAME_PATTERN = re.compile(r"[^\w\s-]+")
+NAVIGATION_URL_PATTERN = re.compile(r"""^[ \t-]*url:[ \t]*["']?([^\s"']+)""", re.M)
+
+INDEX_DIRECTORY = "assets/docs/financetoolkit"
+SEARCH_DIRECTORY = f"{INDEX_DIRECTORY}/search"
+TABLE_DIRECTORY = f"{INDEX_DIRECTORY}/tables"
+DOCS_PERMALINK = "/projects/financetoolkit/docs"
+NAVIGATION_LOCATION = "_data/navigation.yml"
+NAVIGATION_DIRECTORY = "_data/docs_navigation"
+TITLE_SMALL_WORDS = set("a an and at by for in of on or per the to vs".split())
+TITLE_ACRONYMS = set(
+    "adx atr capm cpi cvar dcf ebit ebitda ebt eps esg etf ev evar fcf gdp macd obv "
+    "pe peg roa roce roe roic rsi sga var wacc ytm".split()
+)
 
-        if function_info["arguments"]:
-            markdown_content += (
-                (function_info["arguments"])
-                .replace("Args:", "**Args:**")
-                .replace("Raises:", "**Raises:**")
-                .replace("Returns:", "**Returns:**")
-                .replace("Notes:", "**Notes:**")
-            )
-            markdown_content += "\n"
 
-        if function_info["example_code"]:
-            markdown_content += "{% include code_header.html %}\n"
-            markdown_content += "{% highlight python %}\n"
-            markdown_content += function_info["example_code"]
-            markdown_content += "\n{% endhighlight %}\n\n"
+def create_signature(node: ast.AST) -> str:
+    if isinstance(node, ast.ClassDef):
+        return f"{node.name}({', '.join(map(ast.unparse, node.bases))})"
+
+    signature = f"{node.name}({ast.unparse(node.args)})"
+
+    if node.returns:
+        signature += f" -> {ast.unparse(node.returns)}"
+
+    return signature
+
+
+def extract_docstrings(file_content: SourceContent) -> Iterator[dict]:
+    """
+    Walk the module once and yield every class and method that has a docstring,
+    including its signature. Function bodies are not descended into so that nested
+    helpers are skipped, and functions without a docstring are left out entirely.
+
+    The docstring is sliced from the source as it is written (rather than taking the
+    evaluated string from the AST) so that escape sequences are kept as they are.
+
+    Sources that are given as (memory-mapped) bytes are streamed through the
+    tokenizer instead, see stream_docstrings.
+    """
+    if not isinstance(file_content, str):
+        if isinstance(file_content, mmap.mmap):
+            file_content.seek(0)
+            yield from stream_docstrings(file_content.readline)
+        else:
+            yield from stream_docstrings(io.BytesIO(file_content).readline)
+
+        return
+
+    source = file_content.encode("utf-8")
+    line_offsets = [0]
+
+    for line in source.splitlines(keepends=True):
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    def raw_docstring(node: ast.AST) -> str | None:
+        if not (
+            node.body
+            and isinstance(node.body[0], ast.Expr)
+            and isinstance(node.body[0].value, ast.Constant)
+            and isinstance(node.body[0].value.value, str)
+        ):
+            return None
+
+        constant = node.body[0].value
+        literal = source[
+            line_offsets[constant.lineno - 1]
+            + constant.col_offset : line_offsets[constant.end_lineno - 1]
+            + constant.end_col_offset
+        ].decode("utf-8")
+        literal = literal.lstrip("rRuUbB")
+        quote = literal[:3] if literal[:3] in ('"""', "'''") else literal[0]
+
+        return literal[len(quote) : -len(quote)]
+
+    nodes = list(reversed(ast.parse(file_content).body))
+
+    while nodes:
+        node = nodes.pop()
+
+        if isinstance(node, ast.ClassDef):
+            nodes.extend(reversed(node.body))
+        elif not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        docstring = raw_docstring(node)
+
+        if docstring is not None:
+            yield {
+                "type": "class" if isinstance(node, ast.ClassDef) else "function",
+                "name": node.name,
+                "signature": create_signature(node),
+                "docstring": docstring,
+            }
+
+
+def stream_docstrings(readline: Callable[[], bytes]) -> Iterator[dict]:
+    """
+    Yield the same entries as extract_docstrings from a stream of source lines, one
+    docstring at a time. Only the tokens of the current line and the header of the
+    current class or function are held in memory, never the whole module or its AST.
+
+    Classes and functions count only when they are a statement of the module or of a
+    class body, which is tracked by the indentation depth of every class and function
+    whose body is being read.
+    """
+    scopes: list[tuple[str, int]] = []
+    depth = 0
+    header: list[tokenize.TokenInfo] | None = None
+    brackets = 0
+    entry: dict | None = None
+    block = False
+    docstring: tokenize.TokenInfo | None = None
+    statement_start = True
+
+    for token in tokenize.tokenize(readline):
+        if token.type in (tokenize.ENCODING, tokenize.COMMENT, tokenize.NL):
+            continue
+
+        if docstring is not None:
+            # A string followed by anything but the end of the statement is no docstring
+            if token.type in (tokenize.NEWLINE, tokenize.ENDMARKER) or (
+                token.type == tokenize.OP and token.string == ";"
+            ):
+                literal = docstring.string.lstrip("rRuU")
+                quote = literal[:3] if literal[:3] in ('"""', "'''") else literal[0]
+                yield {**entry, "docstring": literal[len(quote) : -len(quote)]}
+
+            docstring = entry = None
+
+        if header is not None:
+            header.append(token)
+
+            if len(header) == 2 and header[0].string == "async":
+                if token.string != "def":
+                    header = None
+            elif token.type == tokenize.OP and token.string in "([{":
+                brackets += 1
+            elif token.type == tokenize.OP and token.string in ")]}":
+                brackets -= 1
+            elif token.type == tokenize.OP and token.string == ":" and not brackets:
+                # Only the header is parsed, to normalise the signature like the AST does
+                start_row, start_column = header[0].start
+                text = tokenize.untokenize(
+                    (
+                        part.type,
+                        part.string,
+                        (
+                            part.start[0] - start_row + 1,
+                            part.start[1]
+                            - (start_column if part.start[0] == start_row else 0),
+                        ),
+                        (
+                            part.end[0] - start_row + 1,
+                            part.end[1]
+                            - (start_column if part.end[0] == start_row else 0),
+                        ),
+                        part.line,
+                    )
+                    for part in header
+                )
+                node = ast.parse(f"{text} pass").body[0]
+                entry = {
+                    "type": "class" if isinstance(node, ast.ClassDef) else "function",
+                    "name": node.name,
+                    "signature": create_signature(node),
+                }
+                header = None
+                block = False
+
+            continue
+
+        if entry is not None and docstring is None:
+            if token.type == tokenize.NEWLINE:
+                block = statement_start = True
+
+                continue
+
+            if token.type == tokenize.INDENT:
+                depth += 1
+                scopes.append((entry["type"], depth))
+
+                continue
+
+            # The first statement of the body decides whether there is a docstring
+            if token.type == tokenize.STRING and not set(
+                token.string[: token.string.index(token.string[-1])].lower()
+            ).intersection("bf"):
+                docstring = token
+            else:
+                entry = None
+
+            if not block:
+                statement_start = False
+
+                continue
+
+        if token.type == tokenize.INDENT:
+            depth += 1
+        elif token.type == tokenize.DEDENT:
+            depth -= 1
+
+            while scopes and scopes[-1][1] > depth:
+                scopes.pop()
+        elif (
+            token.type == tokenize.NAME
+            and token.string in ("class", "def", "async")
+            and statement_start
+            and depth == (scopes[-1][1] if scopes else 0)
+            and all(scope != "function" for scope, _ in scopes)
+        ):
+            header = [token]
+            brackets = 0
+
+        statement_start = token.type in (
+            tokenize.NEWLINE,
+            tokenize.INDENT,
+            tokenize.DEDENT,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionInfo:
+    """
+    The parsed docstring of a function. The digest identifies the raw docstring (see
+    RenderCache), the anchor and category depend on the rest of the module.
+    """
+
+    function_name: str
+    description: str
+    arguments: str
+    example_code: str
+    example_result: str
+    anchor: str = ""
+    category: str = "general"
+    digest: str = ""
+
+
+def parse_docstring(function_name: str, docstring: str) -> FunctionInfo:
+    # Description
+    description_match = DESCRIPTION_PATTERN.match(docstring)
+    description = description_match.group(1) if description_match else ""
+    description = URL_PATTERN.sub(r'[\1](\1){:target="_blank"}', description)
+
+    # Arguments
+    arguments_match = ARGUMENTS_PATTERN.search(docstring)
+    arguments = arguments_match.group(1) if arguments_match else ""
+    arguments = URL_PATTERN.sub(r'[\1](\1){:target="_blank"}', arguments)
+
+    # Underline the argument names and types and turn them into a list
+    arguments = ARGUMENT_NAME_PATTERN.sub(
+        lambda match: f"- <u>{match.group(0)}</u>", arguments
+    )
+
+    # Extract example code block
+    example_code_match = EXAMPLE_CODE_PATTERN.search(docstring)
+    example_code = example_code_match.group(1) if example_code_match else ""
+
+    # Extract example result
+    example_result_match = EXAMPLE_RESULT_PATTERN.search(docstring)
+    example_result = example_result_match.group(0) if example_result_match else ""
+
+    return FunctionInfo(
+        function_name=function_name,
+        description=SPACES_PATTERN.sub(" ", description.strip())
+        .replace("\n ", " ")  # Deal with new lines due to PEP line length
+        .replace("\n ", "\n\n")  # Allow for proper spacing
+        .replace("-", "\n-")  # Create lists based on the dashes
+        .replace("—", "-"),  # Replace the em dash that was used in formulas
+        arguments=SPACES_PATTERN.sub(" ", arguments.strip()),
+        example_code=SPACES_PATTERN.sub(" ", example_code.strip()).replace("\n ", "\n"),
+        example_result=SPACES_PATTERN.sub(" ", example_result.strip()),
+    )
 
-        if function_info["example_result"]:
-            example_result = (
-                function_info["example_result"].replace("Which returns:", "").strip()
+
+def parse_table(text: str) -> dict | None:
+    """
+    Parse a markdown table into its columns, the alignment of each column and its rows,
+    or return None when the text is anything other than a single well-formed table.
+    """
+    lines = [line.strip() for line in text.strip().split("\n")]
+
+    if len(lines) < 2 or not all(
+        line.startswith("|") and line.endswith("|") for line in lines
+    ):
+        return None
+
+    columns, alignment, *rows = [
+        [cell.strip() for cell in line[1:-1].split("|")] for line in lines
+    ]
+
+    if not all(TABLE_ALIGNMENT_PATTERN.fullmatch(cell) for cell in alignment) or any(
+        len(row) != len(columns) for row in [alignment, *rows]
+    ):
+        return None
+
+    return {
+        "columns": columns,
+        "align": [
+            (
+                "center"
+                if cell.startswith(":") and cell.endswith(":")
+                else "right" if cell.endswith(":") else "left"
+            )
+            for cell in alignment
+        ],
+        "rows": rows,
+    }
+
+
+def create_anchor(name: str, anchors: dict[str, int]) -> str:
+    """
+    Create the id that Kramdown (with GFM input) gives the heading of a function,
+    including the numbered suffix it adds when a heading occurs more than once.
+    """
+    anchor = re.sub(r"[^\w\- ]", "", name.lower()).replace(" ", "-")
+    count = anchors.get(anchor, 0)
+    anchors[anchor] = count + 1
+
+    return f"{anchor}-{count}" if count else anchor
+
+
+def create_file_name(anchor: str) -> str:
+    """
+    Jekyll skips files of which the name starts with an underscore, so these are
+    stripped from the anchor (e.g. __init__) when a file is named after a function.
+    """
+    return anchor.strip("_") or anchor
+
+
+class SymbolLinker:
+    """
+    Turns the names of the functions of all modules into links to their documentation
+    wherever they are mentioned. The text is scanned once for identifiers that are
+    looked up in the symbol table, so linking is linear in the length of the text
+    regardless of the number of symbols. Only names with an underscore are linked,
+    which leaves ordinary words and argument names alone.
+
+    The targets are relative to the root of the (versioned) documentation and the
+    links are made against a marker that resolve replaces with that root. The linked
+    markdown of a docstring is therefore the same for every version and only changes
+    with the symbols that the docstring mentions, which keeps it in the render cache.
+    """
+
+    root_marker = "\0docs\0"
+
+    def __init__(self, symbols: dict[str, str], root: str = DOCS_PERMALINK):
+        self.symbols = symbols
+        self.root = root
+        self.digest = hash_text(json.dumps([symbols, root], sort_keys=True))
+
+    @classmethod
+    def from_sources(
+        cls, pages: list["Page"], file_contents: dict[str, SourceContent]
+    ) -> "SymbolLinker":
+        """
+        Build the symbol table from the functions of every page, in the order of the
+        pages, so that a name that occurs in several modules links to the first one.
+        The pages are all of the same version.
+        """
+        root = versioned_directory(DOCS_PERMALINK, pages[0].version if pages else None)
+        symbols: dict[str, str] = {}
+
+        for page in pages:
+            anchors: dict[str, int] = {}
+            location = page.permalink.removeprefix(root)
+
+            for entry in extract_docstrings(file_contents[page.path]):
+                if entry["type"] == "function":
+                    anchor = create_anchor(entry["name"], anchors)
+                    symbols.setdefault(entry["name"], f"{location}#{anchor}")
+
+        return cls(symbols, root)
+
+    def links_digest(self, text: str) -> str:
+        """Identifies the links in the text, unlike digest only the symbols it mentions."""
+        names = set(SYMBOL_NAME_PATTERN.findall(text)) & self.symbols.keys()
+
+        return hash_text(
+            json.dumps([(name, self.symbols[name]) for name in sorted(names)])
+        )
+
+    def link(self, text: str, exclude: str | None = None) -> str:
+        def replace_symbol(match: re.Match) -> str:
+            name = match.group(2)
+
+            if name is None or name == exclude or name not in self.symbols:
+                return match.group(0)
+
+            return f"[{match.group(0)}]({self.root_marker}{self.symbols[name]})"
+
+        return SYMBOL_PATTERN.sub(replace_symbol, text)
+
+    def resolve(self, markdown: str) -> str:
+        return markdown.replace(self.root_marker, self.root)
+
+
+def parse_functions(
+    file_content: SourceContent,
+    cache: "RenderCache | None" = None,
+    renderer: "MarkdownRenderer | None" = None,
+) -> Iterator[FunctionInfo]:
+    """
+    Parse the functions of the controller in order. The controllers group their
+    functions per category, each group starting with its collect function (e.g.
+    collect_efficiency_ratios), which is used to assign a category to every function.
+    With a cache, only the docstrings that were not seen before are parsed (and
+    rendered with the markdown renderer).
+    """
+    renderer = renderer or MarkdownRenderer("")
+    anchors: dict[str, int] = {}
+    category = "general"
+
+    for entry in extract_docstrings(file_content):
+        if entry["type"] == "function":
+            category_match = CATEGORY_PATTERN.match(entry["name"])
+
+            if category_match:
+                category = category_match.group(1)
+
+            if cache:
+                function_info = cache.parse(entry["name"], entry["docstring"], renderer)
+            else:
+                function_info = parse_docstring(entry["name"], entry["docstring"])
+
+            yield replace(
+                function_info,
+                anchor=create_anchor(entry["name"], anchors),
+                category=category,
             )
-            markdown_content += f"\nWhich returns:\n\n{example_result}\n\n"
 
-    # Save to a file
-    with open(location, "w", encoding="utf-8") as file:
-        file.write(markdown_content)
 
+class Renderer:
+    """
+    Turns the stream of parsed functions into a stream of output chunks. Subclasses
+    define the output format, the pipeline itself never holds the whole page.
+    """
 
-# Create Docs page
-markdown_content = """---
-title: Documentation
-excerpt: This the documentation of the FinanceToolkit. This is an open-source toolkit in which 150+ financial ratios, indicators and performance measurements are written down in the most simplistic way allowing for complete transparency of the calculation method.
-description: This the documentation of the FinanceToolkit. This is an open-source toolkit in which 150+ financial ratios, indicators and performance measurements are written down in the most simplistic way allowing for complete transparency of the calculation method.
-author_profile: false
-permalink: /projects/financetoolkit/docs
-classes: wide-sidebar
-layout: single
-redirect_from:
-- /docs
-sidebar:
-    nav: "financetoolkit-docs"
----
+    def render_header(self) -> Iterator[str]:
+        yield from ()
 
-This page includes all the documentation for the Finance Toolkit, an open-source toolkit in which all relevant financial ratios (150+), indicators and performance measurements are written down in the most simplistic way allowing for complete transparency of the calculation method. Each functionality includes an example of how to use it and is therefore an excellent way to better understand how to use each functionality. These examples are also directly embedded in the code. For simplicity sake, only the controller modules are included here given that the models themselves should be relatively straightforward. Make sure to also have a look at the example notebooks as found [here](/projects/financetoolkit#how-to-guides-for-the-financetoolkit).
+    def render_function(self, function_info: "FunctionInfo") -> Iterator[str]:
+        raise NotImplementedError
 
-To install the FinanceToolkit it simply requires the following:
+    def render_footer(self) -> Iterator[str]:
+        yield from ()
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+    def close(self):
+        """Called once rendering finished or failed, to release any resources."""
 
-The Toolkit Module is meant to be a collection of useful functions that collect and parse data. These are historical data, fundamental data (balance, income and cash flow statements) as well as several others metrics from Financial Modeling Prep like enterprise values, company profiles and more. From this module, you are able to access the related modules as well.
+    def render(self, functions: Iterable["FunctionInfo"]) -> Iterator[str]:
+        yield from self.render_header()
 
-If you are looking for documentation regarding the discovery, ratios, models, technical indicators, fixed income, risk metrics, performance metrics and economic indicators, please have a look below:
+        for function_info in functions:
+            yield from self.render_function(function_info)
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+        yield from self.render_footer()
 
 
-{% include algolia.html %}
+class MarkdownRenderer(Renderer):
+    """
+    Renders the module as a single markdown page. With a table directory, example
+    results that are a table are written to a JSON file per function and the page only
+    gets a collapsed placeholder that loads the table when it is opened. With a
+    highlighter, the example code is inserted as highlighted HTML rather than being
+    highlighted by Jekyll.
+    """
 
-"""
+    def __init__(
+        self,
+        header: str,
+        cache: "RenderCache | None" = None,
+        table_directory: str | None = None,
+        dry_run: bool = False,
+        linker: SymbolLinker | None = None,
+        highlighter: "CodeHighlighter | None" = None,
+    ):
+        self.header = header
+        self.cache = cache
+        self.table_directory = table_directory
+        self.dry_run = dry_run
+        self.linker = linker
+        self.highlighter = highlighter
+        self.has_tables = False
+        self.has_code = False
+        self.outputs: dict[str, bool] = {}
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/toolkit_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/docs.md",
-)
+    @property
+    def digest(self) -> str:
+        """
+        Identifies the options that change the markdown of a function, the symbols
+        that the function links to are added by the render cache.
+        """
+        return hash_text(f"{self.linker is not None}{self.highlighter is not None}")
 
-# Create the Discovery page
-markdown_content = """---
-title: Discovery
-excerpt: The Discovery Module contains lists of companies, cryptocurrencies, forex, commodities, etfs and indices including screeners, quotes, performance metrics and more to find and select tickers to use in the Finance Toolkit.
-description: The Discovery Module contains lists of companies, cryptocurrencies, forex, commodities, etfs and indices including screeners, quotes, performance metrics and more to find and select tickers to use in the Finance Toolkit.
-author_profile: false
-permalink: /projects/financetoolkit/docs/discovery
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /ratios
-sidebar:
-    nav: "financetoolkit-docs-discovery"
----
+    def render_header(self) -> Iterator[str]:
+        yield self.header
 
-The Discovery Module contains lists of companies, cryptocurrencies, forex, commodities, etfs and indices including screeners, quotes, performance metrics and more to find and select tickers to use in the Finance Toolkit.
+    def render_function(self, function_info: "FunctionInfo") -> Iterator[str]:
+        fragment = self.cache.fragment(function_info) if self.cache else None
+        chunks = self.render_markdown(function_info) if fragment is None else [fragment]
 
-To install the FinanceToolkit it simply requires the following:
+        if self.linker:
+            chunks = map(self.linker.resolve, chunks)
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+        yield from chunks
 
-If you are looking for documentation regarding the toolkit, ratios, models, technicals, fixed income, risk, performance and economics, please have a look below:
+        if self.highlighter and function_info.example_code:
+            self.has_code = True
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+        yield from self.render_result(function_info)
 
-{% include algolia.html %}
+    def render_footer(self) -> Iterator[str]:
+        if self.has_code:
+            yield f"\n{CodeHighlighter.script}\n"
 
-"""
+        if self.has_tables:
+            yield "\n{% include docs_table.html %}\n"
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/discovery/discovery_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/discovery.md",
-)
+    def render_result(self, function_info: "FunctionInfo") -> Iterator[str]:
+        if not function_info.example_result:
+            return
 
-# Create the Ratios page
-markdown_content = """---
-title: Ratios
-excerpt: The Ratios Module contains over 50+ ratios that can be used to analyse companies. These ratios are divided into 5 categories which are efficiency, liquidity, profitability, solvency and valuation. Each ratio is calculated using the data from the Toolkit module.
-description: The Ratios Module contains over 50+ ratios that can be used to analyse companies. These ratios are divided into 5 categories which are efficiency, liquidity, profitability, solvency and valuation. Each ratio is calculated using the data from the Toolkit module.
-author_profile: false
-permalink: /projects/financetoolkit/docs/ratios
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /ratios
-sidebar:
-    nav: "financetoolkit-docs-ratios"
----
+        example_result = function_info.example_result.replace(
+            "Which returns:", ""
+        ).strip()
+        table = parse_table(example_result) if self.table_directory else None
 
-The Ratios Module contains over 50+ ratios that can be used to analyse companies. These ratios are divided into 5 categories which are efficiency, liquidity, profitability, solvency and valuation. Each ratio is calculated using the data from the Toolkit module.
+        if table is None:
+            yield f"\nWhich returns:\n\n{example_result}\n\n"
 
-To install the FinanceToolkit it simply requires the following:
+            return
+
+        location = (
+            f"{self.table_directory}/{create_file_name(function_info.anchor)}.json"
+        )
+
+        with AtomicWriter(location, self.dry_run) as writer:
+            writer.write(
+                [json.dumps(table, ensure_ascii=False, separators=(",", ":")), "\n"]
+            )
+            self.outputs[location] = writer.commit()
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+        self.has_tables = True
+        url = "{{ '/" + location + "' | relative_url }}"
 
-If you are looking for documentation regarding the toolkit, discovery, models, technicals, fixed income, risk, performance and economics, please have a look below:
+        yield "\nWhich returns:\n\n"
+        yield f'<details class="docs-table" data-src="{url}">'
+        yield f"<summary>Show the table ({len(table['rows'])} rows)</summary>"
+        yield "</details>\n\n"
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+    def render_markdown(self, function_info: "FunctionInfo") -> Iterator[str]:
+        description, arguments = function_info.description, function_info.arguments
 
-{% include algolia.html %}
+        if self.linker:
+            description = self.linker.link(description, function_info.function_name)
+            arguments = self.linker.link(arguments, function_info.function_name)
 
-"""
+        yield f"## {function_info.function_name}\n"
+        yield f"{description}\n\n"
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/ratios/ratios_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/ratios.md",
-)
+        if arguments:
+            yield (
+                arguments.replace("Args:", "**Args:**")
+                .replace("Raises:", "**Raises:**")
+                .replace("Returns:", "**Returns:**")
+                .replace("Notes:", "**Notes:**")
+            )
+            yield "\n"
+
+        if function_info.example_code and self.highlighter:
+            yield self.highlighter.highlight(function_info.example_code)
+            yield "\n"
+        elif function_info.example_code:
+            yield "{% include code_header.html %}\n"
+            yield "{% highlight python %}\n"
+            yield function_info.example_code
+            yield "\n{% endhighlight %}\n\n"
+
+
+class SplitMarkdownRenderer(MarkdownRenderer):
+    """
+    Splits a module into a page per function or per category. The module page itself
+    becomes a lightweight index that keeps a (short) section for every function, so
+    that existing links to its anchors keep working, and that redirects readers that
+    land on such an anchor to the page the function moved to.
+    """
+
+    def __init__(
+        self,
+        header: str,
+        page: "Page",
+        split: str,
+        dry_run: bool = False,
+        cache: "RenderCache | None" = None,
+        table_directory: str | None = None,
+        linker: SymbolLinker | None = None,
+        highlighter: "CodeHighlighter | None" = None,
+    ):
+        super().__init__(header, cache, table_directory, dry_run, linker, highlighter)
+        self.page = page
+        self.split = split
+        self.category = None
+        self.key = None
+        self.writer: AtomicWriter | None = None
+        self.redirects: dict[str, str] = {}
+
+    def open(self, key: str, title: str, excerpt: str):
+        self.commit()
+        self.key = key
+        self.writer = AtomicWriter(
+            f"{self.page.location[:-3]}/{self.split}/{key}.md", self.dry_run
+        )
+        self.writer.write(
+            [
+                "---\n",
+                # Quoted, as a docstring can contain anything that YAML reads as syntax
+                f"title: {json.dumps(title, ensure_ascii=False)}\n",
+                f"excerpt: {json.dumps(excerpt, ensure_ascii=False)}\n",
+                "author_profile: false\n",
+                f"permalink: {self.permalink(key)}\n",
+                "classes: wide-sidebar\n",
+                "layout: single\n",
+                "sidebar:\n",
+                f'    nav: "{self.page.sidebar}"\n',
+                "---\n\n",
+                f"This is part of the documentation of the [{self.page.title}]"
+                f"({self.page.permalink}) module of the Finance Toolkit.\n\n",
+            ]
+        )
+
+    def commit(self):
+        if self.writer:
+            self.writer.write(super().render_footer())
+            self.has_tables = self.has_code = False
+            self.outputs[self.writer.location] = self.writer.commit()
+            self.writer = None
+
+    def close(self):
+        if self.writer:
+            self.writer.__exit__(None, None, None)
+            self.writer = None
+
+    def permalink(self, key: str) -> str:
+        return f"{self.page.permalink}/{self.split}/{key}"
+
+    def render_function(self, function_info: "FunctionInfo") -> Iterator[str]:
+        summary = function_info.description.split("\n", 1)[0].split(". ", 1)[0]
+        category = function_info.category
+
+        if self.split == "function":
+            self.open(
+                create_file_name(function_info.anchor),
+                f"{function_info.function_name} | {self.page.title}",
+                summary.replace("\n", " "),
+            )
+        elif category != self.key:
+            self.open(
+                category,
+                f"{category.replace('_', ' ').title()} | {self.page.title}",
+                f"The {category.replace('_', ' ')} functions of the "
+                f"{self.page.title} module.",
+            )
 
-# Create Models page
-markdown_content = """---
-title: Models
-excerpt: The Models module is meant to execute well-known models such as DUPONT and the Discounted Cash Flow (DCF) model. These models are also directly related to the data retrieved from the Toolkit module.
-description: The Models module is meant to execute well-known models such as DUPONT and the Discounted Cash Flow (DCF) model. These models are also directly related to the data retrieved from the Toolkit module.
-author_profile: false
-permalink: /projects/financetoolkit/docs/models
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /models
-sidebar:
-    nav: "financetoolkit-docs-models"
----
+        self.writer.write(super().render_function(function_info))
+        self.redirects[function_info.anchor] = (
+            f"{self.permalink(self.key)}#{function_info.anchor}"
+            if self.split == "category"
+            else self.permalink(self.key)
+        )
+
+        if category != self.category and self.split == "category":
+            self.category = category
+            yield f"\n[{category.replace('_', ' ').title()}]({self.permalink(self.key)})\n\n"
+
+        yield f"## {function_info.function_name}\n"
+        yield f"{summary}\n\n[Documentation]({self.redirects[function_info.anchor]})\n\n"
+
+    def render_footer(self) -> Iterator[str]:
+        self.commit()
+
+        yield "<script>\n"
+        yield f"  const redirects = {json.dumps(self.redirects)};\n"
+        yield "  const target = redirects[window.location.hash.slice(1)];\n"
+        yield "  if (target) { window.location.replace(target); }\n"
+        yield "</script>\n"
+
+
+class RenderCache(DiskCache):
+    """
+    Content-addressed cache of the parsed docstring and rendered markdown of every
+    function, keyed by the raw docstring, the generator itself (like the manifest) and
+    the options of the markdown renderer.
+    Rebuilding a module after an upstream commit therefore only parses and renders the
+    functions that changed, the others are reassembled from their cached fragments.
+    """
+
+    def __init__(
+        self, directory: str = ".docs-cache/render", max_size: int = 20 * 1024 * 1024
+    ):
+        super().__init__(directory, max_size)
+        self.fragments: dict[str, str] = {}
+
+    def parse(
+        self, function_name: str, docstring: str, renderer: "MarkdownRenderer"
+    ) -> FunctionInfo:
+        # The markdown depends on the options of the renderer and the linked symbols
+        links = renderer.linker.links_digest(docstring) if renderer.linker else ""
+        digest = hash_text(
+            f"{BuildManifest.generator_hash}\0{renderer.digest}\0{links}\0"
+            f"{function_name}\0{docstring}"
+        )
+        entry = self.get(digest)
+
+        if entry is not None:
+            self.fragments[digest] = entry["markdown"]
+
+            return FunctionInfo(**entry["function_info"], digest=digest)
+
+        function_info = replace(
+            parse_docstring(function_name, docstring), digest=digest
+        )
+        markdown = "".join(renderer.render_markdown(function_info))
+        self.fragments[digest] = markdown
+
+        # Evicting after every entry would scan the directory for every function
+        self.put(
+            digest,
+            {
+                "function_info": {
+                    "function_name": function_info.function_name,
+                    "description": function_info.description,
+                    "arguments": function_info.arguments,
+                    "example_code": function_info.example_code,
+                    "example_result": function_info.example_result,
+                },
+                "markdown": markdown,
+            },
+            evict=False,
+        )
+
+        return function_info
+
+    def fragment(self, function_info: FunctionInfo) -> str | None:
+        """
+        Hand over the markdown of a parsed function once, so that only the functions
+        that are being rendered are held in memory.
+        """
+        return self.fragments.pop(function_info.digest, None)
+
+
+class CodeHighlighter:
+    """
+    Highlights the example code with Pygments while generating, so that Jekyll neither
+    has to include code_header.html nor run Rouge for every example. The HTML mirrors
+    the output of the highlight tag (Rouge uses the class names of Pygments) preceded
+    by the copy button, and is cached on disk by the hash of the code, the generator and
+    the version of Pygments.
+    """
+
+    # Included once per page instead of with every copy button
+    script = '<script src="/assets/js/copyCode.js" defer></script>'
+
+    def __init__(self, cache: DiskCache | None = None):
+        if pygments is None:
+            raise ImportError("Pygments is required to highlight the code.")
+
+        self.cache = cache
+        self.lexer = PythonLexer()
+        self.formatter = HtmlFormatter(nowrap=True)
+
+    def highlight(self, code: str) -> str:
+        key = hash_text(
+            f"{BuildManifest.generator_hash}\0{pygments.__version__}\0{code}"
+        )
+        entry = self.cache.get(key) if self.cache else None
+
+        if entry is not None:
+            return entry["html"]
+
+        # Braces are escaped so that Liquid does not see them as tags or variables
+        code_html = (
+            pygments.highlight(code, self.lexer, self.formatter)
+            .replace("{", "&#123;")
+            .replace("}", "&#125;")
+        )
+        html = (
+            '<div class="code-header">\n'
+            '    <button class="copy-code-button fas fa-copy" '
+            'aria-label="Copy code to clipboard"></button>\n'
+            "  </div>\n"
+            '<figure class="highlight"><pre><code class="language-python" '
+            f'data-lang="python">{code_html}</code></pre></figure>\n'
+        )
+
+        if self.cache:
+            self.cache.put(key, {"html": html}, evict=False)
+
+        return html
+
+
+class JsonIndexRenderer(Renderer):
+    """
+    Renders a compact JSON index of the module that the docstring viewer loads as a
+    static file, so that readers' browsers no longer fetch and parse the controllers.
+    """
+
+    version = 1
+
+    def __init__(self, module: str, title: str, permalink: str):
+        self.metadata = {
+            "version": self.version,
+            "module": module,
+            "title": title,
+            "permalink": permalink,
+        }
+        self.count = 0
+
+    def render_header(self) -> Iterator[str]:
+        yield json.dumps(self.metadata, separators=(",", ":"))[:-1]
+        yield ',"functions":['
+
+    def render_function(self, function_info: "FunctionInfo") -> Iterator[str]:
+        if self.count:
+            yield ","
+
+        self.count += 1
+
+        yield json.dumps(
+            {
+                "name": function_info.function_name,
+                "anchor": function_info.anchor,
+                "description": function_info.description,
+                "arguments": function_info.arguments,
+                "example_code": function_info.example_code,
+                "example_result": function_info.example_result.replace(
+                    "Which returns:", ""
+                ).strip(),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    def render_footer(self) -> Iterator[str]:
+        yield "]}\n"
+
+
+class SearchIndexRenderer(Renderer):
+    """
+    Renders the search shard of a module: an inverted index that maps each token of
+    the function names, argument names and descriptions to the functions it occurs in,
+    with a score based on the weight of the field it occurs in.
+    """
+
+    version = 1
+    field_weights = {"name": 10, "arguments": 3, "description": 1}
+    stop_words = frozenset(
+        "a an and are as at be by for from in is it of on or that the this to with".split()
+    )
 
-The Models module is meant to execute well-known models such as DUPONT and the Discounted Cash Flow (DCF) model. These models are also directly related to the data retrieved from the Toolkit module.
+    def __init__(self, module: str, permalink: str):
+        self.module = module
+        self.permalink = permalink
+        self.documents: list[list[str]] = []
+        self.postings: dict[str, dict[int, int]] = {}
+
+    def tokenize(self, text: str) -> list[str]:
+        return [
+            token
+            for token in SEARCH_TOKEN_PATTERN.findall(
+                SEARCH_MARKUP_PATTERN.sub(" ", text).lower()
+            )
+            if token not in self.stop_words
+        ]
+
+    def render_function(self, function_info: "FunctionInfo") -> Iterator[str]:
+        document = len(self.documents)
+        self.documents.append([function_info.function_name, function_info.anchor])
+
+        fields = {
+            "name": function_info.function_name.replace("_", " "),
+            "arguments": " ".join(
+                argument.split(" ", 1)[0]
+                for argument in ARGUMENT_NAME_PATTERN.findall(function_info.arguments)
+            ).replace("_", " "),
+            "description": function_info.description,
+        }
+
+        for field, text in fields.items():
+            for token in self.tokenize(text):
+                scores = self.postings.setdefault(token, {})
+                scores[document] = scores.get(document, 0) + self.field_weights[field]
+
+        yield from ()
+
+    def render_footer(self) -> Iterator[str]:
+        # Postings are stored flat as [document, score, document, score, ...]
+        postings = {
+            token: [
+                value
+                for document, score in sorted(scores.items(), key=lambda item: -item[1])
+                for value in (document, score)
+            ]
+            for token, scores in sorted(self.postings.items())
+        }
+
+        yield json.dumps(
+            {
+                "version": self.version,
+                "module": self.module,
+                "permalink": self.permalink,
+                "documents": self.documents,
+                "postings": postings,
+            },
+            separators=(",", ":"),
+        )
+        yield "\n"
+
+
+def create_title(name: str) -> str:
+    """
+    Turn the name of a function into the title of its sidebar entry, e.g.
+    get_return_on_assets into Return on Assets and get_EBT_to_EBIT into EBT to EBIT.
+    """
+    words = name.removeprefix("get_").removeprefix("collect_").split("_")
+    title = []
+
+    for index, word in enumerate(words):
+        # Abbreviations keep their capitals and short words are only capitalised first
+        if word in TITLE_ACRONYMS:
+            word = word.upper()
+        elif word == word.lower() and not (index and word in TITLE_SMALL_WORDS):
+            word = word.capitalize()
+
+        title.append(word)
+
+    return " ".join(title)
+
+
+class NavigationRenderer(Renderer):
+    """
+    Renders the sidebar of the module as a Jekyll data file. The titles, groups and
+    order of the functions come from NAVIGATION_TITLES, functions that are not listed
+    there follow in the order of the module: those of the general category directly,
+    those of every other category in the group of that category, which is headed by
+    its collect function (or just that function when the category has no others). The
+    file only depends on the names and categories of the functions, so it is left
+    untouched when only their documentation changes.
+    """
+
+    def __init__(self, page: "Page", split: str | None = None):
+        self.page = page
+        self.split = split
+        self.titles = [
+            (anchor, title, group)
+            for group, titles in NAVIGATION_TITLES.get(page.name, {}).items()
+            for anchor, title in titles
+        ]
+        self.title_groups = {anchor: group for anchor, _, group in self.titles}
+        self.urls: dict[str, str] = {}
+        self.others: list[tuple[str, str, str | None]] = []
+        self.category_groups: dict[str, str] = {}
+        self.collect_groups: set[str] = set()
+
+    def url(self, function_info: "FunctionInfo") -> str:
+        if self.split == "function":
+            return (
+                f"{self.page.permalink}/function/"
+                f"{create_file_name(function_info.anchor)}"
+            )
 
-To install the FinanceToolkit it simply requires the following:
+        if self.split == "category":
+            return (
+                f"{self.page.permalink}/category/{function_info.category}"
+                f"#{function_info.anchor}"
+            )
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+        return f"{self.page.permalink}#{function_info.anchor}"
+
+    def render_header(self) -> Iterator[str]:
+        toolkit_permalink = versioned_directory(DOCS_PERMALINK, self.page.version)
+
+        if self.page.permalink == toolkit_permalink:
+            title, url, style = "Back to Homepage", "/projects/financetoolkit", "info"
+        else:
+            title, url, style = "Back to Toolkit", toolkit_permalink, "warning"
+
+        button = f'<p class="btn btn--x-large btn--{style}">{title}<p>'
+
+        yield "# Generated by assets/python/docs.py, do not edit\n"
+        yield f"- title: {json.dumps(button)}\n"
+        yield f"  url: {url}\n"
+
+    def render_function(self, function_info: "FunctionInfo") -> Iterator[str]:
+        name, anchor = function_info.function_name, function_info.anchor
+
+        if name.startswith("_"):
+            return
+
+        self.urls[anchor] = self.url(function_info)
+        category = function_info.category
+
+        if anchor in self.title_groups:
+            group = self.title_groups[anchor]
+
+            if group and category != "general":
+                self.category_groups.setdefault(category, group)
+        elif anchor not in NAVIGATION_GROUP_ANCHORS.values():
+            title = create_title(name)
+
+            if category == "general":
+                self.others.append((anchor, title, None))
+            elif category not in self.category_groups:
+                # The first function of a category is its collect function
+                self.category_groups[category] = title
+                self.collect_groups.add(title)
+                self.others.append((anchor, f"All {title}", title))
+            else:
+                self.others.append((anchor, title, self.category_groups[category]))
+
+        yield from ()
+
+    def render_footer(self) -> Iterator[str]:
+        entries: list[tuple[str, str | None, list[tuple[str, str]] | None]] = []
+        groups: dict[str, list[tuple[str, str]]] = {}
+        listed = [entry for entry in self.titles if entry[0] in self.urls]
+
+        for anchor, title, group in listed + self.others:
+            if group is None:
+                entries.append((title, self.urls[anchor], None))
+                continue
+
+            if group not in groups:
+                group_anchor = NAVIGATION_GROUP_ANCHORS.get(group)
+                group_url = group_anchor and self.urls.get(
+                    group_anchor, f"{self.page.permalink}#{group_anchor}"
+                )
+                groups[group] = []
+                entries.append((group, group_url, groups[group]))
+
+            groups[group].append((title, self.urls[anchor]))
+
+        for title, url, children in entries:
+            # A collect function without any other function of its category
+            if children and len(children) == 1 and title in self.collect_groups:
+                url, children = children[0][1], None
+
+            yield f"- title: {json.dumps(title)}\n"
+
+            if url:
+                yield f"  url: {url}\n"
+
+            if children:
+                yield "  children:\n"
+
+                for child_title, child_url in children:
+                    yield f"    - title: {json.dumps(child_title)}\n"
+                    yield f"      url: {child_url}\n"
+
+
+def render_files(
+    file_content: SourceContent,
+    outputs: list[tuple[Renderer, str]],
+    dry_run: bool = False,
+    profile: BuildProfile | None = None,
+    key: str = "",
+    cache: RenderCache | None = None,
+) -> list[bool]:
+    """
+    Extract and parse the functions once and stream each of them through every
+    renderer into its own file, so that all outputs are produced in a single pass.
+    Returns for each output whether it was (or, in a dry run, would be) written.
+    The parse, render and write stages are recorded in the profile under the key.
+    With a render cache, only functions whose docstring changed are parsed and rendered.
+    """
+    profile = profile or BuildProfile()
+
+    def write(writer: AtomicWriter, chunks: Iterable[str]):
+        with profile.measure(key, "render"):
+            chunks = list(chunks)
+
+        with profile.measure(key, "write"):
+            writer.write(chunks)
+
+        profile.add(
+            key, "bytes_out", sum(len(chunk.encode("utf-8")) for chunk in chunks)
+        )
+
+    with ExitStack() as stack:
+        writers = [
+            stack.enter_context(AtomicWriter(location, dry_run))
+            for _, location in outputs
+        ]
+
+        for renderer, _ in outputs:
+            stack.callback(renderer.close)
+
+        for (renderer, _), writer in zip(outputs, writers):
+            write(writer, renderer.render_header())
+
+        markdown_renderer = next(
+            (
+                renderer
+                for renderer, _ in outputs
+                if isinstance(renderer, MarkdownRenderer)
+            ),
+            None,
+        )
+        # Without a markdown output the rendered fragments would never be picked up
+        functions = parse_functions(
+            file_content, cache if markdown_renderer else None, markdown_renderer
+        )
+
+        while True:
+            with profile.measure(key, "parse"):
+                function_info = next(functions, None)
+
+            if function_info is None:
+                break
+
+            profile.add(key, "functions")
+
+            for (renderer, _), writer in zip(outputs, writers):
+                write(writer, renderer.render_function(function_info))
+
+        for (renderer, _), writer in zip(outputs, writers):
+            write(writer, renderer.render_footer())
+
+        with profile.measure(key, "write"):
+            return [writer.commit() for writer in writers]
+
+
+def create_markdown_file(
+    file_content: SourceContent,
+    header: str,
+    location: str,
+    renderer: Renderer | None = None,
+    dry_run: bool = False,
+) -> bool:
+    """
+    Extract, parse and render the functions one at a time, streaming the output of
+    each function straight to the file. Returns whether the file was (or, in a dry
+    run, would be) written.
+    """
+    renderer = renderer or MarkdownRenderer(header)
+
+    return render_files(file_content, [(renderer, location)], dry_run)[0]
+
+
+@dataclass(frozen=True)
+class Page:
+    """
+    A documentation page for one of the FinanceToolkit controllers. The name is used to
+    select the page from the command line and the label for its button. Pages of a
+    released version of the FinanceToolkit are placed in a directory of that version.
+    """
+
+    name: str
+    title: str
+    label: str
+    permalink: str
+    path: str
+    location: str
+    sidebar: str
+    redirect_from: str
+    excerpt: str
+    introduction: str | None = None
+    details: str | None = None
+    version: str | None = None
+
+    def versioned(self, version: str) -> "Page":
+        return replace(
+            self,
+            title=f"{self.title} ({version})",
+            permalink=self.permalink.replace(
+                DOCS_PERMALINK, f"{DOCS_PERMALINK}/{version}", 1
+            ),
+            location=os.path.join(
+                os.path.dirname(self.location),
+                version,
+                os.path.basename(self.location),
+            ),
+            sidebar=f"{self.sidebar}-{DATA_NAME_PATTERN.sub('', version)}",
+            redirect_from="",
+            version=version,
+        )
+
+    @property
+    def index_location(self) -> str:
+        return f"{versioned_directory(INDEX_DIRECTORY, self.version)}/{self.name}.json"
+
+    @property
+    def search_location(self) -> str:
+        return f"{versioned_directory(SEARCH_DIRECTORY, self.version)}/{self.name}.json"
+
+    @property
+    def navigation_location(self) -> str:
+        return f"{NAVIGATION_DIRECTORY}/{self.sidebar}.yml"
+
+    @property
+    def table_directory(self) -> str:
+        return f"{versioned_directory(TABLE_DIRECTORY, self.version)}/{self.name}"
+
+
+def versioned_directory(directory: str, version: str | None) -> str:
+    return f"{directory}/{version}" if version else directory
+
+
+def build_page(
+    page: Page,
+    file_content: SourceContent,
+    manifest: BuildManifest | None = None,
+    dry_run: bool = False,
+    split: str | None = None,
+    compress: bool = False,
+    profile: BuildProfile | None = None,
+    render_cache: RenderCache | None = None,
+    lazy_tables: bool = False,
+    linker: SymbolLinker | None = None,
+    highlighter: "CodeHighlighter | None" = None,
+) -> dict:
+    """
+    Render all outputs of the page and return its status together with the location
+    of each output. Outputs of a previous build that are no longer produced (e.g. the
+    page of a function that was removed) are deleted.
+    """
+    profile = profile or BuildProfile()
+
+    with profile.measure(page.path, "build"):
+        return _build_page(
+            page,
+            file_content,
+            manifest,
+            dry_run,
+            split,
+            compress,
+            profile,
+            render_cache,
+            lazy_tables,
+            linker,
+            highlighter,
+        )
+
+
+def _build_page(
+    page: Page,
+    file_content: SourceContent,
+    manifest: BuildManifest | None,
+    dry_run: bool,
+    split: str | None,
+    compress: bool,
+    profile: BuildProfile,
+    render_cache: RenderCache | None,
+    lazy_tables: bool,
+    linker: SymbolLinker | None,
+    highlighter: "CodeHighlighter | None",
+) -> dict:
+    header = create_header(page)
+    source_sha = git_blob_sha(file_content)
+    table_directory = page.table_directory if lazy_tables else None
+
+    markdown_renderer = (
+        SplitMarkdownRenderer(
+            header,
+            page,
+            split,
+            dry_run,
+            render_cache,
+            table_directory,
+            linker,
+            highlighter,
+        )
+        if split
+        else MarkdownRenderer(
+            header, render_cache, table_directory, dry_run, linker, highlighter
+        )
+    )
+    header_hash = hash_text(
+        f"{header}{split}{compress}{lazy_tables}{markdown_renderer.digest}"
+        f"{linker.digest if linker else ''}"
+    )
+    outputs = [
+        (markdown_renderer, page.location),
+        (
+            JsonIndexRenderer(page.name, page.title, page.permalink),
+            page.index_location,
+        ),
+        (SearchIndexRenderer(page.name, page.permalink), page.search_location),
+        (NavigationRenderer(page, split), page.navigation_location),
+    ]
+    locations = [location for _, location in outputs]
+
+    if manifest and manifest.is_up_to_date(
+        page.location,
+        source_sha,
+        header_hash,
+        None if split or compress or lazy_tables else locations,
+    ):
+        return {"status": "up to date", "outputs": manifest.locations(page.location)}
+
+    written = render_files(
+        file_content, outputs, dry_run, profile, page.path, render_cache
+    )
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, technicals, fixed income, risk, performance and economics, please have a look below:
+    # The pages of a split module and the lazily loaded tables
+    locations.extend(markdown_renderer.outputs)
+    written.extend(markdown_renderer.outputs.values())
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+    if compress:
+        with profile.measure(page.path, "compress"):
+            compressed_locations = [
+                compressed_location
+                for location in locations
+                if location.startswith("assets/")
+                for compressed_location in write_compressed_files(location, dry_run)
+            ]
+        locations.extend(compressed_locations)
 
-{% include algolia.html %}
+    if manifest and not dry_run:
+        for location in set(manifest.locations(page.location)).difference(locations):
+            if os.path.exists(location):
+                os.remove(location)
 
-"""
+                try:
+                    os.removedirs(os.path.dirname(location))
+                except OSError:
+                    pass
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/models/models_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/models.md",
-)
+        manifest.update(page.location, source_sha, header_hash, locations)
 
-# Create Options page
-markdown_content = """---
-title: Options
-excerpt: The Options module is meant to calculate important options metrics such as the First, Second and Third Order Greeks, the Black Scholes Model and the Option Chains as well as Implied Volatilities, Breeden—Litzenberger and more.
-description: The Options module is meant to calculate important options metrics such as the First, Second and Third Order Greeks, the Black Scholes Model and the Option Chains as well as Implied Volatilities, Breeden—Litzenberger and more.
-author_profile: false
-permalink: /projects/financetoolkit/docs/options
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /models
-sidebar:
-    nav: "financetoolkit-docs-options"
----
+    if dry_run:
+        status = "would be written" if any(written) else "unchanged"
+    else:
+        status = "written" if any(written) else "unchanged"
 
-The Options module is meant to calculate important options metrics such as the First, Second and Third Order Greeks, the Black Scholes Model and the Option Chains as well as Implied Volatilities, Breeden—Litzenberger and more.
+    return {"status": status, "outputs": locations}
 
-To install the FinanceToolkit it simply requires the following:
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+def write_compressed_files(location: str, dry_run: bool = False) -> list[str]:
+    """
+    Write gzip and, when the brotli package is installed, brotli compressed copies of
+    a static file next to it so that they can be served as is. The copies are only
+    rewritten when the file itself is newer.
+    """
+    compressors = {".gz": lambda data: gzip.compress(data, mtime=0)}
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, technicals, fixed income, risk, performance and economics, please have a look below:
+    if brotli is not None:
+        compressors[".br"] = brotli.compress
+
+    if dry_run:
+        return [f"{location}{extension}" for extension in compressors]
+
+    compressed_locations = []
+
+    for extension, compress in compressors.items():
+        compressed_location = f"{location}{extension}"
+
+        if not os.path.exists(compressed_location) or os.path.getmtime(
+            compressed_location
+        ) < os.path.getmtime(location):
+            with open(location, "rb") as file:
+                data = compress(file.read())
+
+            with AtomicWriter(compressed_location) as writer:
+                writer.write_bytes(data)
+                writer.commit()
+
+        compressed_locations.append(compressed_location)
+
+    return compressed_locations
+
+
+def report_size_budget(results: dict[str, dict], budget: int = 100 * 1024) -> list[str]:
+    """Return a line for every generated file that is larger than the budget."""
+    report = []
+
+    for result in results.values():
+        for location in result["outputs"]:
+            if os.path.exists(location) and os.path.getsize(location) > budget:
+                report.append(
+                    f"{location} is {os.path.getsize(location) / 1024:.1f} KB, "
+                    f"which exceeds the budget of {budget / 1024:.0f} KB."
+                )
+
+    return report
+
+
+def read_front_matter(text: str) -> tuple[dict[str, list[str]], str]:
+    """
+    Split a page into the values of its front matter (every key with its value or the
+    items of its list) and the content that follows it.
+    """
+    if not text.startswith("---\n"):
+        return {}, text
+
+    end = text.find("\n---\n", 3)
+
+    if end == -1:
+        return {}, text
+
+    front_matter: dict[str, list[str]] = {}
+    key = None
+
+    for line in text[4:end].splitlines():
+        if line[:1].isalpha() and ":" in line:
+            key, value = line.split(":", 1)
+            front_matter[key] = [value.strip().strip("\"'")] if value.strip() else []
+        elif key and line.lstrip().startswith("- "):
+            front_matter[key].append(line.lstrip()[2:].strip().strip("\"'"))
+
+    return front_matter, text[end + 5 :]
+
+
+def iterate_lines_outside_code(text: str) -> Iterator[tuple[int, str]]:
+    """Yield the number and text of every line that is not part of a code block."""
+    fence = None
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+    for number, line in enumerate(text.splitlines(), 1):
+        if fence:
+            if fence.fullmatch(line):
+                fence = None
+        elif opening := FENCE_PATTERN.match(line):
+            fence = re.compile(rf" {{0,3}}{opening.group(1)}+[ \t]*")
+        else:
+            yield number, line
 
-{% include algolia.html %}
 
-"""
+class LinkIndex:
+    """
+    Index of the permalink of every page of the site together with the anchors on that
+    page, the redirects to it and the anchors that the layouts add to every page. The
+    anchors of headings are created like Kramdown does (see create_anchor), so that the
+    links can be validated without building the site.
+    """
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/options/options_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/options.md",
-)
+    def __init__(self):
+        self.anchors: dict[str, set[str]] = {}
+        self.redirects: dict[str, str] = {}
+        self.layout_anchors: set[str] = set()
+
+    @classmethod
+    def from_site(
+        cls,
+        directories: Iterable[str] = ("_pages", "_posts"),
+        layout_directories: Iterable[str] = ("_layouts", "_includes"),
+    ) -> "LinkIndex":
+        index = cls()
+        locations = [
+            location
+            for location in os.listdir(".")
+            if location.endswith((".md", ".html"))
+        ]
+
+        for directory in directories:
+            for root, _, file_names in os.walk(directory):
+                locations.extend(
+                    os.path.join(root, file_name)
+                    for file_name in file_names
+                    if file_name.endswith((".md", ".html"))
+                )
+
+        for location in sorted(locations):
+            with open(location, encoding="utf-8") as file:
+                index.add_page(file.read())
+
+        for directory in layout_directories:
+            for root, _, file_names in os.walk(directory):
+                for file_name in file_names:
+                    with open(os.path.join(root, file_name), encoding="utf-8") as file:
+                        index.layout_anchors.update(ID_PATTERN.findall(file.read()))
+
+        return index
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        path = path.split("?", 1)[0].removesuffix(".html").removesuffix("/index")
+
+        return "/" + path.strip("/")
+
+    def add_page(self, page_content: str):
+        front_matter, content = read_front_matter(page_content)
+
+        if not front_matter.get("permalink"):
+            return
+
+        permalink = self.normalize(front_matter["permalink"][0])
+        anchors = self.anchors.setdefault(permalink, set())
+        counts: dict[str, int] = {}
+
+        for _, line in iterate_lines_outside_code(content):
+            heading = HEADING_PATTERN.match(line)
+
+            if heading:
+                explicit = HEADING_ID_PATTERN.search(heading.group(1))
+                anchors.add(
+                    explicit.group(1)
+                    if explicit
+                    else create_anchor(heading.group(1), counts)
+                )
+
+            anchors.update(ID_PATTERN.findall(line))
+
+        for redirect in front_matter.get("redirect_from", []):
+            self.redirects[self.normalize(redirect)] = permalink
+
+    def resolve(self, url: str, base: str | None = None) -> str | None:
+        """Return why the internal link is dangling, or None when it resolves."""
+        path, _, anchor = url.partition("#")
+        path = self.normalize(path) if path else base
+        target = self.redirects.get(path, path)
+
+        if target not in self.anchors:
+            if not anchor and os.path.isfile(path.lstrip("/")):
+                return None
+
+            return "unknown page"
+
+        if anchor and anchor not in self.anchors[target] | self.layout_anchors:
+            return "unknown anchor"
+
+        return None
+
+
+def is_internal_link(url: str) -> bool:
+    return url.startswith(("/", "#")) and not url.startswith("//") and "{" not in url
+
+
+def validate_links(
+    documents: Iterable[str],
+    navigations: Iterable[str] = (NAVIGATION_LOCATION,),
+    index: LinkIndex | None = None,
+) -> list[str]:
+    """
+    Resolve every internal link of the navigation data and of the documents against
+    the permalinks and anchors of the site, without building or serving it. Returns a
+    line for every link that is dangling.
+    """
+    index = index or LinkIndex.from_site()
+    report = []
+
+    for navigation in navigations:
+        with open(navigation, encoding="utf-8") as file:
+            text = file.read()
+
+        for match in NAVIGATION_URL_PATTERN.finditer(text):
+            url = match.group(1)
+
+            if is_internal_link(url) and (problem := index.resolve(url)):
+                line = text.count("\n", 0, match.start()) + 1
+                report.append(f"{navigation}:{line}: {url} ({problem})")
+
+    for location in documents:
+        with open(location, encoding="utf-8") as file:
+            page_content = file.read()
+
+        front_matter, content = read_front_matter(page_content)
+        base = LinkIndex.normalize(front_matter.get("permalink", [""])[0])
+        offset = page_content.count("\n", 0, len(page_content) - len(content))
+
+        for number, line in iterate_lines_outside_code(content):
+            for match in LINK_PATTERN.finditer(line):
+                url = match.group(1) or match.group(2)
+
+                if is_internal_link(url) and (problem := index.resolve(url, base)):
+                    report.append(f"{location}:{number + offset}: {url} ({problem})")
+
+    return report
 
-# Create the Technicals page
-markdown_content = """---
-title: Technicals
-excerpt: The Technicals Module contains 30+ Technical Indicators that can be used to analyse companies. These ratios are divided into 4 categories which are breadth, momentum, overlap and volatility. Each indicator is calculated using the data from the Toolkit module.
-description: The Technicals Module contains 30+ Technical Indicators that can be used to analyse companies. These ratios are divided into 4 categories which are breadth, momentum, overlap and volatility. Each indicator is calculated using the data from the Toolkit module.
-author_profile: false
-permalink: /projects/financetoolkit/docs/technicals
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /technicals
-sidebar:
-    nav: "financetoolkit-docs-technicals"
----
 
-The Technicals Module contains 30+ Technical Indicators that can be used to analyse companies. These ratios are divided into 4 categories which are breadth, momentum, overlap and volatility. Each indicator is calculated using the data from the Toolkit module.
+def write_search_shards(pages: list[Page], version: str | None = None) -> bool:
+    """
+    Write the list of search shards so that a static client knows which shard belongs
+    to which module and only has to load the shards it needs. Every version has its
+    own list.
+    """
+    directory = versioned_directory(SEARCH_DIRECTORY, version)
+    shards = [
+        {
+            "module": page.name,
+            "title": page.title,
+            "permalink": page.permalink,
+            "location": f"/{page.search_location}",
+        }
+        for page in pages
+    ]
+
+    os.makedirs(directory, exist_ok=True)
+
+    return write_file_if_changed(
+        f"{directory}/shards.json",
+        json.dumps(
+            {"version": SearchIndexRenderer.version, "shards": shards},
+            separators=(",", ":"),
+        )
+        + "\n",
+    )
 
-To install the FinanceToolkit it simply requires the following:
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+def build_documentation(
+    pages: list[Page],
+    source: SourceBackend,
+    manifest: BuildManifest | None = None,
+    max_workers: int = 1,
+    dry_run: bool = False,
+    split: str | None = None,
+    compress: bool = False,
+    profile: BuildProfile | None = None,
+    render_cache: RenderCache | None = None,
+    lazy_tables: bool = False,
+    cross_link: bool = False,
+    highlighter: "CodeHighlighter | None" = None,
+    version: str | None = None,
+    processes: int = 0,
+) -> dict[str, dict]:
+    """
+    Acquire the source of every page at once from the source backend and then parse
+    and write the pages, optionally several at the same time in threads or, with
+    processes, in a pool of that many processes. Pages of which the source and header
+    did not change since the previous build (according to the manifest) are neither
+    parsed nor rendered. Returns the outcome for each page.
+
+    Cross-linking needs the functions of all modules, so then every controller is
+    read, also when only some of the pages are built. With a version, the pages are
+    written as the documentation of that version of the FinanceToolkit.
+    """
+    profile = profile or BuildProfile()
+    registry = PAGES
+
+    if version:
+        registry = [page.versioned(version) for page in PAGES]
+        pages = [page.versioned(version) for page in pages]
+
+    file_contents = source.read_files(
+        [page.path for page in (registry if cross_link else pages)], profile
+    )
+    linker = SymbolLinker.from_sources(registry, file_contents) if cross_link else None
+    options = {
+        "dry_run": dry_run,
+        "split": split,
+        "compress": compress,
+        "lazy_tables": lazy_tables,
+    }
+
+    if processes:
+        results = build_pages_in_processes(
+            pages,
+            source,
+            file_contents,
+            processes,
+            manifest,
+            profile,
+            render_cache,
+            linker,
+            highlighter,
+            options,
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = executor.map(
+                lambda page: build_page(
+                    page,
+                    file_contents[page.path],
+                    manifest,
+                    profile=profile,
+                    render_cache=render_cache,
+                    linker=linker,
+                    highlighter=highlighter,
+                    **options,
+                ),
+                pages,
+            )
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, models, fixed income, risk, performance and economics, please have a look below:
+            results = dict(zip((page.name for page in pages), results))
+
+    if not dry_run:
+        with profile.measure("", "write"):
+            write_search_shards(registry, version)
+
+    if manifest and not dry_run:
+        manifest.save()
+
+    if render_cache:
+        render_cache.evict()
+
+    if highlighter and highlighter.cache:
+        highlighter.cache.evict()
+
+    return results
+
+
+# The state that a build process shares between the pages it builds
+_build_process: dict = {}
+
+
+def initialize_build_process(
+    source: SourceBackend | None,
+    manifest: tuple[str, dict] | None,
+    render_cache: tuple[str, int] | None,
+    highlight: bool,
+    highlight_cache: tuple[str, int] | None,
+    symbols: tuple[dict[str, str], str] | None,
+    options: dict,
+):
+    """
+    Set up a build process once, so that every page only has to send the page itself
+    (and the controller, unless the process reads it from a local checkout).
+    """
+    _build_process.update(
+        source=source,
+        manifest=BuildManifest(*manifest) if manifest else None,
+        render_cache=RenderCache(*render_cache) if render_cache else None,
+        highlighter=(
+            CodeHighlighter(DiskCache(*highlight_cache) if highlight_cache else None)
+            if highlight
+            else None
+        ),
+        linker=SymbolLinker(*symbols) if symbols is not None else None,
+        options=options,
+    )
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
 
-{% include algolia.html %}
+def build_page_in_process(
+    page: Page, file_content: str | bytes | None
+) -> tuple[dict, dict | None, dict]:
+    """
+    Build the page in a build process and send back only its outcome, its manifest
+    entry and its metrics, the outputs themselves are written by the process.
+    """
+    profile = BuildProfile()
+    manifest = _build_process["manifest"]
+
+    if file_content is None:
+        file_content = _build_process["source"].read_files([page.path])[page.path]
+
+    result = build_page(
+        page,
+        file_content,
+        manifest,
+        profile=profile,
+        render_cache=_build_process["render_cache"],
+        linker=_build_process["linker"],
+        highlighter=_build_process["highlighter"],
+        **_build_process["options"],
+    )
 
-"""
+    return (
+        result,
+        manifest.pages.get(page.location) if manifest else None,
+        profile.metrics,
+    )
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/technicals/technicals_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/technicals.md",
-)
 
-# Create the Fixed Income page
-markdown_content = """---
-title: Fixed Income
-excerpt: The Fixed Income module contains a wide variety of fixed income related calculations such as the Effective Yield, the Macaulay Duration, the Modified Duration Convexity, the Yield to Maturity and models such as Black and Bachelier to valuate derivative instruments such as Swaptions. 
-description: The Fixed Income module contains a wide variety of fixed income related calculations such as the Effective Yield, the Macaulay Duration, the Modified Duration Convexity, the Yield to Maturity and models such as Black and Bachelier to valuate derivative instruments such as Swaptions. 
+def build_pages_in_processes(
+    pages: list[Page],
+    source: SourceBackend,
+    file_contents: dict[str, SourceContent],
+    processes: int,
+    manifest: BuildManifest | None,
+    profile: BuildProfile,
+    render_cache: RenderCache | None,
+    linker: SymbolLinker | None,
+    highlighter: "CodeHighlighter | None",
+    options: dict,
+) -> dict[str, dict]:
+    """
+    Parse and render the pages in a pool of processes, which is CPU-bound work that
+    threads can not spread over the cores. The largest controllers are started first
+    so that the build does not end waiting on one large module. The outputs are the
+    same as those of a build in threads, the manifest and profile are updated with
+    what the processes send back.
+    """
+    # A local checkout is read by the processes themselves, memory maps can not be sent
+    local = isinstance(source, LocalSource)
+    contents: dict[str, str | bytes | None] = {}
+
+    for page in pages:
+        file_content = file_contents[page.path]
+
+        if local:
+            contents[page.path] = None
+        elif isinstance(file_content, mmap.mmap):
+            contents[page.path] = bytes(file_content)
+        else:
+            contents[page.path] = file_content
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=initialize_build_process,
+        initargs=(
+            source if local else None,
+            (manifest.location, manifest.pages) if manifest else None,
+            (render_cache.directory, render_cache.max_size) if render_cache else None,
+            highlighter is not None,
+            (
+                (highlighter.cache.directory, highlighter.cache.max_size)
+                if highlighter and highlighter.cache
+                else None
+            ),
+            (linker.symbols, linker.root) if linker else None,
+            options,
+        ),
+    ) as executor:
+        futures = {
+            page.name: executor.submit(build_page_in_process, page, contents[page.path])
+            for page in sorted(
+                pages, key=lambda page: len(file_contents[page.path]), reverse=True
+            )
+        }
+        results = {}
+
+        for page in pages:
+            result, entry, metrics = futures[page.name].result()
+            results[page.name] = result
+            profile.merge(metrics)
+
+            if manifest and entry is not None:
+                manifest.pages[page.location] = entry
+
+    return results
+
+
+def build_versions(
+    pages: list[Page],
+    source: SourceBackend,
+    versions: list[str],
+    profile: BuildProfile | None = None,
+    **options,
+) -> dict[str, dict]:
+    """
+    Build the documentation of several versions of the FinanceToolkit in one run. The
+    controllers of all versions are read at once so that a file that did not change
+    between versions is only read once, and the render cache (when given) renders a
+    function of which the docstring did not change only once. Returns the outcome for
+    each page, named after the version and the page.
+    """
+    profile = profile or BuildProfile()
+    paths = [page.path for page in (PAGES if options.get("cross_link") else pages)]
+    file_contents = source.read_versions(paths, versions, profile)
+    results = {}
+
+    for version in versions:
+        version_results = build_documentation(
+            pages,
+            MemorySource(file_contents[version]),
+            profile=profile,
+            version=version,
+            **options,
+        )
+        results.update(
+            {f"{version}/{name}": result for name, result in version_results.items()}
+        )
+
+    return results
+
+
+def watch_documentation(
+    pages: list[Page],
+    source: LocalSource,
+    manifest: BuildManifest | None = None,
+    interval: float = 0.2,
+    debounce: float = 0.3,
+    **options,
+):
+    """
+    Poll the controllers of a local checkout and rebuild only the pages of which the
+    controller changed. Saves in quick succession (e.g. an editor writing a backup
+    first) are collected until the files have been quiet for the debounce time.
+    """
+
+    def modification_times() -> dict[str, int | None]:
+        times = {}
+
+        for page in pages:
+            try:
+                times[page.path] = os.stat(
+                    os.path.join(source.directory, page.path)
+                ).st_mtime_ns
+            except FileNotFoundError:
+                times[page.path] = None
+
+        return times
+
+    previous = modification_times()
+    build_documentation(pages, source, manifest, **options)
+    changed: set[str] = set()
+    last_change = 0.0
+
+    print(f"Watching {len(pages)} controller(s) in {source.directory}.")
+
+    while True:
+        time.sleep(interval)
+        current = modification_times()
+        paths = {path for path in current if current[path] != previous[path]}
+        previous = current
+
+        if paths:
+            changed.update(paths)
+            last_change = time.monotonic()
+
+        if not changed or time.monotonic() - last_change < debounce:
+            continue
+
+        affected = [
+            page for page in pages if page.path in changed and current[page.path]
+        ]
+        changed.clear()
+        start = time.perf_counter()
+
+        try:
+            results = build_documentation(affected, source, manifest, **options)
+        except (OSError, SyntaxError, ValueError, tokenize.TokenError) as error:
+            # A file that is saved halfway must not stop the watcher (a decode error is
+            # a ValueError, the tokenizer of --stream raises a TokenError)
+            print(f"Skipped: {error}")
+            continue
+
+        for name, result in results.items():
+            print(f"{name}: {result['status']} in {time.perf_counter() - start:.3f}s")
+
+
+def write_profile_report(
+    profile: BuildProfile, pages: list[Page], directory: str = ".docs-profile"
+) -> list[str]:
+    """
+    Write the metrics of every page, named after the page, and the totals of the
+    build as JSON files so that builds can be compared with each other.
+    """
+    names = {page.path: page.name for page in pages}
+    locations = []
+
+    for key, metrics in profile.report().items():
+        location = os.path.join(directory, f"{names.get(key, key) or 'build'}.json")
+        write_file_if_changed(
+            location, json.dumps(metrics, indent=4, sort_keys=True) + "\n"
+        )
+        locations.append(location)
+
+    return locations
+
+
+def profile_page(
+    page: Page, source: SourceBackend, directory: str = ".docs-profile"
+) -> str:
+    """
+    Build a single page under cProfile, regardless of the manifest, and store the
+    statistics next to the profile report. Returns the most expensive calls.
+    """
+    file_content = source.read_files([page.path])[page.path]
+    profiler = cProfile.Profile()
+    profiler.runcall(build_page, page, file_content)
+
+    location = os.path.join(directory, f"{page.name}.prof")
+    os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(location)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(20)
+
+    return stream.getvalue()
+
+
+PAGES = [
+    Page(
+        name="toolkit",
+        title="Documentation",
+        label="Toolkit",
+        permalink="/projects/financetoolkit/docs",
+        path="financetoolkit/toolkit_controller.py",
+        location="_pages/financetoolkit/documentation/docs.md",
+        sidebar="financetoolkit-docs",
+        redirect_from="/docs",
+        excerpt=(
+            "This the documentation of the FinanceToolkit. This is an open-source toolkit "
+            "in which 150+ financial ratios, indicators and performance measurements are "
+            "written down in the most simplistic way allowing for complete transparency of "
+            "the calculation method."
+        ),
+        introduction=(
+            "This page includes all the documentation for the Finance Toolkit, an open-"
+            "source toolkit in which all relevant financial ratios (150+), indicators and "
+            "performance measurements are written down in the most simplistic way "
+            "allowing for complete transparency of the calculation method. Each "
+            "functionality includes an example of how to use it and is therefore an "
+            "excellent way to better understand how to use each functionality. These "
+            "examples are also directly embedded in the code. For simplicity sake, only "
+            "the controller modules are included here given that the models themselves "
+            "should be relatively straightforward. Make sure to also have a look at the "
+            "example notebooks as found [here](/projects/financetoolkit#how-to-guides-"
+            "for-the-financetoolkit)."
+        ),
+        details=(
+            "The Toolkit Module is meant to be a collection of useful functions that "
+            "collect and parse data. These are historical data, fundamental data "
+            "(balance, income and cash flow statements) as well as several others metrics "
+            "from Financial Modeling Prep like enterprise values, company profiles and "
+            "more. From this module, you are able to access the related modules as well."
+        ),
+    ),
+    Page(
+        name="discovery",
+        title="Discovery",
+        label="Discovery",
+        permalink="/projects/financetoolkit/docs/discovery",
+        path="financetoolkit/discovery/discovery_controller.py",
+        location="_pages/financetoolkit/documentation/discovery.md",
+        sidebar="financetoolkit-docs-discovery",
+        redirect_from="/ratios",
+        excerpt=(
+            "The Discovery Module contains lists of companies, cryptocurrencies, forex, "
+            "commodities, etfs and indices including screeners, quotes, performance metrics "
+            "and more to find and select tickers to use in the Finance Toolkit."
+        ),
+    ),
+    Page(
+        name="ratios",
+        title="Ratios",
+        label="Ratios",
+        permalink="/projects/financetoolkit/docs/ratios",
+        path="financetoolkit/ratios/ratios_controller.py",
+        location="_pages/financetoolkit/documentation/ratios.md",
+        sidebar="financetoolkit-docs-ratios",
+        redirect_from="/ratios",
+        excerpt=(
+            "The Ratios Module contains over 50+ ratios that can be used to analyse "
+            "companies. These ratios are divided into 5 categories which are efficiency, "
+            "liquidity, profitability, solvency and valuation. Each ratio is calculated "
+            "using the data from the Toolkit module."
+        ),
+    ),
+    Page(
+        name="models",
+        title="Models",
+        label="Models",
+        permalink="/projects/financetoolkit/docs/models",
+        path="financetoolkit/models/models_controller.py",
+        location="_pages/financetoolkit/documentation/models.md",
+        sidebar="financetoolkit-docs-models",
+        redirect_from="/models",
+        excerpt=(
+            "The Models module is meant to execute well-known models such as DUPONT and the "
+            "Discounted Cash Flow (DCF) model. These models are also directly related to "
+            "the data retrieved from the Toolkit module."
+        ),
+    ),
+    Page(
+        name="options",
+        title="Options",
+        label="Options",
+        permalink="/projects/financetoolkit/docs/options",
+        path="financetoolkit/options/options_controller.py",
+        location="_pages/financetoolkit/documentation/options.md",
+        sidebar="financetoolkit-docs-options",
+        redirect_from="/models",
+        excerpt=(
+            "The Options module is meant to calculate important options metrics such as the "
+            "First, Second and Third Order Greeks, the Black Scholes Model and the Option "
+            "Chains as well as Implied Volatilities, Breeden—Litzenberger and more."
+        ),
+    ),
+    Page(
+        name="technicals",
+        title="Technicals",
+        label="Technicals",
+        permalink="/projects/financetoolkit/docs/technicals",
+        path="financetoolkit/technicals/technicals_controller.py",
+        location="_pages/financetoolkit/documentation/technicals.md",
+        sidebar="financetoolkit-docs-technicals",
+        redirect_from="/technicals",
+        excerpt=(
+            "The Technicals Module contains 30+ Technical Indicators that can be used to "
+            "analyse companies. These ratios are divided into 4 categories which are "
+            "breadth, momentum, overlap and volatility. Each indicator is calculated using "
+            "the data from the Toolkit module."
+        ),
+    ),
+    Page(
+        name="fixedincome",
+        title="Fixed Income",
+        label="Fixed Income",
+        permalink="/projects/financetoolkit/docs/fixedincome",
+        path="financetoolkit/fixedincome/fixedincome_controller.py",
+        location="_pages/financetoolkit/documentation/fixedincome.md",
+        sidebar="financetoolkit-docs-fixedincome",
+        redirect_from="/fixedincome",
+        excerpt=(
+            "The Fixed Income module contains a wide variety of fixed income related "
+            "calculations such as the Effective Yield, the Macaulay Duration, the Modified "
+            "Duration Convexity, the Yield to Maturity and models such as Black and "
+            "Bachelier to valuate derivative instruments such as Swaptions."
+        ),
+    ),
+    Page(
+        name="risk",
+        title="Risk",
+        label="Risk",
+        permalink="/projects/financetoolkit/docs/risk",
+        path="financetoolkit/risk/risk_controller.py",
+        location="_pages/financetoolkit/documentation/risk.md",
+        sidebar="financetoolkit-docs-risk",
+        redirect_from="/ratios",
+        excerpt=(
+            "The Risk module is meant to calculate important risk metrics such as Value at "
+            "Risk (VaR), Conditional Value at Risk (cVaR), Maximum Drawdown, Correlations, "
+            "GARCH, EWMA and more."
+        ),
+    ),
+    Page(
+        name="performance",
+        title="Performance",
+        label="Performance",
+        permalink="/projects/financetoolkit/docs/performance",
+        path="financetoolkit/performance/performance_controller.py",
+        location="_pages/financetoolkit/documentation/performance.md",
+        sidebar="financetoolkit-docs-performance",
+        redirect_from="/ratios",
+        excerpt=(
+            "The Performance module is meant to calculate important performance metrics "
+            "such as Sharpe Ratio, Sortino Ratio, Treynor Ratio, Information Ratio, "
+            "Jensen's Alpha, Beta, Capital Asset Pricing Model, R-Squared and more."
+        ),
+    ),
+    Page(
+        name="economics",
+        title="Economics",
+        label="Economics",
+        permalink="/projects/financetoolkit/docs/economics",
+        path="financetoolkit/economics/economics_controller.py",
+        location="_pages/financetoolkit/documentation/economics.md",
+        sidebar="financetoolkit-docs-economics",
+        redirect_from="/economics",
+        excerpt=(
+            "The Economics module gives insights for 60+ countries into key economic "
+            "indicators such as the Consumer Price Index (CPI), Gross Domestic Product "
+            "(GDP), Unemployment Rates and 3-month and 10-year Government Interest Rates. "
+            "This is done through the economics module and can be used as a standalone "
+            "module as well."
+        ),
+    ),
+]
+
+# The anchors and titles of the sidebar entries per page and group (None for the
+# entries outside of a group), in the order of the sidebar. A function can have more
+# than one entry, e.g. for each of the rates it returns.
+NAVIGATION_TITLES: dict[str, dict[str | None, list[tuple[str, str]]]] = {
+    "toolkit": {
+        "Finance Toolkit": [
+            ("ratios", "Ratios Module"),
+            ("models", "Models Module"),
+            ("options", "Options Module"),
+            ("technicals", "Technicals Module"),
+            ("risk", "Risk Module"),
+            ("performance", "Performance Module"),
+            ("fixedincome", "Fixed Income Module"),
+            ("economics", "Economics Module"),
+            ("get_profile", "Company Profiles"),
+            ("get_quote", "Current Quotes"),
+            ("get_rating", "Ratings and Recommendations"),
+            ("get_analyst_estimates", "Analyst Estimates"),
+            ("get_earnings_calendar", "Earnings Calendar"),
+            ("get_revenue_geographic_segmentation", "Revenue Geographic Segmentation"),
+            ("get_revenue_product_segmentation", "Revenue Product Segmentation"),
+            ("get_historical_data", "Historical Data"),
+            ("get_intraday_data", "Intraday Data"),
+            ("get_dividend_calendar", "Dividend Calendar"),
+            ("get_esg_scores", "ESG Scores"),
+            ("get_treasury_data", "Treasury Rates"),
+            ("get_balance_sheet_statement", "Balance Sheet Statements"),
+            ("get_income_statement", "Income Sheet Statements"),
+            ("get_cash_flow_statement", "Cash Flow Statements"),
+            ("get_statistics_statement", "Statistics Statements"),
+        ],
+    },
+    "discovery": {
+        None: [
+            ("search_instruments", "Search Instruments"),
+            ("get_stock_screener", "Stock Screener"),
+        ],
+        "Companies": [
+            ("get_stock_list", "Company List"),
+            ("get_stock_quotes", "Company Quotes"),
+            ("get_stock_shares_float", "Floating Shares"),
+            ("get_sectors_performance", "Sector Performance"),
+            ("get_biggest_gainers", "Biggest Gainers"),
+            ("get_biggest_losers", "Biggest Losers"),
+            ("get_most_active_stocks", "Most Active"),
+            ("get_delisted_stocks", "Delisted Companies"),
+        ],
+        "Cryptocurrencies": [
+            ("get_crypto_list", "Cryptocurrency List"),
+            ("get_crypto_quotes", "Cryptocurrency Quotes"),
+        ],
+        "FOREX": [
+            ("get_forex_list", "Forex List"),
+            ("get_forex_quotes", "Forex Quotes"),
+        ],
+        "Commodities": [
+            ("get_commodity_list", "Commodities List"),
+            ("get_commodity_quotes", "Commodities Quotes"),
+        ],
+        "ETFs & Indices": [
+            ("get_etf_list", "ETF List"),
+            ("get_index_list", "Index List"),
+            ("get_index_quotes", "Index Quotes"),
+        ],
+    },
+    "ratios": {
+        None: [
+            ("collect_all_ratios", "All Ratios"),
+            ("collect_custom_ratios", "Custom Ratios"),
+        ],
+        "Efficiency Ratios": [
+            ("collect_efficiency_ratios", "All Efficiency Ratios"),
+            ("get_asset_turnover_ratio", "Asset Turnover Ratio"),
+            ("get_inventory_turnover_ratio", "Inventory Turnover Ratio"),
+            ("get_days_of_inventory_outstanding", "Days of Inventory Outstanding"),
+            ("get_days_of_sales_outstanding", "Days of Sales Outstanding"),
+            ("get_operating_cycle", "Operating Cycle"),
+            (
+                "get_accounts_payables_turnover_ratio",
+                "Accounts Payables Turnover Ratio",
+            ),
+            (
+                "get_days_of_accounts_payable_outstanding",
+                "Days of Accounts Payable Outstanding",
+            ),
+            ("get_cash_conversion_cycle", "Cash Conversion Cycle"),
+            ("get_cash_conversion_efficiency", "Cash Conversion Efficiency"),
+            ("get_receivables_turnover", "Receivables Turnover"),
+            ("get_sga_to_revenue_ratio", "SGA to Revenue Ratio"),
+            ("get_fixed_asset_turnover", "Fixed Asset Turnover"),
+            ("get_operating_ratio", "Operating Ratio"),
+        ],
+        "Liquidity Ratios": [
+            ("collect_liquidity_ratios", "All Liquidity Ratios"),
+            ("get_current_ratio", "Current Ratio"),
+            ("get_quick_ratio", "Quick Ratio"),
+            ("get_cash_ratio", "Cash Ratio"),
+            ("get_working_capital", "Working Capital"),
+            ("get_operating_cash_flow_ratio", "Operating Cash Flow Ratio"),
+            ("get_operating_cash_flow_sales_ratio", "Operating Cash Flow Sales Ratio"),
+            ("get_short_term_coverage_ratio", "Short Term Coverage Ratio"),
+        ],
+        "Profitability Ratios": [
+            ("collect_profitability_ratios", "All Profitability Ratios"),
+            ("get_gross_margin", "Gross Margin"),
+            ("get_operating_margin", "Operating Margin"),
+            ("get_net_profit_margin", "Net Profit Margin"),
+            ("get_interest_burden_ratio", "Interest Burden Ratio"),
+            ("get_income_before_tax_profit_margin", "Income Before Tax Profit Margin"),
+            ("get_effective_tax_rate", "Effective Tax Rate"),
+            ("get_return_on_assets", "Return on Assets (RoA)"),
+            ("get_return_on_equity", "Return on Equity (RoE)"),
+            ("get_return_on_invested_capital", "Return on Invested Capital (RoIC)"),
+            ("get_income_quality_ratio", "Income Quality Ratio"),
+            ("get_return_on_tangible_assets", "Return on Tangible Assets (RoTA)"),
+            ("get_return_on_capital_employed", "Return on Capital Employed (RoCE)"),
+            ("get_net_income_per_ebt", "Net Income per EBT"),
+            (
+                "get_free_cash_flow_operating_cash_flow_ratio",
+                "Free Cash Flow Operating Cash Flow Ratio",
+            ),
+            ("get_tax_burden_ratio", "Tax Burden Ratio"),
+            ("get_ebt_to_ebit", "EBT to EBIT"),
+            ("get_ebit_to_revenue", "EBIT to Revenue"),
+        ],
+        "Solvency Ratios": [
+            ("collect_solvency_ratios", "All Solvency Ratios"),
+            ("get_debt_to_assets_ratio", "Debt to Assets Ratio"),
+            ("get_debt_to_equity_ratio", "Debt to Equity Ratio"),
+            ("get_interest_coverage_ratio", "Interest Coverage Ratio"),
+            ("get_equity_multiplier", "Equity Multiplier"),
+            ("get_debt_service_coverage_ratio", "Debt Service Coverage Ratio"),
+            ("get_free_cash_flow_yield", "Free Cash Flow Yield"),
+            ("get_net_debt_to_ebitda_ratio", "Net Debt to EBITDA Ratio"),
+            ("get_cash_flow_coverage_ratio", "Cash Flow Coverage Ratio"),
+            ("get_capex_coverage_ratio", "CAPEX Coverage Ratio"),
+            ("get_capex_dividend_coverage_ratio", "CAPEX Dividend Coverage Ratio"),
+        ],
+        "Valuation Ratios": [
+            ("collect_valuation_ratios", "All Valuation Ratios"),
+            ("get_earnings_per_share", "Earnings per Share (EPS)"),
+            ("get_revenue_per_share", "Revenue per Share (RPS)"),
+            ("get_price_earnings_ratio", "Price Earnings Ratio (PE)"),
+            (
+                "get_price_to_earnings_growth_ratio",
+                "Price to Earnings Growth Ratio (PEG)",
+            ),
+            ("get_book_value_per_share", "Book Value per Share"),
+            ("get_price_to_book_ratio", "Price to Book Ratio (PB)"),
+            ("get_interest_debt_per_share", "Interest Debt per Share"),
+            ("get_capex_per_share", "CAPEX per Share"),
+            ("get_dividend_yield", "Dividend Yield"),
+            ("get_weighted_dividend_yield", "Weighted Dividend Yield"),
+            ("get_price_to_cash_flow_ratio", "Price to Cash Flow Ratio (P/CF)"),
+            (
+                "get_price_to_free_cash_flow_ratio",
+                "Price to Free Cash Flow Ratio (P/FCF)",
+            ),
+            ("get_market_cap", "Market Capitalization"),
+            ("get_enterprise_value", "Enterprise Value"),
+            ("get_ev_to_sales_ratio", "EV to Sales Ratio"),
+            ("get_ev_to_ebitda_ratio", "EV to EBITDA  Ratio"),
+            ("get_ev_to_operating_cashflow_ratio", "EV to Operating Cashflow Ratio"),
+            ("get_earnings_yield", "Earnings Yield"),
+            ("get_dividend_payout_ratio", "Dividend Payout Ratio"),
+            ("get_reinvestment_rate", "Reinvestment Rate"),
+            ("get_tangible_asset_value", "Tangible Asset Value"),
+            ("get_net_current_asset_value", "Net Current Asset Value"),
+            ("get_ev_to_ebit", "EV to EBIT"),
+        ],
+    },
+    "models": {
+        "Models": [
+            ("get_dupont_analysis", "DuPont Analysis"),
+            ("get_extended_dupont_analysis", "Extended DuPont Analysis"),
+            ("get_enterprise_value_breakdown", "Enterprise Value Breakdown"),
+            (
+                "get_weighted_average_cost_of_capital",
+                "Weighted Average Cost of Capital (WACC)",
+            ),
+            ("get_intrinsic_valuation", "Intrinsic Valuation"),
+            ("get_gorden_growth_model", "Gorden Growth Model (GGM)"),
+            ("get_altman_z_score", "Altman Z-Score"),
+            ("get_piotroski_score", "Piotroski Score"),
+            (
+                "get_present_value_of_growth_opportunities",
+                "Present Value of Growth Opportunities (PVGO)",
+            ),
+        ],
+    },
+    "options": {
+        "Option Pricing": [
+            ("get_option_chains", "Option Chains"),
+            ("get_black_scholes_model", "Black Scholes Model"),
+            ("get_implied_volatility", "Implied Volatility"),
+            ("get_binomial_trees_model", "Binomial Model"),
+            ("get_stock_price_simulation", "Stock Price Simulation"),
+        ],
+        None: [
+            ("collect_all_greeks", "Collect All Greeks"),
+        ],
+        "First-Order Greeks": [
+            ("get_delta", "Delta"),
+            ("get_dual_delta", "Dual Delta"),
+            ("get_vega", "Vega"),
+            ("get_theta", "Theta"),
+            ("get_rho", "Rho"),
+            ("get_epsilon", "Epsilon"),
+            ("get_lambda", "Lambda"),
+        ],
+        "Second-Order Greeks": [
+            ("get_gamma", "Gamma"),
+            ("get_dual_gamma", "Dual Gamma"),
+            ("get_vanna", "Vanna"),
+            ("get_charm", "Charm"),
+            ("get_vomma", "Vomma"),
+            ("get_vera", "Vera"),
+            ("get_veta", "Veta"),
+            ("get_partial_derivative", "Partial Derivative"),
+        ],
+        "Third-Order Greeks": [
+            ("get_speed", "Speed"),
+            ("get_zomma", "Zomma"),
+            ("get_color", "Color"),
+            ("get_ultima", "Ultima"),
+        ],
+    },
+    "technicals": {
+        None: [
+            ("collect_all_indicators", "All Indicators"),
+        ],
+        "Breadth Indicators": [
+            ("collect_breadth_indicators", "All Breadth Indicators"),
+            ("get_mcclellan_oscillator", "McClellan Oscillator"),
+            ("get_advancers_decliners", "Advancers/Decliners Ratio"),
+            ("get_on_balance_volume", "On-Balance Volume (OBV)"),
+            (
+                "get_accumulation_distribution_line",
+                "Accumulation/Distribution Line (ADL)",
+            ),
+            ("get_chaikin_oscillator", "Chaikin Oscillator"),
+        ],
+        "Momentum Indicators": [
+            ("collect_momentum_indicators", "All Momentum Indicators"),
+            ("get_money_flow_index", "Money Flow Index"),
+            ("get_williams_percent_r", "Williams %R"),
+            ("get_aroon_indicator", "Aroon Indicator"),
+            ("get_commodity_channel_index", "Commodity Channel Index"),
+            ("get_relative_vigor_index", "Relative Vigor Index"),
+            ("get_force_index", "Force Index"),
+            ("get_ultimate_oscillator", "Ultimate Oscillator"),
+            ("get_percentage_price_oscillator", "Percentage Price Oscillator"),
+            ("get_detrended_price_oscillator", "Detrended Price Oscillator"),
+            ("get_average_directional_index", "Average Directional Index (ADX)"),
+            ("get_chande_momentum_oscillator", "Chande Momentum Oscillator (CMO)"),
+            ("get_ichimoku_cloud", "Ichimoku Cloud"),
+            ("get_stochastic_oscillator", "Stochastic Oscillator"),
+            (
+                "get_moving_average_convergence_divergence",
+                "Moving Average Convergence Divergence (MACD)",
+            ),
+            ("get_relative_strength_index", "Relative Strength Index (RSI)"),
+            ("get_balance_of_power", "Balance of Power (BOP)"),
+        ],
+        "Overlap Indicators": [
+            ("collect_overlap_indicators", "All Overlap Indicators"),
+            ("get_moving_average", "Simple Moving Average (SMA)"),
+            ("get_exponential_moving_average", "Exponential Moving Average (EMA)"),
+            (
+                "get_double_exponential_moving_average",
+                "Double Exponential Moving Average (DEMA)",
+            ),
+            ("get_trix", "Triple Exponential Moving Average (TRIX)"),
+            ("get_triangular_moving_average", "Triangular Moving Average (TMA)"),
+        ],
+        "Volatility Indicators": [
+            ("collect_volatility_indicators", "All Volatility Indicators"),
+            ("get_true_range", "True Range (TR)"),
+            ("get_average_true_range", "Average True Range (ATR)"),
+            ("get_keltner_channels", "Keltners Channels"),
+            ("get_bollinger_bands", "Bollinger Bands"),
+        ],
+    },
+    "risk": {
+        "Risk": [
+            ("get_value_at_risk", "Value at Risk (VaR)"),
+            ("get_conditional_value_at_risk", "Conditional Value at Risk (cVaR)"),
+            ("get_entropic_value_at_risk", "Entropic Value at Risk (eVaR)"),
+            ("get_maximum_drawdown", "Maximum Drawdown (MDD)"),
+            ("get_ulcer_index", "Ulcer Index (UI)"),
+            ("get_garch", "GARCH Volatilty Model"),
+            ("get_garch_forecast", "GARCH Volatilty Forecast"),
+            ("get_skewness", "Skewness"),
+            ("get_kurtosis", "Kurtosis"),
+        ],
+    },
+    "performance": {
+        "Performance": [
+            ("get_beta", "Beta"),
+            ("get_capital_asset_pricing_model", "Capital Asset Pricing Model (CAPM)"),
+            ("get_factor_asset_correlations", "Factor Asset Correlations"),
+            ("get_factor_correlations", "Factor Correlations"),
+            ("get_fama_and_french_model", "Fama and French Model (FF)"),
+            ("get_alpha", "Alpha"),
+            ("get_jensens_alpha", "Jensen's Alpha"),
+            ("get_treynor_ratio", "Treynor Ratio"),
+            ("get_sharpe_ratio", "Sharpe Ratio"),
+            ("get_sortino_ratio", "Sortino Ratio"),
+            ("get_ulcer_performance_index", "Ulcer Performance Index (UPI)"),
+            ("get_m2_ratio", "M2 Ratio"),
+            ("get_tracking_error", "Tracking Error"),
+            ("get_information_ratio", "Information Ratio"),
+            ("get_compound_growth_rate", "Compound Growth Rate"),
+        ],
+    },
+    "fixedincome": {
+        "Bond Valuations": [
+            ("collect_bond_statistics", "General Statistics"),
+            ("get_present_value", "Present Value"),
+            ("get_duration", "Duration Metrics"),
+            ("get_yield_to_maturity", "Yield to Maturity"),
+        ],
+        "Derivative Valuations": [
+            ("get_derivative_price", "Black Model"),
+            ("get_derivative_price", "Bachelier Model"),
+        ],
+        "Government Bonds": [
+            ("get_government_bond_yield", "3-Month Government Bond Yield"),
+            ("get_government_bond_yield", "10-Year Government Bond Yield"),
+        ],
+        "Corporate Bonds": [
+            ("get_ice_bofa_option_adjusted_spread", "Option Adjusted Spread (OAS)"),
+            ("get_ice_bofa_effective_yield", "Effective Yield"),
+            ("get_ice_bofa_total_return", "Total Return"),
+            ("get_ice_bofa_yield_to_worst", "Yield to Worst"),
+        ],
+        "Central Banks": [
+            ("get_euribor_rates", "Euro Interbank Offered Rate (Euribor)"),
+            ("get_federal_reserve_rates", "Secured Overnight Financing Rate (SOFR)"),
+            ("get_european_central_bank_rates", "Main Refinancing Operations (ECB)"),
+            ("get_european_central_bank_rates", "Marginal Lending Facility (ECB)"),
+            ("get_european_central_bank_rates", "Deposit Facility (ECB)"),
+            ("get_federal_reserve_rates", "Effective Federal Funds Rate (EFFR)"),
+            ("get_federal_reserve_rates", "Overnight Bank Funding Rate (OBFR)"),
+            ("get_federal_reserve_rates", "Tri-Party General Collateral Rate (TGCR)"),
+            ("get_federal_reserve_rates", "Broad General Collateral Rate (BGCR)"),
+        ],
+    },
+    "economics": {
+        "Economy": [
+            ("get_gross_domestic_product", "Gross Domestic Product (GDP)"),
+            ("get_gross_domestic_product_growth", "Gross Domestic Product Growth"),
+            ("get_gross_domestic_product_forecast", "Gross Domestic Product Forecast"),
+            ("get_consumer_confidence_index", "Consumer Confidence Index"),
+            ("get_business_confidence_index", "Business Confidence Index"),
+            ("get_house_prices", "House Prices"),
+            ("get_rent_prices", "Rent Prices"),
+            ("get_share_prices", "Share Prices"),
+        ],
+        "Finance": [
+            ("get_long_term_interest_rate", "Long Term Interest Rate"),
+            ("get_short_term_interest_rate", "Short Term Interest Rate"),
+            ("get_exchange_rates", "Exchange Rates"),
+            ("get_trust_in_government", "Trust in Government"),
+        ],
+        "Environment": [
+            ("get_renewable_energy", "Renewable Energy as % of Total Energy"),
+            ("get_carbon_footprint", "Carbon Footprint"),
+        ],
+        "Jobs & Society": [
+            ("get_unemployment_rate", "Unemployment Rates"),
+            ("get_labour_productivity", "Labour Productivity"),
+            ("get_income_inequality", "Income Inequality"),
+            ("get_population_statistics", "Population"),
+            ("get_poverty_rate", "Poverty Rate"),
+        ],
+    },
+}
+
+# Groups that link to a function or section of the page themselves
+NAVIGATION_GROUP_ANCHORS = {
+    "Finance Toolkit": "site-nav",
+    "First-Order Greeks": "collect_first_order_greeks",
+    "Second-Order Greeks": "collect_second_order_greeks",
+    "Third-Order Greeks": "collect_third_order_greeks",
+}
+
+HEADER_TEMPLATE = Template("""---
+title: $title
+excerpt: $excerpt
+description: $excerpt
 author_profile: false
-permalink: /projects/financetoolkit/docs/fixedincome
+permalink: $permalink
 classes: wide-sidebar
 layout: single
-redirect_from:
-    - /fixedincome
-sidebar:
-    nav: "financetoolkit-docs-fixedincome"
+${redirect_from}sidebar:
+    nav: "$sidebar"
 ---
 
-The Fixed Income module contains a wide variety of fixed income related calculations such as the Effective Yield, the Macaulay Duration, the Modified Duration Convexity, the Yield to Maturity and models such as Black and Bachelier to valuate derivative instruments such as Swaptions. 
+$introduction
 
 To install the FinanceToolkit it simply requires the following:
 
 {% include code_header.html %}
 {% highlight bash %}
-pip install financetoolkit -U
+pip install $requirement
 {% endhighlight %}
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, models, technicals, risk, performance and economics, please have a look below:
+${details}If you are looking for documentation regarding the $other_pages, please have a look below:
 
 <div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
+$buttons
 </div>
 
-{% include algolia.html %}
+{% include docs_search.html module="$name" shards="$shards" %}
 
-"""
+""")
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/fixedincome/fixedincome_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/fixedincome.md",
+BUTTON_TEMPLATE = Template(
+    '    <a href="$permalink" class="btn btn--$style" '
+    'style="flex: 1;font-size:10px;$margin">$label</a>'
 )
 
-# Create the Risk page
-markdown_content = """---
-title: Risk
-excerpt: The Risk module is meant to calculate important risk metrics such as Value at Risk (VaR), Conditional Value at Risk (cVaR), Maximum Drawdown, Correlations, GARCH, EWMA and more.
-description: The Risk module is meant to calculate important risk metrics such as Value at Risk (VaR), Conditional Value at Risk (cVaR), Maximum Drawdown, Correlations, GARCH, EWMA and more.
-author_profile: false
-permalink: /projects/financetoolkit/docs/risk
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /ratios
-sidebar:
-    nav: "financetoolkit-docs-risk"
----
-The Risk module is meant to calculate important risk metrics such as Value at Risk (VaR), Conditional Value at Risk (cVaR), Maximum Drawdown, Correlations, GARCH, EWMA and more.
-
-To install the FinanceToolkit it simply requires the following:
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+def create_header(page: Page, pages: list[Page] = PAGES) -> str:
+    if page.version:
+        pages = [other.versioned(page.version) for other in pages]
+
+    other_pages = [other.label.lower() for other in pages if other.name != page.name]
+    buttons = [
+        BUTTON_TEMPLATE.substitute(
+            permalink=other.permalink,
+            style="warning" if other.name == page.name else "info",
+            margin=" " if index == len(pages) - 1 else "margin-right:5px",
+            label=other.label,
+        )
+        for index, other in enumerate(pages)
+    ]
+
+    return HEADER_TEMPLATE.substitute(
+        title=page.title,
+        excerpt=page.excerpt,
+        permalink=page.permalink,
+        redirect_from=(
+            f"redirect_from:\n    - {page.redirect_from}\n"
+            if page.redirect_from
+            else ""
+        ),
+        sidebar=page.sidebar,
+        name=page.name,
+        # A versioned page documents that release (tags such as v2.0 drop the "v")
+        requirement=(
+            f"financetoolkit=={page.version.removeprefix('v')}"
+            if page.version
+            else "financetoolkit -U"
+        ),
+        shards=f"/{versioned_directory(SEARCH_DIRECTORY, page.version)}/shards.json",
+        introduction=page.introduction or page.excerpt,
+        details=f"{page.details}\n\n" if page.details else "",
+        other_pages=f"{', '.join(other_pages[:-1])} and {other_pages[-1]}",
+        buttons="\n".join(buttons),
+    )
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, models, technicals, fixed income, performance and economics, please have a look below:
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Generate the FinanceToolkit documentation pages."
+    )
+    parser.add_argument(
+        "--only",
+        type=lambda value: value.split(","),
+        help=f"Comma separated pages to build ({', '.join(page.name for page in PAGES)}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Number of files fetched and pages built at the same time.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="?",
+        const=os.cpu_count(),
+        default=0,
+        help="Parse and render the pages in this many processes instead of threads "
+        "(all cores when no number is given).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report which pages would change without writing anything.",
+    )
+    parser.add_argument(
+        "--source",
+        choices=["github", "archive", "local"],
+        default="github",
+        help="Where to read the controllers from.",
+    )
+    parser.add_argument(
+        "--location",
+        help="API URL (github), archive URL or path (archive) or checkout (local).",
+    )
+    parser.add_argument("--ref", help="Branch, tag or commit to document.")
+    parser.add_argument(
+        "--versions",
+        type=lambda value: value.split(","),
+        help="Comma separated release tags to document, each under its own permalink "
+        "(github or local).",
+    )
+    parser.add_argument("--cache-dir", default=".docs-cache")
+    parser.add_argument("--cache-max-size", type=int, default=50 * 1024 * 1024)
+    parser.add_argument(
+        "--render-cache-max-size",
+        type=int,
+        default=20 * 1024 * 1024,
+        help="Size of the cache of parsed and rendered functions (0 disables it).",
+    )
+    parser.add_argument(
+        "--cache-only",
+        action="store_true",
+        help="Only use cached responses, do not make any requests.",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("GITHUB_TOKEN"),
+        help="GitHub token for a higher rate limit (defaults to $GITHUB_TOKEN).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=10.0,
+        help="Maximum number of requests per second to the GitHub API.",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=5,
+        help="Number of retries when throttled or on server errors.",
+    )
+    parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=3600.0,
+        help="Longest time (in seconds) to wait for the rate limit to reset.",
+    )
+    parser.add_argument("--manifest", default=".docs-manifest.json")
+    parser.add_argument(
+        "--split",
+        choices=["function", "category"],
+        help="Split every module into a page per function or per category.",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzip (and brotli) compressed copies of the generated assets.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the controllers from disk (memory-mapped) and extract the "
+        "docstrings one at a time, for builds with little memory (github or local).",
+    )
+    parser.add_argument(
+        "--lazy-tables",
+        action="store_true",
+        help="Load the example result tables on demand instead of inlining them.",
+    )
+    parser.add_argument(
+        "--cross-link",
+        action="store_true",
+        help="Link the names of functions in descriptions and arguments to their pages.",
+    )
+    parser.add_argument(
+        "--highlight",
+        action="store_true",
+        help="Highlight the example code with Pygments instead of at every site build.",
+    )
+    parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="Report the links of the navigation and the generated pages that do not "
+        "resolve to a page or anchor of the site (fails the build).",
+    )
+    parser.add_argument(
+        "--size-budget",
+        type=int,
+        default=100,
+        help="Report generated files larger than this size (in KB).",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and rebuild a page whenever its controller changes "
+        "(requires --source local).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write the time spent in every stage and other metrics per page.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=".docs-profile",
+        help="Where to write the profile report.",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="PAGE",
+        help="Only build this page under cProfile and print the top functions.",
+    )
+    args = parser.parse_args(argv)
 
-{% include algolia.html %}
+    pages = PAGES
 
-"""
+    if args.only:
+        unknown = set(args.only).difference(page.name for page in PAGES)
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/risk/risk_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/risk.md",
-)
+        if unknown:
+            parser.error(f"unknown page(s): {', '.join(sorted(unknown))}")
 
-# Create the Performance page
-markdown_content = """---
-title: Performance
-excerpt: The Performance module is meant to calculate important performance metrics such as Sharpe Ratio, Sortino Ratio, Treynor Ratio, Information Ratio, Jensen's Alpha, Beta, Capital Asset Pricing Model, R-Squared and more.
-description: The Performance module is meant to calculate important performance metrics such as Sharpe Ratio, Sortino Ratio, Treynor Ratio, Information Ratio, Jensen's Alpha, Beta, Capital Asset Pricing Model, R-Squared and more.
-author_profile: false
-permalink: /projects/financetoolkit/docs/performance
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /ratios
-sidebar:
-    nav: "financetoolkit-docs-performance"
----
-The Performance module is meant to calculate important performance metrics such as Sharpe Ratio, Sortino Ratio, Treynor Ratio, Information Ratio, Jensen's Alpha, Beta, Capital Asset Pricing Model, R-Squared and more.
+        pages = [page for page in PAGES if page.name in args.only]
 
-To install the FinanceToolkit it simply requires the following:
+    if args.cprofile and args.cprofile not in [page.name for page in PAGES]:
+        parser.error(f"unknown page: {args.cprofile}")
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+    if args.watch and args.source != "local":
+        parser.error("--watch requires --source local")
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, models, technicals, fixed income, risk and economics, please have a look below:
+    if args.stream and args.source == "archive":
+        parser.error("--stream requires --source github or local")
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--warning" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--info" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+    if args.versions and (args.source == "archive" or args.watch):
+        parser.error("--versions requires --source github or local, without --watch")
 
-{% include algolia.html %}
+    if args.highlight and pygments is None:
+        parser.error("--highlight requires Pygments (pip install pygments)")
 
-"""
+    source = create_source(
+        source=args.source,
+        location=args.location,
+        ref=args.ref,
+        max_workers=args.jobs,
+        cache=ResponseCache(args.cache_dir, args.cache_max_size, args.cache_only),
+        scheduler=RequestScheduler(
+            rate=args.rate,
+            max_retries=args.max_retries,
+            max_wait=args.max_wait,
+            token=args.token,
+        ),
+        stream=args.stream,
+    )
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/performance/performance_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/performance.md",
-)
+    if args.cprofile:
+        page = next(page for page in PAGES if page.name == args.cprofile)
+        print(profile_page(page, source, args.profile_dir))
 
-# Create the Economics page
-markdown_content = """---
-title: Economics
-excerpt: The Economics module gives insights for 60+ countries into key economic indicators such as the Consumer Price Index (CPI), Gross Domestic Product (GDP), Unemployment Rates and 3-month and 10-year Government Interest Rates. This is done through the economics module and can be used as a standalone module as well.
-description: The Economics module gives insights for 60+ countries into key economic indicators such as the Consumer Price Index (CPI), Gross Domestic Product (GDP), Unemployment Rates and 3-month and 10-year Government Interest Rates. This is done through the economics module and can be used as a standalone module as well.
-author_profile: false
-permalink: /projects/financetoolkit/docs/economics
-classes: wide-sidebar
-layout: single
-redirect_from:
-    - /economics
-sidebar:
-    nav: "financetoolkit-docs-economics"
----
+        return
 
-The Economics module gives insights for 60+ countries into key economic indicators such as the Consumer Price Index (CPI), Gross Domestic Product (GDP), Unemployment Rates and 3-month and 10-year Government Interest Rates. This is done through the economics module and can be used as a standalone module as well.
+    render_cache = (
+        RenderCache(os.path.join(args.cache_dir, "render"), args.render_cache_max_size)
+        if args.render_cache_max_size
+        else None
+    )
 
-To install the FinanceToolkit it simply requires the following:
+    highlighter = (
+        CodeHighlighter(
+            DiskCache(os.path.join(args.cache_dir, "highlight"), 10 * 1024**2)
+        )
+        if args.highlight
+        else None
+    )
 
-{% include code_header.html %}
-{% highlight bash %}
-pip install financetoolkit -U
-{% endhighlight %}
+    if args.watch:
+        try:
+            watch_documentation(
+                pages,
+                source,
+                BuildManifest(args.manifest),
+                split=args.split,
+                compress=args.compress,
+                render_cache=render_cache,
+                lazy_tables=args.lazy_tables,
+                cross_link=args.cross_link,
+                highlighter=highlighter,
+            )
+        except KeyboardInterrupt:
+            pass
+
+        return
+
+    profile = BuildProfile()
+    options = dict(
+        manifest=BuildManifest(args.manifest),
+        max_workers=args.jobs,
+        dry_run=args.dry_run,
+        split=args.split,
+        compress=args.compress,
+        render_cache=render_cache,
+        lazy_tables=args.lazy_tables,
+        cross_link=args.cross_link,
+        highlighter=highlighter,
+        processes=args.processes,
+    )
 
-If you are looking for documentation regarding the toolkit, discovery, ratios, models, technicals, fixed income, risk and performance, please have a look below:
+    with profile.measure("", "build"):
+        if args.versions:
+            results = build_versions(pages, source, args.versions, profile, **options)
+        else:
+            results = build_documentation(pages, source, profile=profile, **options)
 
-<div style="display: flex; justify-content: space-between;" class="show-on-desktop">
-    <a href="/projects/financetoolkit/docs" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Toolkit</a>
-    <a href="/projects/financetoolkit/docs/discovery" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Discovery</a>
-    <a href="/projects/financetoolkit/docs/ratios" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Ratios</a>
-    <a href="/projects/financetoolkit/docs/models" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Models</a>
-    <a href="/projects/financetoolkit/docs/options" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Options</a>
-    <a href="/projects/financetoolkit/docs/technicals" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Technicals</a>
-    <a href="/projects/financetoolkit/docs/fixedincome" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Fixed Income</a>
-    <a href="/projects/financetoolkit/docs/risk" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Risk</a>
-    <a href="/projects/financetoolkit/docs/performance" class="btn btn--info" style="flex: 1;font-size:10px;margin-right:5px">Performance</a>
-    <a href="/projects/financetoolkit/docs/economics" class="btn btn--warning" style="flex: 1;font-size:10px; ">Economics</a>
-</div>
+    for name, result in results.items():
+        print(f"{name}: {result['status']}")
 
-{% include algolia.html %}
+    for line in report_size_budget(results, args.size_budget * 1024):
+        print(line)
 
-"""
+    if args.profile:
+        total = profile.report()["total"]
+        stages = ["fetch", "decode", "parse", "render", "write", "compress"]
 
-create_markdown_file(
-    file_url="https://api.github.com/repos/JerBouma/FinanceToolkit/contents/financetoolkit/economics/economics_controller.py",
-    header=markdown_content,
-    location="_pages/financetoolkit/documentation/economics.md",
-)
+        print(
+            f"Profile: build {total['build_time']:.3f}s, summed across workers: "
+            + ", ".join(
+                f"{stage} {total[f'{stage}_time']:.3f}s"
+                for stage in stages
+                if f"{stage}_time" in total
+            )
+            + f" ({int(total.get('functions', 0))} functions, "
+            f"{total.get('bytes_in', 0) / 1024:.0f} KB in, "
+            f"{total.get('bytes_out', 0) / 1024:.0f} KB out)"
+        )
+
+        write_profile_report(profile, pages, args.profile_dir)
+
+    if args.check_links:
+        locations = [
+            location
+            for result in results.values()
+            for location in result["outputs"]
+            if os.path.exists(location)
+        ]
+        report = validate_links(
+            [location for location in locations if location.endswith(".md")],
+            [NAVIGATION_LOCATION]
+            + [location for location in locations if location.endswith(".yml")],
+        )
+
+        for line in report:
+            print(f"Dangling link: {line}")
+
+        sys.exit(1 if report else 0)
+
+
+if __name__ == "__main__":
+    main()
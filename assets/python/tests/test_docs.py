@@ -0,0 +1,198 @@
+"""
+This file tests how the documentation generator (docs.py) talks to the GitHub API against a stand-in server on
+localhost, which answers with the responses queued by the test: the rate limit, server errors and conditional
+requests.
+"""
+
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docs  # noqa: E402
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        # Responses are queued per path, or otherwise for any path
+        path = self.path.split("?")[0]
+        responses = self.server.routes.get(path, self.server.responses)
+
+        with self.server.lock:
+            self.server.requests.append(dict(self.headers))
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+            status, headers, body = responses.pop(0)
+
+        # Long enough for concurrent requests to overlap
+        time.sleep(self.server.delay)
+
+        with self.server.lock:
+            self.server.active -= 1
+
+        self.send_response(status)
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.responses = []
+    server.routes = {}
+    server.requests = []
+    server.lock = threading.Lock()
+    server.active = server.max_active = 0
+    server.delay = 0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/contents/ratios.py"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def create_scheduler() -> docs.RequestScheduler:
+    return docs.RequestScheduler(
+        rate=100, burst=10, max_retries=3, backoff=0.01, max_wait=5, timeout=5
+    )
+
+
+def rate_limited() -> tuple[int, dict[str, str], bytes]:
+    return (
+        403,
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()))},
+        b'{"message": "API rate limit exceeded"}',
+    )
+
+
+def contents(text: str, etag: str) -> tuple[int, dict[str, str], bytes]:
+    body = {
+        "sha": docs.git_blob_sha(text),
+        "content": base64.b64encode(text.encode("utf-8")).decode("ascii"),
+    }
+
+    return (
+        200,
+        {"ETag": etag, "Content-Type": "application/json"},
+        json.dumps(body).encode("utf-8"),
+    )
+
+
+def test_scheduler_waits_for_the_rate_limit_and_retries_server_errors(server):
+    server.responses = [rate_limited(), (502, {}, b""), (200, {}, b"{}")]
+
+    start = time.monotonic()
+    response = create_scheduler().get(requests.Session(), server.url)
+
+    assert response.status_code == 200
+    assert len(server.requests) == 3
+    # The rate limit resets within the second, after which one more second is waited
+    assert time.monotonic() - start >= 0.9
+
+
+def test_scheduler_backs_off_on_a_malformed_retry_after(server):
+    server.responses = [(429, {"Retry-After": "soon"}, b""), (200, {}, b"{}")]
+
+    response = create_scheduler().get(requests.Session(), server.url)
+
+    assert response.status_code == 200
+    assert len(server.requests) == 2
+
+
+def test_scheduler_returns_the_last_response_when_it_keeps_failing(server):
+    server.responses = [(502, {}, b"")] * 4
+
+    response = create_scheduler().get(requests.Session(), server.url)
+
+    assert response.status_code == 502
+    assert len(server.requests) == 4
+
+
+def test_scheduler_does_not_retry_a_forbidden_request(server):
+    server.responses = [(403, {"X-RateLimit-Remaining": "42"}, b"")]
+
+    response = create_scheduler().get(requests.Session(), server.url)
+
+    assert response.status_code == 403
+    assert len(server.requests) == 1
+
+
+def test_fetch_file_content_revalidates_the_cache_with_the_etag(server, tmp_path):
+    cache = docs.ResponseCache(str(tmp_path))
+    profile = docs.BuildProfile()
+    server.responses = [
+        contents("class Ratios:\n    pass\n", '"first"'),
+        rate_limited(),
+        (502, {}, b""),
+        (304, {"ETag": '"first"'}, b""),
+    ]
+
+    first = docs.fetch_file_content(
+        server.url, cache=cache, profile=profile, scheduler=create_scheduler()
+    )
+    second = docs.fetch_file_content(
+        server.url, cache=cache, profile=profile, scheduler=create_scheduler()
+    )
+
+    assert first == second == "class Ratios:\n    pass\n"
+    assert "If-None-Match" not in server.requests[0]
+    assert all(headers["If-None-Match"] == '"first"' for headers in server.requests[1:])
+    assert profile.report()[server.url]["cache_hits"] == 1
+
+
+def test_fetch_file_content_fails_on_an_error_without_cache(server, tmp_path):
+    server.responses = [(404, {}, b'{"message": "Not Found"}')]
+
+    with pytest.raises(requests.HTTPError):
+        docs.fetch_file_content(
+            server.url,
+            cache=docs.ResponseCache(str(tmp_path)),
+            scheduler=create_scheduler(),
+        )
+
+
+def test_github_contents_source_fetches_the_files_concurrently(server, tmp_path):
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    paths = [page.path for page in docs.PAGES]
+    server.delay = 0.05
+    server.routes = {
+        f"/repos/JerBouma/FinanceToolkit/contents/{path}": [
+            contents(f"# {path}\n", f'"{index}"')
+        ]
+        for index, path in enumerate(paths)
+    }
+    # A server error for one of the files is retried while the others are fetched
+    server.routes[f"/repos/JerBouma/FinanceToolkit/contents/{paths[0]}"].insert(
+        0, (502, {}, b"")
+    )
+
+    source = docs.GitHubContentsSource(
+        base_url=base_url,
+        max_workers=4,
+        cache=docs.ResponseCache(str(tmp_path)),
+        scheduler=create_scheduler(),
+    )
+    file_contents = source.read_files(paths)
+
+    assert file_contents == {path: f"# {path}\n" for path in paths}
+    assert len(server.requests) == len(paths) + 1
+    assert server.max_active > 1